@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the LCU connection path against the fake LCU server: time to first
+connection, reconnect time after a client restart, and champ select event
+throughput through lcu_driver and the monitor's handlers.
+Run: python bench_lcu_connection.py
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import statistics
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.lcu_server import FakeLCUServer
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, CHAMP_SELECT_URI, GAMEFLOW_URI
+from simulation.monitor import RecordingTransmitter, create_monitor
+
+RECONNECTS = 10
+THROUGHPUT_EVENTS = 5000
+
+
+async def _wait_until(condition, timeout: float = 30.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("condition not reached")
+        await asyncio.sleep(0.001)
+
+
+async def run() -> int:
+    # Enter champ select, then a draft with a dense stream of timer updates (generated up front)
+    generated = ChampSelectGenerator(seed=1).draft(DraftScenario(timer_updates_per_second=20))
+    enter_champ_select = next(e for e in generated if e.uri == GAMEFLOW_URI and e.data == "ChampSelect")
+    events = [e for e in generated if e.uri == CHAMP_SELECT_URI and e.type == "Update"][:THROUGHPUT_EVENTS]
+
+    server = FakeLCUServer()
+    await server.start()
+
+    # Find the fake client by its lockfile, with a workspace configured regardless of local settings
+    with mock.patch("session_watcher.get_known_install_dirs", return_value=[server.install_dir]), \
+            mock.patch("config_manager.ConfigManager.get_workspace_id", return_value="simulated-workspace"), \
+            mock.patch("config_manager.ConfigManager.is_configured", return_value=True):
+        monitor = create_monitor(transmitter=RecordingTransmitter(record=False))
+
+        # Count champ select updates once the monitor has fully processed them
+        processed = 0
+        process = monitor._process_champ_select_data
+
+        async def counting_process(data):
+            nonlocal processed
+            await process(data)
+            processed += 1
+
+        monitor._process_champ_select_data = counting_process
+
+        try:
+            start = time.perf_counter()
+            monitor.start()
+            await _wait_until(lambda: monitor.is_connected and server.subscriber_count)
+            print(f"First connection:  {(time.perf_counter() - start) * 1000:8.1f} ms (includes the first watcher scan)")
+
+            reconnects = []
+            for _ in range(RECONNECTS):
+                connections = server.connections
+                start = time.perf_counter()
+                await server.restart()
+                await _wait_until(lambda: server.connections > connections and server.subscriber_count)
+                await _wait_until(lambda: monitor.is_connected)
+                reconnects.append((time.perf_counter() - start) * 1000)
+            print(f"Reconnect:         {statistics.median(reconnects):8.1f} ms median, "
+                  f"{max(reconnects):.1f} ms max over {RECONNECTS} client restarts")
+
+            await server.push(enter_champ_select)
+            await _wait_until(lambda: monitor.current_phase == "ChampSelect")
+            processed = 0
+
+            start = time.perf_counter()
+            await server.play(events)
+            sent = time.perf_counter() - start
+            await _wait_until(lambda: processed >= len(events))
+            elapsed = time.perf_counter() - start
+            print(f"Event throughput:  {len(events) / elapsed:8.0f} events/s "
+                  f"({len(events)} session updates, pushed in {sent * 1000:.0f} ms, processed in {elapsed * 1000:.0f} ms)")
+        finally:
+            await monitor.stop()
+            await server.stop()
+    return 0
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Memory soak test for long-running clients: thousands of generated champ
+selects (picks, swaps, dodges, bot games) run through a real LCUMonitor and
+DataTransmitter posting to the lcuDraft stand-in, with periodic reconnects.
+Between games it takes tracemalloc and RSS snapshots plus the sizes of the
+per-draft structures, and fails when memory grows faster than the per-lobby
+budget or a structure keeps growing across games.
+Run: python bench_memory_soak.py --games 3000 [--gui-log]
+"""
+
+import gc
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import psutil
+from simulation.champ_select import ChampSelectGenerator, ChampionPoolMapper
+from simulation.draft_endpoint import DraftEndpointStandIn, StandInClientConfig
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from data_transmitter import DataTransmitter
+from flight_recorder import FlightRecorder
+from lcu_monitor import LCUMonitor, MonitorState
+
+# The harness's own allocations (generated events, stand-in documents, samples) don't count
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, str(Path(__file__).parent / "src" / "simulation" / "*")),
+    tracemalloc.Filter(False, __file__),
+)
+
+# Structures that must be back to (near) empty between games
+PER_DRAFT_STRUCTURES = ("action_timestamps", "initial_picks", "action_events", "blocked_lobbies", "transmit_queue")
+
+
+@dataclass
+class Sample:
+    games: int
+    traced_bytes: int
+    rss_bytes: int
+    sizes: Dict[str, int]
+
+
+@dataclass
+class SoakResult:
+    samples: List[Sample] = field(default_factory=list)
+    top_growth: List[str] = field(default_factory=list)  # Allocation sites that grew most since the baseline
+    elapsed: float = 0.0
+
+    def growth_per_game(self, attribute: str) -> float:
+        """Least-squares slope of a sampled value over games played"""
+        points = [(s.games, getattr(s, attribute)) for s in self.samples]
+        if len(points) < 2:
+            return 0.0
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        spread = sum((x - mean_x) ** 2 for x, _ in points)
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread if spread else 0.0
+
+    def growing_structures(self) -> Dict[str, int]:
+        """
+        Per-draft structures must be empty between games; the others must not
+        stay above their first-half peak for the whole second half of the run.
+        """
+        last = self.samples[-1].sizes
+        growing = {name: size for name, size in last.items() if name in PER_DRAFT_STRUCTURES and size}
+        half = len(self.samples) // 2
+        for name in last:
+            if name in PER_DRAFT_STRUCTURES or not half:
+                continue
+            early = max(s.sizes.get(name, 0) for s in self.samples[:half])
+            late = min(s.sizes.get(name, 0) for s in self.samples[half:])
+            if late > early:
+                growing[name] = last[name]
+        return growing
+
+
+class _LogViewer:
+    """The GUI log path: QtLogHandler batches into a QPlainTextEdit capped like the main window's"""
+
+    def __init__(self, max_lines: int):
+        from PySide6.QtWidgets import QApplication, QPlainTextEdit
+        from gui.qt_logger import QtLogHandler
+
+        self.app = QApplication.instance() or QApplication([])
+        self.widget = QPlainTextEdit()
+        self.widget.setMaximumBlockCount(max_lines)
+        self.handler = QtLogHandler(capacity=max_lines)
+        self.handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        self.handler.signals.log_message.connect(self.widget.appendPlainText)
+
+        # Route logging only to the viewer; other handlers (console, pytest capture) would keep or print records
+        root = logging.getLogger()
+        self._saved = (root.handlers[:], root.level)
+        root.handlers = [self.handler]
+        root.setLevel(logging.INFO)
+
+    def flush(self) -> None:
+        self.handler.flush()
+        self.app.processEvents()
+
+    def close(self) -> None:
+        root = logging.getLogger()
+        root.handlers, level = self._saved
+        root.setLevel(level)
+
+    @property
+    def blocks(self) -> int:
+        return self.widget.blockCount()
+
+
+def _sizes(monitor: LCUMonitor, transmitter: DataTransmitter, log_viewer: Optional[_LogViewer]) -> Dict[str, int]:
+    sizes = {
+        "action_timestamps": len(monitor._action_timestamps),
+        "initial_picks": len(monitor._initial_picks),
+        "action_events": len(monitor._action_events),
+        "blocked_lobbies": len(transmitter._blocked_lobbies),
+        "transmit_queue": transmitter.get_queue_size(),
+        "asyncio_tasks": len(asyncio.all_tasks()),
+        "flight_recorder": len(monitor.recorder) if hasattr(monitor.recorder, "capacity") else 0,
+    }
+    if log_viewer:
+        sizes["log_lines"] = log_viewer.blocks
+    return sizes
+
+
+def _buffers_full(monitor: LCUMonitor) -> bool:
+    """Bounded buffers grow until they wrap; growth only counts once the flight recorder is full"""
+    capacity = getattr(monitor.recorder, "capacity", 0)
+    return not capacity or len(monitor.recorder) >= capacity
+
+
+def _traced_snapshot() -> tracemalloc.Snapshot:
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+
+
+def _snapshot(games: int, monitor, transmitter, log_viewer) -> Sample:
+    traced = sum(stat.size for stat in _traced_snapshot().statistics("filename"))
+    return Sample(games=games, traced_bytes=traced,
+                  rss_bytes=psutil.Process(os.getpid()).memory_info().rss,
+                  sizes=_sizes(monitor, transmitter, log_viewer))
+
+
+async def run_soak(games: int = 3000, warmup: int = 300, sample_every: int = 100, reconnect_every: int = 50,
+                   seed: int = 1, gui_log: bool = False, log_max_lines: int = 2000,
+                   recorder_capacity: Optional[int] = None) -> SoakResult:
+    """Play games through one monitor and transmitter, sampling memory once warmed up and buffers are full"""
+    endpoint = DraftEndpointStandIn(firestore_latency=0, seed=seed)
+    await endpoint.start()
+
+    config = StandInClientConfig(endpoint.url, batch_timeout_seconds=0.02, retry_attempts=0)
+    transmitter = DataTransmitter()
+    transmitter.config_manager = config
+    transmitter.min_interval = 0  # Spacing between batches only slows the soak down
+    monitor = create_monitor(transmitter=transmitter, champion_mapper=ChampionPoolMapper(), workspace_id=None)
+    monitor.config_manager = config
+    if recorder_capacity:
+        # A smaller ring than the global recorder's, so short runs reach steady state
+        monitor.recorder = transmitter.recorder = FlightRecorder(capacity=recorder_capacity)
+    lcu = SimulatedLCU()
+    lcu.attach(monitor)
+    log_viewer = _LogViewer(log_max_lines) if gui_log else None
+
+    result = SoakResult()
+    baseline = None
+    baseline_game = 0
+    traced_from: Optional[int] = None
+    fill_games = 0
+    played = 0
+    start = time.perf_counter()
+    try:
+        await lcu.connect()
+        was_idle = True
+        for event in ChampSelectGenerator(seed=seed).stream(games=games):
+            await lcu.dispatch(event)
+            idle = monitor.state == MonitorState.IDLE
+            if idle and not was_idle:
+                played += 1
+                # Games are minutes apart in practice; let the transmitter catch up
+                while transmitter.get_queue_size():
+                    await asyncio.sleep(0.001)
+                if log_viewer:
+                    log_viewer.flush()
+                if played % reconnect_every == 0:
+                    await lcu.disconnect()
+                    await lcu.connect()
+                if traced_from is None and played >= warmup and _buffers_full(monitor):
+                    # Tracing slows everything down, so it starts after the warmup. Records the ring
+                    # already holds are untraced, so wait until it has been overwritten once more.
+                    tracemalloc.start()
+                    traced_from, fill_games = played, played
+                elif baseline is None and traced_from is not None and played - traced_from >= fill_games:
+                    endpoint.forget()
+                    baseline = _traced_snapshot()
+                    baseline_game = played
+                if baseline is not None and (played - baseline_game) % sample_every == 0:
+                    await asyncio.sleep(0.05)  # Let the last request finish, so in-flight buffers don't count
+                    endpoint.forget()
+                    result.samples.append(_snapshot(played, monitor, transmitter, log_viewer))
+            was_idle = idle
+
+        if baseline is not None:
+            stats = _traced_snapshot().compare_to(baseline, "lineno")
+            result.top_growth = [str(stat) for stat in stats if stat.size_diff > 0][:10]
+    finally:
+        result.elapsed = time.perf_counter() - start
+        tracemalloc.stop()
+        # Let the worker send its last batch before the stand-in goes away
+        await transmitter.stop()
+        await asyncio.sleep(0.1)
+        if log_viewer:
+            log_viewer.close()
+        await endpoint.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak a monitor and transmitter with generated champ selects")
+    parser.add_argument("--games", type=int, default=3000, help="Champ selects to play")
+    parser.add_argument("--warmup", type=int, default=300,
+                        help="Minimum untraced games (the baseline also waits for the flight recorder to wrap)")
+    parser.add_argument("--sample-every", type=int, default=100, help="Games between memory snapshots")
+    parser.add_argument("--reconnect-every", type=int, default=50, help="Games between client reconnects")
+    parser.add_argument("--max-bytes-per-lobby", type=float, default=1024, help="Allowed traced growth per game")
+    parser.add_argument("--max-rss-per-lobby", type=float, default=4096, help="Allowed RSS growth per game")
+    parser.add_argument("--recorder-capacity", type=int, help="Use a flight recorder of this size instead of the global one")
+    parser.add_argument("--gui-log", action="store_true", help="Also feed the Qt log viewer (offscreen)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    if args.gui_log:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = asyncio.run(run_soak(args.games, args.warmup, args.sample_every, args.reconnect_every,
+                                  args.seed, args.gui_log, recorder_capacity=args.recorder_capacity))
+    if len(result.samples) < 2:
+        print("Not enough games after the warmup to measure growth")
+        return 1
+
+    print(f"Played {args.games} games in {result.elapsed:.1f} s")
+    print(f"{'games':>7} {'traced KB':>10} {'RSS MB':>8}  structures")
+    for sample in result.samples:
+        sizes = " ".join(f"{name}={size}" for name, size in sample.sizes.items())
+        print(f"{sample.games:>7} {sample.traced_bytes / 1024:>10.1f} {sample.rss_bytes / 1024 ** 2:>8.1f}  {sizes}")
+    print("\nLargest growth since the baseline:")
+    for line in result.top_growth:
+        print(f"  {line}")
+
+    traced = result.growth_per_game("traced_bytes")
+    rss = result.growth_per_game("rss_bytes")
+    growing = result.growing_structures()
+    print(f"\nGrowth per lobby: {traced:.0f} B traced (budget {args.max_bytes_per_lobby:.0f}), "
+          f"{rss:.0f} B RSS (budget {args.max_rss_per_lobby:.0f})")
+    failed = traced > args.max_bytes_per_lobby or rss > args.max_rss_per_lobby or growing
+    if growing:
+        print(f"Growing structures: {growing}")
+    print("❌ Memory is not bounded" if failed else "✅ Memory growth is bounded")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark draft serialization: to_dict() + json.dumps (previous path)
+versus DraftData.to_json_bytes() with cached event fragments.
+Run: python bench_serialization.py
+"""
+
+import sys
+import json
+import timeit
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models import DraftData, TeamData, ChampionEvent, epoch_ms
+from utils import json_codec
+
+ITERATIONS = 20000
+METADATA = {
+    "_timestamp": "2025-01-01T12:00:00.000000",
+    "_client_version": "1.0.0",
+    "_passwordHash": "a" * 64
+}
+
+
+def build_full_draft() -> DraftData:
+    """Build a completed tournament draft: 10 bans and 10 picks (20 actions)"""
+    champion_names = {cid: f"Champion{cid}" for cid in range(1, 200)}
+    now = epoch_ms()
+
+    def team(first_id: int) -> TeamData:
+        bans = list(range(first_id, first_id + 5))
+        picks = list(range(first_id + 5, first_id + 10))
+        return TeamData(
+            picks=picks,
+            bans=bans,
+            pick_events=[ChampionEvent(cid, i + 1, now + i * 1000) for i, cid in enumerate(picks)],
+            ban_events=[ChampionEvent(cid, i + 1, now + i * 1000) for i, cid in enumerate(bans)]
+        )
+
+    draft = DraftData(
+        lobby_id="1234567890",
+        workspace_id="workspace",
+        phase="FINALIZATION",
+        is_new_game=False,
+        blue_side=team(1),
+        red_side=team(100),
+        champion_names=champion_names
+    )
+    draft.update_hash()
+    return draft
+
+
+def previous_path(draft: DraftData) -> bytes:
+    """Build the full dict and let the JSON encoder walk it (what requests' json= does)"""
+    payload = draft.to_dict()
+    payload.update(METADATA)
+    return json.dumps(payload).encode("utf-8")
+
+
+def cached_path(draft: DraftData) -> bytes:
+    """Encode the body directly, reusing cached event fragments"""
+    return draft.to_json_bytes(METADATA)
+
+
+def main():
+    draft = build_full_draft()
+    assert json.loads(previous_path(draft)) == json.loads(cached_path(draft))
+
+    print(f"JSON backend: {json_codec.BACKEND}")
+    print(f"Draft: 20 actions, {ITERATIONS} serializations per run")
+
+    results = {}
+    for name, func in [("to_dict + json.dumps", previous_path), ("to_json_bytes (cached)", cached_path)]:
+        best = min(timeit.repeat(lambda: func(draft), number=ITERATIONS, repeat=5))
+        results[name] = best / ITERATIONS * 1e6
+        print(f"  {name:<24} {results[name]:8.2f} µs/draft  ({len(func(draft))} bytes)")
+
+    baseline, cached = results.values()
+    print(f"Speedup: {baseline / cached:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Load test the draft transmission path: hundreds of real LCUMonitor +
+DataTransmitter pairs (players and analysts sharing lobbies) replay seeded
+drafts and post them to a local stand-in for the lcuDraft function.
+Reports throughput, client-side latency percentiles per action, error and
+retry rates, the Firestore operations the function would have billed, and
+duplicate, redundant and resurrected document writes. Clients and stand-in
+share one process, so absolute latencies include GIL contention; compare runs
+with the same client count.
+Run: python bench_transmission_load.py --lobbies 40 --players 5 --analysts 2
+"""
+
+import sys
+import time
+import random
+import asyncio
+import logging
+import argparse
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import ChampSelectGenerator, ChampionPoolMapper, DraftScenario, GAMEFLOW_URI
+from simulation.draft_endpoint import DraftEndpointStandIn, StandInClientConfig
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from config_manager import get_config_manager
+from data_transmitter import DataTransmitter
+
+
+class LoadReport:
+    """Client-side request outcomes, collected from every transmitter's _post"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Counter = Counter()  # (action, status) -> count
+        self.retries = 0
+        self.last_finished = 0.0
+
+    def instrument(self, transmitter: DataTransmitter) -> None:
+        post = transmitter._post
+
+        async def timed_post(endpoint_url: str, body: bytes, action: str):
+            start = time.perf_counter()
+            try:
+                response = await post(endpoint_url, body, action)
+            except Exception as e:
+                self.statuses[(action, type(e).__name__)] += 1
+                raise
+            finally:
+                self.last_finished = time.perf_counter()
+                self.latencies[action].append(self.last_finished - start)
+            self.statuses[(action, response.status_code)] += 1
+            retry_history = getattr(getattr(response.raw, "retries", None), "history", None)
+            self.retries += len(retry_history or ())
+            return response
+
+        transmitter._post = timed_post
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(count for (_, status), count in self.statuses.items() if status != 200)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of unsorted samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _lobby_events(generator: ChampSelectGenerator, dodge: bool):
+    """One lobby's draft, cut off once the game starts (nothing is transmitted after that)"""
+    events = generator.draft(DraftScenario(dodge_after=generator.random.randint(4, 16) if dodge else None))
+    game_start = next((i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "GameStart"), None)
+    return events if game_start is None else events[:game_start + 1]
+
+
+def _start_in_thread(endpoint: DraftEndpointStandIn) -> asyncio.AbstractEventLoop:
+    """Serve the stand-in from its own loop, so client load doesn't inflate server timings"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="lcuDraft-stand-in", daemon=True).start()
+    asyncio.run_coroutine_threadsafe(endpoint.start(), loop).result()
+    return loop
+
+
+def _stop_in_thread(endpoint: DraftEndpointStandIn, loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.run_coroutine_threadsafe(endpoint.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+async def _run_client(lcu: SimulatedLCU, events, speed: float, delay: float) -> None:
+    await asyncio.sleep(delay)
+    await lcu.connect()
+    await lcu.play(events, speed=speed)
+
+
+async def run(args) -> int:
+    clients_per_lobby = args.players + args.analysts
+    total_clients = args.lobbies * clients_per_lobby
+    loop = asyncio.get_running_loop()
+    # DataTransmitter posts from the default executor; give every client its own worker
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max(4, total_clients)))
+
+    endpoint = DraftEndpointStandIn(firestore_latency=args.firestore_ms / 1000, failure_rate=args.failure_rate,
+                                    seed=args.seed)
+    server_loop = _start_in_thread(endpoint)
+
+    rng = random.Random(args.seed)
+    generator = ChampSelectGenerator(seed=args.seed)
+    report = LoadReport()
+    mapper = ChampionPoolMapper()
+    transmitters = []
+    runs = []
+    for _ in range(args.lobbies):
+        events = _lobby_events(generator, dodge=rng.random() < args.dodge_rate)
+        for _client in range(clients_per_lobby):
+            config = StandInClientConfig(endpoint.url, retry_attempts=args.retries,
+                                         retry_delay_seconds=args.retry_delay)
+            transmitter = DataTransmitter()
+            transmitter.config_manager = config
+            report.instrument(transmitter)
+
+            monitor = create_monitor(transmitter=transmitter, champion_mapper=mapper, workspace_id=None)
+            monitor.config_manager = config
+            lcu = SimulatedLCU()
+            lcu.attach(monitor)
+            transmitters.append(transmitter)
+            # Clients in a lobby see the same events, a few ms apart
+            runs.append(_run_client(lcu, events, args.speed, rng.uniform(0, args.skew_ms / 1000)))
+
+    print(f"Clients: {total_clients} ({args.lobbies} lobbies x {args.players} players + {args.analysts} analysts), "
+          f"speed {args.speed}x, Firestore op {args.firestore_ms} ms, failure rate {args.failure_rate:.0%}")
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*runs)
+        # Flush what is still queued, then let the workers send their last batches
+        await asyncio.gather(*(transmitter.stop() for transmitter in transmitters))
+        batch_timeout = get_config_manager().get_transmission_settings().get("batch_timeout_seconds", 1)
+        await asyncio.sleep(batch_timeout + 0.5)
+        elapsed = (report.last_finished or time.perf_counter()) - start
+    finally:
+        for transmitter in transmitters:
+            transmitter.is_running = False
+        _stop_in_thread(endpoint, server_loop)
+
+    requests_per_second = report.requests / elapsed if elapsed else 0.0
+    print(f"\nRequests:   {report.requests} in {elapsed:.1f} s ({requests_per_second:.1f} req/s)")
+    for action, samples in sorted(report.latencies.items()):
+        print(f"  {action:<8} n={len(samples):<6} p50 {percentile(samples, 0.50) * 1000:7.1f} ms  "
+              f"p95 {percentile(samples, 0.95) * 1000:7.1f} ms  p99 {percentile(samples, 0.99) * 1000:7.1f} ms  "
+              f"max {max(samples) * 1000:7.1f} ms")
+    error_rate = report.errors / report.requests if report.requests else 0.0
+    print(f"Errors:     {report.errors} ({error_rate:.2%}), {report.retries} automatic retries")
+    for (action, status), count in sorted(report.statuses.items(), key=lambda item: str(item[0])):
+        print(f"  {action:<8} {status}: {count}")
+
+    handler = endpoint.handler_seconds
+    print(f"Server:     p50 {percentile(handler, 0.50) * 1000:7.1f} ms  p95 {percentile(handler, 0.95) * 1000:7.1f} ms  "
+          f"p99 {percentile(handler, 0.99) * 1000:7.1f} ms in the function itself")
+
+    stats = endpoint.get_stats()
+    print(f"\nFirestore:  {stats['firestore_reads']} reads, {stats['firestore_writes']} writes, "
+          f"{stats['firestore_deletes']} deletes")
+    print(f"Documents:  {stats['documents']} stored for {args.lobbies} lobbies")
+    print(f"Duplicate documents:   {stats['duplicate_documents']}")
+    print(f"Redundant writes:      {stats['redundant_writes']}")
+    print(f"Resurrected documents: {stats['resurrected_documents']}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test draft transmission against a local lcuDraft stand-in")
+    parser.add_argument("--lobbies", type=int, default=40, help="Concurrent champ selects")
+    parser.add_argument("--players", type=int, default=5, help="Clients per lobby running as players")
+    parser.add_argument("--analysts", type=int, default=2, help="Extra clients per lobby watching the same draft")
+    parser.add_argument("--speed", type=float, default=60.0, help="Replay speed relative to real draft time")
+    parser.add_argument("--skew-ms", type=float, default=50.0, help="Max delay between clients of one lobby")
+    parser.add_argument("--dodge-rate", type=float, default=0.1, help="Fraction of lobbies that dodge")
+    parser.add_argument("--firestore-ms", type=float, default=20.0, help="Simulated latency per Firestore call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--retries", type=int, default=3, help="Client retry attempts (retry_attempts)")
+    parser.add_argument("--retry-delay", type=float, default=0.1, help="Client retry backoff (retry_delay_seconds)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
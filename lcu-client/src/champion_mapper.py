@@ -9,13 +9,6 @@ import logging
 from typing import Dict, Optional, List, Any
 from datetime import datetime, timedelta
 
-import requests
-
-try:
-    from .models import DraftData, TeamData
-except ImportError:
-    from models import DraftData, TeamData
-
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +33,8 @@ class ChampionMapper:
 
     def _get_latest_version(self) -> str:
         """Get the latest Riot API version"""
+        import requests
+
         try:
             response = requests.get(f"{self.RIOT_API_BASE}/api/versions.json", timeout=10)
             response.raise_for_status()
@@ -51,6 +46,8 @@ class ChampionMapper:
 
     def _load_champion_data(self, version: str) -> bool:
         """Load champion data from Riot API"""
+        import requests
+
         try:
             url = self.CHAMPION_DATA_URL.format(version=version)
             response = requests.get(url, timeout=15)
@@ -59,23 +56,23 @@ class ChampionMapper:
             data = response.json()
             champions = data.get('data', {})
 
-            # Clear existing maps
-            self.champion_map.clear()
-            self.reverse_map.clear()
-
-            # Build mappings
+            # Build new mappings and swap them in at once: drafts being serialized on other
+            # threads keep the complete map they already hold instead of a half-filled one
+            champion_map: Dict[int, str] = {}
+            reverse_map: Dict[str, int] = {}
             for champ_key, champ_data in champions.items():
                 try:
                     champ_id = int(champ_data['key'])
                     champ_name = champ_data['id']
 
-                    self.champion_map[champ_id] = champ_name
-                    self.reverse_map[champ_name] = champ_id
+                    champion_map[champ_id] = champ_name
+                    reverse_map[champ_name] = champ_id
 
                 except (ValueError, KeyError) as e:
                     logger.warning(f"Invalid champion data for {champ_key}: {e}")
                     continue
 
+            self.champion_map, self.reverse_map = champion_map, reverse_map
             self.last_updated = datetime.now()
             self.current_version = version
 
@@ -149,110 +146,15 @@ class ChampionMapper:
 
         return ids
 
-    def _convert_ids_to_names_with_none(self, id_list: List[str]) -> List[str]:
-        """Convert champion IDs to names, preserving 'None' placeholders"""
-        result = []
-        for item in id_list:
-            if not item or item == '0':
-                continue
-            if item == "None":
-                # Preserve "None" as-is (represents no ban)
-                result.append("None")
-            else:
-                try:
-                    champ_id = int(item)
-                    name = self.get_champion_name(champ_id)
-                    if name:
-                        result.append(name)
-                except (ValueError, TypeError):
-                    # If it's already a name (not an ID), keep it
-                    result.append(item)
-        return result
-
-    def update_draft_with_names(self, draft: DraftData) -> bool:
-        """Update a draft object to use champion names instead of IDs"""
-        try:
-            logger.debug(f"[CHAMP_MAP] Converting draft for lobby {draft.lobby_id}")
-            
-            # Update blue side
-            if draft.blue_side:
-                # Convert picks
-                pick_ids = [int(pid) for pid in draft.blue_side.picks if pid and pid != '0' and pid != 'None']
-                logger.debug(f"[CHAMP_MAP] Blue picks (IDs): {pick_ids}")
-                draft.blue_side.picks = self.map_champion_ids_to_names(pick_ids)
-                logger.debug(f"[CHAMP_MAP] Blue picks (names): {draft.blue_side.picks}")
-
-                # Convert bans - preserve "None" placeholders for empty bans
-                logger.debug(f"[CHAMP_MAP] Blue bans (raw): {draft.blue_side.bans}")
-                draft.blue_side.bans = self._convert_ids_to_names_with_none(draft.blue_side.bans)
-                logger.debug(f"[CHAMP_MAP] Blue bans (names): {draft.blue_side.bans}")
-
-                # Update pick events with champion names
-                for event in draft.blue_side.pick_events:
-                    if event.champion_id and event.champion_id != "None":
-                        try:
-                            champ_id = int(event.champion_id)
-                            name = self.get_champion_name(champ_id)
-                            if name:
-                                logger.debug(f"[CHAMP_MAP] Blue pick event: {event.champion_id} -> {name}")
-                                event.champion_id = name
-                        except (ValueError, TypeError):
-                            pass
-
-                # Update ban events with champion names - preserve "None" for empty bans
-                for event in draft.blue_side.ban_events:
-                    if event.champion_id and event.champion_id != "None":
-                        try:
-                            champ_id = int(event.champion_id)
-                            name = self.get_champion_name(champ_id)
-                            if name:
-                                logger.debug(f"[CHAMP_MAP] Blue ban event: {event.champion_id} -> {name}")
-                                event.champion_id = name
-                        except (ValueError, TypeError):
-                            pass
-
-            # Update red side
-            if draft.red_side:
-                # Convert picks
-                pick_ids = [int(pid) for pid in draft.red_side.picks if pid and pid != '0' and pid != 'None']
-                logger.debug(f"[CHAMP_MAP] Red picks (IDs): {pick_ids}")
-                draft.red_side.picks = self.map_champion_ids_to_names(pick_ids)
-                logger.debug(f"[CHAMP_MAP] Red picks (names): {draft.red_side.picks}")
-
-                # Convert bans - preserve "None" placeholders for empty bans
-                logger.debug(f"[CHAMP_MAP] Red bans (raw): {draft.red_side.bans}")
-                draft.red_side.bans = self._convert_ids_to_names_with_none(draft.red_side.bans)
-                logger.debug(f"[CHAMP_MAP] Red bans (names): {draft.red_side.bans}")
-
-                # Update pick events with champion names
-                for event in draft.red_side.pick_events:
-                    if event.champion_id and event.champion_id != "None":
-                        try:
-                            champ_id = int(event.champion_id)
-                            name = self.get_champion_name(champ_id)
-                            if name:
-                                logger.debug(f"[CHAMP_MAP] Red pick event: {event.champion_id} -> {name}")
-                                event.champion_id = name
-                        except (ValueError, TypeError):
-                            pass
-
-                # Update ban events with champion names - preserve "None" for empty bans
-                for event in draft.red_side.ban_events:
-                    if event.champion_id and event.champion_id != "None":
-                        try:
-                            champ_id = int(event.champion_id)
-                            name = self.get_champion_name(champ_id)
-                            if name:
-                                logger.debug(f"[CHAMP_MAP] Red ban event: {event.champion_id} -> {name}")
-                                event.champion_id = name
-                        except (ValueError, TypeError):
-                            pass
-
-            return True
-
-        except Exception as e:
-            logger.error(f"[CHAMP_MAP] Failed to update draft with champion names: {e}")
-            return False
+    def get_name_map(self) -> Dict[int, str]:
+        """
+        Get the live ID -> name mapping used to serialize drafts.
+        Returns the internal dict (not a copy) so drafts can share it without allocation;
+        it is never modified once loaded, a refresh replaces it.
+        """
+        if not self._ensure_data_loaded():
+            return {}
+        return self.champion_map
 
     def get_all_champions(self) -> Dict[int, str]:
         """Get all champions as ID -> name mapping"""
@@ -265,9 +167,13 @@ class ChampionMapper:
         return len(self.champion_map)
 
 
-# Global instance
-_champion_mapper = ChampionMapper()
+# Global instance, created on first use
+_champion_mapper: Optional[ChampionMapper] = None
+
 
 def get_champion_mapper() -> ChampionMapper:
     """Get the global champion mapper instance"""
+    global _champion_mapper
+    if _champion_mapper is None:
+        _champion_mapper = ChampionMapper()
     return _champion_mapper
@@ -9,7 +9,6 @@ import logging
 import hashlib
 import getpass
 import time
-import requests
 from typing import Dict, Optional, Any, Tuple
 from pathlib import Path
 
@@ -98,7 +97,10 @@ class ConfigManager:
                 "auto_detect_client": True,
                 "preferred_port": 21076,
                 "use_tournament_client": False,
-                "connection_timeout": 30
+                "connection_timeout": 30,
+                "install_directories": [],
+                "session_poll_interval": 1,
+                "process_scan_interval": 5
             },
             "transmission": {
                 "endpoint_url": "https://fearless-tuls.netlify.app/.netlify/functions/lcuDraft",
@@ -111,17 +113,72 @@ class ConfigManager:
                 "champ_select_interval": 1,
                 "lobby_interval": 10,
                 "active_game_interval": 60,
-                "enable_change_detection": True
+                "enable_change_detection": True,
+                "worker_thread": False,
+                "loop_lag_threshold_ms": 100,
+                "rest_polling": True,
+                "reconcile_interval": 5
+            },
+            "metrics": {
+                "enabled": False,
+                "http_enabled": False,
+                "http_host": "127.0.0.1",
+                "http_port": 9464
+            },
+            "tracing": {
+                "enabled": False,
+                "sample_rate": 1.0,
+                "max_events": 50000,
+                "export_on_exit": True,
+                "output_dir": "traces"
+            },
+            "profiling": {
+                "sample_interval_ms": 5,
+                "tracemalloc_frames": 10,
+                "output_dir": "profiles"
+            },
+            "flight_recorder": {
+                "enabled": True,
+                "capacity": 20000,
+                "window_minutes": 10,
+                "output_dir": "diagnostics",
+                "dump_on_error": True,
+                "min_dump_interval_seconds": 60
+            },
+            "low_footprint": {
+                "enabled": True,
+                "lower_priority": True,
+                "lower_io_priority": True,
+                "freeze_gc": True,
+                "pause_background": True
+            },
+            "checkpoint": {
+                "enabled": True,
+                "path": "state/draft_checkpoint.json",
+                "max_age_minutes": 30
+            },
+            "live_server": {
+                "enabled": False,
+                "host": "0.0.0.0",
+                "port": 8765,
+                "max_viewers": 200
             },
             "logging": {
                 "level": "INFO",
                 "file_logging": False,
-                "log_file": "lcu_client.log"
+                "log_file": "lcu_client.log",
+                "json_format": False,
+                "max_bytes": 5242880,
+                "backup_count": 5,
+                "rotate_hours": 24,
+                "compress_rotated": True
             },
             "ui": {
                 "minimize_to_tray": True,
                 "show_notifications": True,
-                "start_minimized": False
+                "start_minimized": False,
+                "log_max_lines": 2000,
+                "log_flush_interval_ms": 100
             }
         }
 
@@ -321,6 +378,9 @@ class ConfigManager:
         # Record the attempt
         self._record_auth_attempt()
 
+        # Deferred so importing the config doesn't pull in the HTTP stack
+        import requests
+
         try:
             transmission_settings = self.get_transmission_settings()
             endpoint_url = transmission_settings.get("endpoint_url")
@@ -430,9 +490,13 @@ class ConfigManager:
         return workspace_id == saved_id and self._hash_password(password) == saved_hash
 
 
-# Global instance
-_config_manager = ConfigManager()
+# Global instance, created on first use
+_config_manager: Optional[ConfigManager] = None
+
 
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance"""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
     return _config_manager
@@ -6,19 +6,26 @@ Handles batching, retries, and rate limiting.
 import asyncio
 import logging
 import time
-from typing import List, Dict, Any, Optional, Set
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set
 from datetime import datetime, timedelta
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+if TYPE_CHECKING:
+    import requests
 
 try:
     from .models import DraftData, TransmissionBatch
     from .config_manager import get_config_manager
+    from .metrics import get_metrics
+    from .tracing import get_tracer, traced
+    from .flight_recorder import get_flight_recorder
+    from .utils import json_codec
 except ImportError:
     from models import DraftData, TransmissionBatch
     from config_manager import get_config_manager
+    from metrics import get_metrics
+    from tracing import get_tracer, traced
+    from flight_recorder import get_flight_recorder
+    from utils import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +35,48 @@ class DataTransmitter:
 
     def __init__(self):
         self.config_manager = get_config_manager()
-        self.session = self._create_session()
+        self._session: Optional["requests.Session"] = None  # Created on first transmission
         self.is_running = False
         self.transmission_queue = None  # Defer creation until start()
         self.last_transmission_time = 0
         self.min_interval = 0.1  # Minimum 100ms between transmissions
         self._blocked_lobbies: Set[str] = set()  # Lobbies that were cancelled
 
-    def _create_session(self) -> requests.Session:
+        # Hot-path metrics (no-ops unless metrics.enabled)
+        self.metrics = get_metrics()
+        self.metrics.gauge("lcu_client_transmit_queue_depth", "Drafts waiting to be transmitted", read=self.get_queue_size)
+        self._m_queued = self.metrics.counter("lcu_client_drafts_queued_total", "Drafts queued for transmission")
+        self._m_superseded = self.metrics.counter(
+            "lcu_client_drafts_superseded_total", "Drafts sent in a batch that also held a newer draft for the same lobby")
+        self._m_filtered = self.metrics.counter(
+            "lcu_client_drafts_filtered_total", "Queued drafts dropped because their lobby was cancelled")
+        self._m_requests = self.metrics.counter(
+            "lcu_client_transmit_requests_total", "Requests to the draft endpoint by outcome", "result")
+        self._m_latency = self.metrics.histogram(
+            "lcu_client_transmit_seconds", "Draft endpoint request latency including retries", "action")
+        self._m_retries = self.metrics.counter("lcu_client_transmit_retries_total", "Automatic HTTP retries")
+        self._m_bytes = self.metrics.counter("lcu_client_transmit_bytes_total", "Request body bytes sent")
+        self.tracer = get_tracer()
+
+        # Queue and transmit outcomes, dumped with the monitor's events when an error is logged
+        self.recorder = get_flight_recorder()
+        recorder_settings = self.config_manager.get_settings().get("flight_recorder", {})
+        if recorder_settings.get("dump_on_error", True):
+            self.recorder.dump_on_error(logger, recorder_settings.get("min_dump_interval_seconds", 60))
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session, created on first use so startup doesn't pay for the HTTP stack"""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "requests.Session":
         """Create HTTP session with retry configuration"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         session = requests.Session()
 
         transmission_settings = self.config_manager.get_transmission_settings()
@@ -69,12 +109,24 @@ class DataTransmitter:
         # Start transmission worker
         asyncio.create_task(self._transmission_worker())
 
+    async def warm_up(self):
+        """Create the HTTP session and open a keep-alive connection to the endpoint before the first draft"""
+        endpoint_url = self.config_manager.get_transmission_settings().get("endpoint_url")
+        if not endpoint_url:
+            return
+        loop = asyncio.get_event_loop()
+        try:
+            # CORS preflight: answered by the function without touching Firestore
+            await loop.run_in_executor(None, lambda: self.session.options(endpoint_url, timeout=5))
+        except Exception as e:
+            logger.debug(f"Transmitter warm-up failed: {e}")
+
     async def stop(self):
         """Stop the transmission service"""
         self.is_running = False
 
         # Process remaining items in queue
-        if not self.transmission_queue.empty():
+        if self.transmission_queue and not self.transmission_queue.empty():
             await self._process_batch_transmission()
 
         logger.info("Data transmitter stopped")
@@ -91,12 +143,14 @@ class DataTransmitter:
             return False
         return True
 
+    @traced("queue_draft_data")
     async def queue_draft_data(self, draft_data: DraftData) -> bool:
         """Queue draft data for transmission"""
         logger.debug(f"[QUEUE] Attempting to queue draft for lobby {draft_data.lobby_id}")
         
         if not self.is_running:
             logger.warning("[QUEUE_FAIL] Transmitter not running, cannot queue data")
+            self.recorder.record("queue_fail", "transmitter not running (lobby %s)", draft_data.lobby_id)
             return False
 
         # CRITICAL FIX: Validate draft data before queuing
@@ -113,8 +167,11 @@ class DataTransmitter:
 
         try:
             await self.transmission_queue.put(draft_data)
+            self._m_queued.inc()
+            self.tracer.mark_queued(draft_data.trace)
             queue_size = self.transmission_queue.qsize()
             logger.debug(f"[QUEUE_SUCCESS] Draft queued for lobby {draft_data.lobby_id}. Queue size: {queue_size}")
+            self.recorder.record("queue", "lobby %s queued, queue size %d", draft_data.lobby_id, queue_size)
             return True
         except Exception as e:
             logger.error(f"[QUEUE_FAIL] Failed to queue draft data: {e}")
@@ -173,12 +230,22 @@ class DataTransmitter:
         # CRITICAL FIX: Filter out blocked lobbies before transmitting
         # This prevents race conditions where data was queued before cancellation
         original_count = len(batch.items)
+        for item in batch.items:
+            if item.lobby_id in self._blocked_lobbies:
+                self.tracer.finish(item.trace, outcome="filtered")
         batch.items = [item for item in batch.items if item.lobby_id not in self._blocked_lobbies]
         filtered_count = original_count - len(batch.items)
         
         if filtered_count > 0:
+            self._m_filtered.inc(filtered_count)
+            self.recorder.record("filtered", "%d draft(s) dropped for blocked lobbies", filtered_count)
             logger.debug(f"Filtered out {filtered_count} item(s) for blocked lobbies")
 
+        # Each draft carries the full state, so earlier drafts for a lobby are superseded by later ones
+        superseded = len(batch.items) - len({item.lobby_id for item in batch.items})
+        if superseded > 0:
+            self._m_superseded.inc(superseded)
+
         if batch.is_empty():
             return True
 
@@ -215,13 +282,47 @@ class DataTransmitter:
         success_count = 0
 
         for draft in drafts:
-            if await self._transmit_single_draft(draft, endpoint_url):
+            # Queue and batching time, then the request itself, attributed to the draft's trace
+            self.tracer.record_queue_wait(draft.trace)
+            with self.tracer.span("transmit_single_draft", trace=draft.trace, batch_size=len(drafts)):
+                success = await self._transmit_single_draft(draft, endpoint_url)
+            self.tracer.finish(draft.trace, outcome="sent" if success else "failed")
+            self.recorder.record("transmit", "lobby %s hash %s: %s", draft.lobby_id, draft.data_hash,
+                                 "sent" if success else "failed")
+
+            if success:
                 success_count += 1
             else:
                 logger.warning(f"Failed to transmit draft for lobby {draft.lobby_id}")
 
         return success_count == len(drafts)
 
+    async def _post(self, endpoint_url: str, body: bytes, action: str):
+        """POST a JSON body from a worker thread, recording latency, bytes sent and retries"""
+        start = time.perf_counter()
+        try:
+            response = await asyncio.get_event_loop().run_in_executor(
+                None,
+                lambda: self.session.post(
+                    endpoint_url,
+                    data=body,
+                    timeout=30,
+                    headers={
+                        'Content-Type': 'application/json',
+                        'User-Agent': 'LCU-Client/1.0.0'
+                    }
+                )
+            )
+        finally:
+            self._m_latency.observe(time.perf_counter() - start, action)
+        self._m_bytes.inc(len(body))
+
+        # urllib3 records the retries it made on the response
+        retry_history = getattr(getattr(response.raw, "retries", None), "history", None)
+        if retry_history:
+            self._m_retries.inc(len(retry_history))
+        return response
+
     async def _transmit_single_draft(self, draft: DraftData, endpoint_url: str) -> bool:
         """Transmit a single draft to the endpoint"""
         # Check if this lobby was blocked (cancelled)
@@ -229,48 +330,49 @@ class DataTransmitter:
             logger.debug(f"Skipping transmission for blocked lobby {draft.lobby_id}")
             return False
 
-        try:
-            payload = draft.to_dict()
+        from requests.exceptions import RequestException
 
+        try:
             # Add transmission metadata
-            payload["_timestamp"] = datetime.now().isoformat()
-            payload["_client_version"] = "1.0.0"
+            metadata = {
+                "_timestamp": datetime.now().isoformat(),
+                "_client_version": "1.0.0"
+            }
 
             # Add workspace password hash for authentication
             password_hash = self.config_manager.get_password_hash()
             if password_hash:
-                payload["_passwordHash"] = password_hash
+                metadata["_passwordHash"] = password_hash
+
+            # Encode the body once; event fragments are cached on the draft's events
+            with self.tracer.span("serialize_draft"):
+                body = draft.to_json_bytes(metadata)
 
             # Make request
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.session.post(
-                    endpoint_url,
-                    json=payload,
-                    timeout=30,
-                    headers={
-                        'Content-Type': 'application/json',
-                        'User-Agent': 'LCU-Client/1.0.0'
-                    }
-                )
-            )
+            with self.tracer.span("http_post", bytes=len(body)):
+                response = await self._post(endpoint_url, body, "draft")
 
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get("success"):
+                    self._m_requests.inc(label="success")
                     logger.debug(f"Successfully transmitted draft for lobby {draft.lobby_id}")
                     return True
                 else:
+                    self._m_requests.inc(label="rejected")
                     logger.warning(f"Server rejected draft for lobby {draft.lobby_id}: {response_data}")
                     return False
             else:
+                self._m_requests.inc(label="http_error")
                 logger.warning(f"HTTP {response.status_code} transmitting draft for lobby {draft.lobby_id}")
                 return False
 
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
+            self._m_requests.inc(label="network_error")
             logger.error(f"Network error transmitting draft for lobby {draft.lobby_id}: {e}")
             return False
         except Exception as e:
+            self._m_requests.inc(label="error")
             logger.error(f"Unexpected error transmitting draft for lobby {draft.lobby_id}: {e}")
             return False
 
@@ -291,6 +393,7 @@ class DataTransmitter:
             try:
                 item = self.transmission_queue.get_nowait()
                 if item.lobby_id == lobby_id:
+                    self.tracer.finish(item.trace, outcome="cancelled")
                     cleared += 1
                 else:
                     temp_items.append(item)
@@ -302,6 +405,7 @@ class DataTransmitter:
             await self.transmission_queue.put(item)
 
         if cleared > 0:
+            self._m_filtered.inc(cleared)
             logger.info(f"Cleared {cleared} pending transmission(s) for lobby {lobby_id}")
 
         return cleared
@@ -341,51 +445,53 @@ class DataTransmitter:
                 "_client_version": "1.0.0"
             }
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.session.post(
-                    endpoint_url,
-                    json=payload,
-                    timeout=30,
-                    headers={
-                        'Content-Type': 'application/json',
-                        'User-Agent': 'LCU-Client/1.0.0'
-                    }
-                )
-            )
+            body = json_codec.dumps(payload)
+
+            response = await self._post(endpoint_url, body, "delete")
 
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get("success"):
+                    self._m_requests.inc(label="success")
                     logger.info(f"Successfully sent deletion request for lobby {lobby_id}")
                     return True
                 else:
+                    self._m_requests.inc(label="rejected")
                     logger.warning(f"Server rejected deletion for lobby {lobby_id}: {response_data}")
                     return False
             else:
+                self._m_requests.inc(label="http_error")
                 logger.warning(f"HTTP {response.status_code} sending deletion for lobby {lobby_id}")
                 return False
 
         except Exception as e:
+            self._m_requests.inc(label="error")
             logger.error(f"Error sending deletion request for lobby {lobby_id}: {e}")
             return False
 
     def get_queue_size(self) -> int:
         """Get current queue size"""
-        return self.transmission_queue.qsize()
+        return self.transmission_queue.qsize() if self.transmission_queue else 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get transmission statistics"""
-        return {
+        stats = {
             "queue_size": self.get_queue_size(),
             "is_running": self.is_running,
             "last_transmission": self.last_transmission_time
         }
+        if self.metrics.enabled:
+            stats["metrics"] = self.metrics.snapshot(("lcu_client_transmit_", "lcu_client_drafts_"))
+        return stats
+
 
+# Global instance, created on first use
+_data_transmitter: Optional[DataTransmitter] = None
 
-# Global instance
-_data_transmitter = DataTransmitter()
 
 def get_data_transmitter() -> DataTransmitter:
     """Get the global data transmitter instance"""
+    global _data_transmitter
+    if _data_transmitter is None:
+        _data_transmitter = DataTransmitter()
     return _data_transmitter
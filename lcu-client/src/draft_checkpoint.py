@@ -0,0 +1,129 @@
+"""
+Checkpoint of the draft being monitored, so a restart mid-draft resumes it.
+The monitor saves the lobby ID, first-seen action timestamps, initial picks and
+the last queued picks and bans after every change. On the next connection, if
+the client is still in champ select for the same game, it restores them. The
+draft then continues as an update of the existing document instead of a new
+game, which would make lcuDraft count the collection, allocate a new ID and
+restamp every earlier pick. Saving is coalesced on a worker thread: a burst
+of changes costs one small atomic file write.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from .config_manager import get_config_manager
+except ImportError:
+    from config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+VERSION = 2  # 2: action timestamps in epoch ms
+_DELETE = object()  # Pending "remove the file" marker, ordered with pending writes
+
+
+class DraftCheckpoint:
+    """One JSON file holding the state of the current draft (no-op without a path)"""
+
+    def __init__(self, path: Optional[Path], max_age_seconds: float = 1800):
+        self.path = Path(path) if path else None
+        self.max_age_seconds = max_age_seconds  # Older checkpoints can't be the same champ select
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: Any = None
+        self._writing = False
+
+    @classmethod
+    def from_settings(cls) -> "DraftCheckpoint":
+        config_manager = get_config_manager()
+        settings = config_manager.get_settings().get("checkpoint", {})
+        if not settings.get("enabled", True):
+            return cls(None)
+        path = Path(settings.get("path", "state/draft_checkpoint.json"))
+        if not path.is_absolute():
+            path = config_manager.config_dir.parent / path
+        return cls(path, settings.get("max_age_minutes", 30) * 60)
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """Write the state in the background; only the newest of several pending saves is written"""
+        if self.path is not None:
+            self._submit(dict(state, version=VERSION, saved_at=time.time()))
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the draft is over"""
+        if self.path is not None:
+            self._submit(_DELETE)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """The saved state, or None if there is none or it is unusable"""
+        if self.path is None:
+            return None
+        self.flush()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[CHECKPOINT] Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+        if state.get("version") != VERSION or not state.get("lobby_id"):
+            return None
+        if time.time() - state.get("saved_at", 0) > self.max_age_seconds:
+            logger.debug("[CHECKPOINT] Ignoring stale checkpoint")
+            return None
+        return state
+
+    def flush(self) -> None:
+        """Write any pending state now (used before reading and on shutdown)"""
+        self._write_pending()
+
+    def _submit(self, item: Any) -> None:
+        with self._lock:
+            self._pending = item
+            if self._writing:
+                return  # The running writer picks it up
+            self._writing = True
+        try:
+            asyncio.get_running_loop().run_in_executor(None, self._drain)
+        except RuntimeError:
+            self._drain()  # No loop (shutdown, scripts): write inline
+
+    def _drain(self) -> None:
+        while True:
+            self._write_pending()
+            with self._lock:
+                if self._pending is None:
+                    self._writing = False
+                    return
+
+    def _write_pending(self) -> None:
+        # One writer at a time, so an older state can never replace a newer one
+        with self._write_lock:
+            with self._lock:
+                item, self._pending = self._pending, None
+            if item is None:
+                return
+            try:
+                if item is _DELETE:
+                    self.path.unlink(missing_ok=True)
+                    return
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(temporary, "w", encoding="utf-8") as f:
+                    json.dump(item, f, separators=(",", ":"))
+                os.replace(temporary, self.path)
+            except OSError as e:
+                logger.warning(f"[CHECKPOINT] Could not write {self.path}: {e}")
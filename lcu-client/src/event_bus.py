@@ -0,0 +1,207 @@
+"""
+Asynchronous event bus for monitor notifications.
+Publishing only appends to each matching subscriber's bounded queue, so it
+never waits for a subscriber. Every subscriber has its own worker task on the
+publishing loop: coroutine callbacks are awaited there, plain callbacks run on
+a dedicated thread, so a slow webhook or toast only delays its own queue.
+When a queue is full, its overflow policy decides what is lost:
+- DROP_OLDEST: the oldest pending notification (default)
+- DROP_NEWEST: the notification being published
+- COALESCE: pending notifications of the same type and lobby are replaced by
+  the newest one, e.g. a burst of DRAFT_SAVED becomes its last update
+"""
+
+import asyncio
+import inspect
+import logging
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    """What a full subscriber queue gives up"""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    COALESCE = "coalesce"
+
+
+def _coalesce_key(notification) -> Hashable:
+    data = notification.data or {}
+    return notification.type, data.get("lobby_id")
+
+
+class Subscription:
+    """One subscriber: its topic filter, bounded queue and delivery worker"""
+
+    def __init__(self, callback: Callable, topics: Optional[Iterable] = None, max_queue: int = 100,
+                 policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST, name: Optional[str] = None):
+        self.callback = callback
+        self.topics: Optional[FrozenSet] = frozenset(topics) if topics is not None else None
+        self.max_queue = max(1, max_queue)
+        self.policy = policy
+        self.name = name or getattr(callback, "__qualname__", repr(callback))
+        self.stats = {"delivered": 0, "dropped": 0, "coalesced": 0, "failed": 0}
+        self._is_async = inspect.iscoroutinefunction(callback)
+        # Keyed by coalesce key for COALESCE, in arrival order otherwise
+        self._queue: Union[deque, "OrderedDict[Hashable, Any]"] = (
+            OrderedDict() if policy == OverflowPolicy.COALESCE else deque())
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def matches(self, notification) -> bool:
+        return self.topics is None or notification.type in self.topics
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def offer(self, notification) -> None:
+        """Queue a notification for delivery on the running loop (never blocks)"""
+        if self._closed:
+            return
+        queue = self._queue
+        if self.policy == OverflowPolicy.COALESCE:
+            key = _coalesce_key(notification)
+            if key in queue:
+                del queue[key]  # Re-queued at the back as the newest
+                self.stats["coalesced"] += 1
+            elif len(queue) >= self.max_queue:
+                queue.popitem(last=False)
+                self.stats["dropped"] += 1
+            queue[key] = notification
+        elif len(queue) >= self.max_queue:
+            self.stats["dropped"] += 1
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                return
+            queue.popleft()
+            queue.append(notification)
+        else:
+            queue.append(notification)
+        self._ensure_worker()
+        self._idle.clear()
+        self._wakeup.set()
+
+    def deliver_now(self, notification) -> None:
+        """Call the subscriber inline (only used when no event loop is running)"""
+        try:
+            result = self.callback(notification)
+            if inspect.isawaitable(result):
+                asyncio.run(result)
+            self.stats["delivered"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"[EVENT_BUS] Subscriber {self.name} failed: {e}")
+
+    async def wait_idle(self) -> None:
+        """Wait until everything queued so far has been delivered"""
+        if self._idle is not None and self._task is not None and not self._task.done():
+            await self._idle.wait()
+
+    def close(self) -> None:
+        self._closed = True
+        self._queue.clear()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, pending=self.pending, policy=self.policy.value)
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        # First delivery, or the monitor restarted on a new loop: events are loop-bound
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    def _pop(self):
+        if isinstance(self._queue, OrderedDict):
+            return self._queue.popitem(last=False)[1]
+        return self._queue.popleft()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if not self._queue:
+                    self._idle.set()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                notification = self._pop()
+                try:
+                    if self._is_async:
+                        await self.callback(notification)
+                    else:
+                        if self._executor is None:
+                            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-bus")
+                        await loop.run_in_executor(self._executor, self.callback, notification)
+                    self.stats["delivered"] += 1
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    logger.error(f"[EVENT_BUS] Subscriber {self.name} failed: {e}")
+        except asyncio.CancelledError:
+            pass
+
+
+class EventBus:
+    """Topic-filtered publish/subscribe with per-subscriber queues"""
+
+    def __init__(self, max_queue: int = 100, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
+        self.max_queue = max_queue
+        self.policy = policy
+        self._subscriptions: List[Subscription] = []
+
+    def subscribe(self, callback: Callable, topics: Optional[Iterable] = None, max_queue: Optional[int] = None,
+                  policy: Optional[OverflowPolicy] = None, name: Optional[str] = None) -> Subscription:
+        """Deliver notifications of the given types (all when None) to a plain or async callback"""
+        subscription = Subscription(callback, topics, max_queue or self.max_queue, policy or self.policy, name)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscriber: Union[Subscription, Callable]) -> None:
+        """Remove a subscription, by handle or by its callback"""
+        for subscription in list(self._subscriptions):
+            if subscription is subscriber or subscription.callback == subscriber:
+                subscription.close()
+                self._subscriptions.remove(subscription)
+
+    def publish(self, notification) -> None:
+        """Hand a notification to every matching subscriber without waiting for any of them"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (scripts, shutdown): nothing to dispatch on, so deliver inline
+            for subscription in list(self._subscriptions):
+                if subscription.matches(notification):
+                    subscription.deliver_now(notification)
+            return
+        for subscription in self._subscriptions:
+            if subscription.matches(notification):
+                subscription.offer(notification)
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued notifications to be delivered; False if the timeout ran out first"""
+        waits = [subscription.wait_idle() for subscription in self._subscriptions]
+        if not waits:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.gather(*waits), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {subscription.name: subscription.get_stats() for subscription in self._subscriptions}
@@ -0,0 +1,187 @@
+"""
+Always-on flight recorder.
+Keeps the most recent LCU events and pipeline decisions (guard failures,
+change detection, queueing, transmit results) in a fixed-size ring of
+preallocated slots. Messages are stored as %-style templates plus arguments and
+only formatted when the ring is dumped, so recording is a handful of slot
+writes. Dumps are gzip-compressed JSON lines, written automatically when the
+monitor or transmitter logs an error, or on request from the tray.
+"""
+
+import gzip
+import json
+import time
+import logging
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+try:
+    from .config_manager import get_config_manager
+except ImportError:
+    from config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+# Offset to convert time.monotonic() readings to epoch seconds at dump time
+_MONOTONIC_TO_EPOCH = time.time() - time.monotonic()
+
+
+class FlightRecorder:
+    """Ring buffer of (timestamp, kind, template, args) records"""
+
+    def __init__(self, capacity: int = 20000, window_seconds: float = 600):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        # Preallocated slots - recording overwrites in place and never grows these
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._kinds: List[Optional[str]] = [None] * capacity
+        self._templates: List[Optional[str]] = [None] * capacity
+        self._args: List[Tuple[Any, ...]] = [()] * capacity
+        self._next = 0  # Total records written; slot is _next % capacity
+        self._dump_lock = threading.Lock()
+        self._last_auto_dump = 0.0
+
+    def record(self, kind: str, template: str, *args) -> None:
+        """Record an entry; args are formatted into the template only when dumped"""
+        slot = self._next % self.capacity
+        self._timestamps[slot] = time.monotonic()
+        self._kinds[slot] = kind
+        self._templates[slot] = template
+        self._args[slot] = args
+        self._next += 1
+
+    def __len__(self) -> int:
+        return min(self._next, self.capacity)
+
+    def snapshot(self) -> List[Tuple[float, str, str, Tuple[Any, ...]]]:
+        """Raw records within the time window, oldest first"""
+        end = self._next
+        start = max(0, end - self.capacity)
+        cutoff = time.monotonic() - self.window_seconds
+
+        records = []
+        for index in range(start, end):
+            slot = index % self.capacity
+            timestamp = self._timestamps[slot]
+            if timestamp >= cutoff:
+                records.append((timestamp, self._kinds[slot], self._templates[slot], self._args[slot]))
+        return records
+
+    @staticmethod
+    def _format(template: str, args: Tuple[Any, ...]) -> str:
+        try:
+            return template % args if args else template
+        except Exception:
+            return f"{template} {args!r}"
+
+    def dump(self, output_dir: Optional[Path] = None, reason: str = "requested",
+             records: Optional[list] = None) -> Path:
+        """Write the window to a gzip JSON lines file and return its path"""
+        if records is None:
+            records = self.snapshot()
+        if output_dir is None:
+            output_dir = _output_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        path = output_dir / f"flight-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.jsonl.gz"
+        with self._dump_lock, gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"reason": reason, "records": len(records)}) + "\n")
+            for timestamp, kind, template, args in records:
+                f.write(json.dumps({
+                    "t": datetime.fromtimestamp(timestamp + _MONOTONIC_TO_EPOCH).isoformat(timespec="milliseconds"),
+                    "kind": kind,
+                    "msg": self._format(template, args),
+                }, ensure_ascii=False, default=str) + "\n")
+
+        logger.info(f"Flight recorder dumped {len(records)} record(s) to {path} ({reason})")
+        return path
+
+    def dump_in_background(self, reason: str, min_interval: float = 0.0) -> bool:
+        """
+        Copy the window now and compress/write it on a worker thread so the
+        caller (usually the event loop) doesn't block. Returns False when
+        rate limited by min_interval.
+        """
+        now = time.monotonic()
+        if min_interval and now - self._last_auto_dump < min_interval:
+            return False
+        self._last_auto_dump = now
+
+        records = self.snapshot()
+        output_dir = _output_dir()
+        threading.Thread(
+            target=self._dump_quietly, args=(output_dir, reason, records), name="flight-recorder-dump", daemon=True
+        ).start()
+        return True
+
+    def _dump_quietly(self, output_dir: Path, reason: str, records: list) -> None:
+        try:
+            self.dump(output_dir, reason, records)
+        except Exception as e:
+            # Plain warning - an error here would trigger another dump
+            logger.warning(f"Flight recorder dump failed: {e}")
+
+    def dump_on_error(self, target_logger: logging.Logger, min_interval: float = 60.0) -> None:
+        """Dump automatically whenever target_logger logs an error"""
+        if not any(isinstance(handler, _DumpOnErrorHandler) and handler.recorder is self
+                   for handler in target_logger.handlers):
+            target_logger.addHandler(_DumpOnErrorHandler(self, min_interval))
+
+
+class _DumpOnErrorHandler(logging.Handler):
+    """Records the error into the ring, then dumps it (rate limited)"""
+
+    def __init__(self, recorder: FlightRecorder, min_interval: float):
+        super().__init__(level=logging.ERROR)
+        self.recorder = recorder
+        self.min_interval = min_interval
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.recorder.record("error", "%s: %s", record.name, record.getMessage())
+            self.recorder.dump_in_background(f"error logged by {record.name}", self.min_interval)
+        except Exception:
+            self.handleError(record)
+
+
+def _output_dir() -> Path:
+    config_manager = get_config_manager()
+    output_dir = Path(config_manager.get_settings().get("flight_recorder", {}).get("output_dir", "diagnostics"))
+    if not output_dir.is_absolute():
+        output_dir = config_manager.config_dir.parent / output_dir
+    return output_dir
+
+
+class _DisabledRecorder(FlightRecorder):
+    """Used when the flight recorder is turned off in settings"""
+
+    def __init__(self):
+        super().__init__(capacity=1, window_seconds=0)
+
+    def record(self, kind: str, template: str, *args) -> None:
+        pass
+
+    def dump_on_error(self, target_logger: logging.Logger, min_interval: float = 60.0) -> None:
+        pass
+
+
+# Global recorder, created on first use
+_flight_recorder: Optional[FlightRecorder] = None
+
+
+def get_flight_recorder() -> FlightRecorder:
+    """Get the global flight recorder (configured by the flight_recorder settings)"""
+    global _flight_recorder
+    if _flight_recorder is None:
+        settings = get_config_manager().get_settings().get("flight_recorder", {})
+        if settings.get("enabled", True):
+            _flight_recorder = FlightRecorder(
+                capacity=int(settings.get("capacity", 20000)),
+                window_seconds=float(settings.get("window_minutes", 10)) * 60,
+            )
+        else:
+            _flight_recorder = _DisabledRecorder()
+    return _flight_recorder
@@ -4,15 +4,18 @@ import asyncio
 from typing import Optional
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 import qasync
 from .main_window import MainWindow
 from .workspace_dialog import WorkspaceDialog
 from .client_selector_dialog import ClientSelectorDialog
+from .signal_bridge import MonitorSignalBridge
 from lcu_monitor import get_lcu_monitor
 from config_manager import get_config_manager
-from lcu_process_scanner import get_active_lcu_sessions
+from session_watcher import get_session_watcher
+from utils.loop_thread import EventLoopThread
+from profiler import get_sampling_profiler, get_allocation_tracker, write_profiles
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,25 @@ class LCUClientApp:
         
         self.config_manager = get_config_manager()
         self.monitor = get_lcu_monitor()
-        
+        self.session_watcher = get_session_watcher()
+
+        # Monitor/watcher signals reach the widgets through the bridge, so the
+        # GUI code is the same whether the pipeline runs on this thread or not
+        self.bridge = MonitorSignalBridge(self.monitor, self.session_watcher)
+
+        # Optionally run the LCU pipeline on its own event loop so draft
+        # processing never waits on redraws, dialogs or log flushes
+        self.monitor_thread: Optional[EventLoopThread] = None
+        if self.config_manager.get_monitoring_settings().get("worker_thread", False):
+            self.monitor_thread = EventLoopThread("lcu-monitor")
+
+    def _run_in_monitor(self, callback, *args):
+        """Call into the monitor/watcher on the thread that owns their event loop"""
+        if self.monitor_thread:
+            self.monitor_thread.call(callback, *args)
+        else:
+            callback(*args)
+
     def setup_ui(self):
         """Initialize UI components after the event loop is ready"""
         self.main_window = MainWindow()
@@ -37,25 +58,45 @@ class LCUClientApp:
         self.main_window.btn_select_client.clicked.connect(self.show_client_selector)
         
         # Connect monitor signals to UI
-        self.monitor.status_changed.connect(self.update_status)
-        self.monitor.workspace_updated.connect(lambda wid: self.main_window.workspace_lbl.setText(f"Workspace: {wid}"))
+        self.bridge.status_changed.connect(self.update_status)
+        self.bridge.workspace_updated.connect(lambda wid: self.main_window.workspace_lbl.setText(f"Workspace: {wid}"))
+        self.bridge.low_footprint_changed.connect(self.set_low_footprint)
         
         workspace_id = self.config_manager.get_workspace_id()
         if workspace_id:
             self.main_window.workspace_lbl.setText(f"Workspace: {workspace_id}")
             
-        # Start the background LCUMonitor logic
-        self.monitor.start()
-
         # Connect the Qt log handler to the UI right before displaying it
         if hasattr(self, 'qt_handler') and self.qt_handler:
+            ui_settings = self.config_manager.get_ui_settings()
+            self.main_window.log_viewer.setMaximumBlockCount(ui_settings.get("log_max_lines", 2000))
             self.qt_handler.signals.log_message.connect(self._append_log)
+            self.qt_handler.start(ui_settings.get("log_flush_interval_ms", 100))
+
+        # Refresh loop lag from the monitor's watchdog
+        self.status_timer = QTimer(self.main_window)
+        self.status_timer.timeout.connect(self.update_loop_lag)
+        self.status_timer.start(2000)
 
         # Show window initially, but user can minimize to tray
         self.main_window.show()
 
+        # Monitoring starts after the first paint so heavy imports (lcu_driver,
+        # aiohttp) and client discovery don't delay the window
+        self.app.processEvents()
+
+        if self.monitor_thread:
+            self.monitor_thread.start()
+            logger.info("LCU monitor running on a dedicated worker thread")
+
+        # Start watching for League clients (shared by the monitor and the client selector)
+        self._run_in_monitor(self.session_watcher.start)
+
+        # Start the background LCUMonitor logic
+        self._run_in_monitor(self.monitor.start)
+
     def _append_log(self, msg: str):
-        """Append log message to the main window's log viewer"""
+        """Append a batch of log lines to the main window's log viewer"""
         if self.main_window and hasattr(self.main_window, 'log_viewer'):
             self.main_window.log_viewer.appendPlainText(msg)
             # Auto scroll to bottom
@@ -75,6 +116,20 @@ class LCUClientApp:
         show_action = QAction("Show", self.app)
         show_action.triggered.connect(self.show_window)
         tray_menu.addAction(show_action)
+
+        if self.monitor.tracer.enabled:
+            export_trace_action = QAction("Export Trace", self.app)
+            export_trace_action.triggered.connect(self.export_trace)
+            tray_menu.addAction(export_trace_action)
+
+        if get_sampling_profiler() or get_allocation_tracker():
+            save_profile_action = QAction("Save Profile", self.app)
+            save_profile_action.triggered.connect(self.save_profile)
+            tray_menu.addAction(save_profile_action)
+
+        dump_recorder_action = QAction("Dump Flight Recorder", self.app)
+        dump_recorder_action.triggered.connect(self.dump_flight_recorder)
+        tray_menu.addAction(dump_recorder_action)
         
         quit_action = QAction("Quit", self.app)
         quit_action.triggered.connect(self.quit_app)
@@ -105,6 +160,33 @@ class LCUClientApp:
             else:
                 self.main_window.cloud_status_label.setStyleSheet("color: #dddddd;")
 
+    def set_low_footprint(self, active: bool):
+        """Stop timers and log rendering while a game runs; logs stay buffered in the handler"""
+        log_viewer = self.main_window.log_viewer
+        qt_handler = getattr(self, 'qt_handler', None)
+        if active:
+            self.status_timer.stop()
+            if qt_handler:
+                qt_handler.stop()
+            log_viewer.setUpdatesEnabled(False)
+            return
+
+        log_viewer.setUpdatesEnabled(True)
+        self.status_timer.start(2000)
+        if qt_handler:
+            qt_handler.start(self.config_manager.get_ui_settings().get("log_flush_interval_ms", 100))
+            qt_handler.flush()
+
+    def update_loop_lag(self):
+        lag = self.monitor.loop_watchdog.get_stats()
+        if not lag["samples"]:
+            return
+        self.main_window.loop_lag_label.setText(
+            f"Loop lag: p50 {lag['p50_ms']:.0f} ms · p99 {lag['p99_ms']:.0f} ms · max {lag['max_ms']:.0f} ms"
+        )
+        color = "#ff5555" if lag["p99_ms"] >= self.monitor.loop_watchdog.threshold * 1000 else "#888888"
+        self.main_window.loop_lag_label.setStyleSheet(f"color: {color};")
+
     def show_workspace_dialog(self):
         current_workspace = self.config_manager.get_workspace_id() or ""
         dialog = WorkspaceDialog(self.main_window, current_workspace)
@@ -118,25 +200,48 @@ class LCUClientApp:
                     self.main_window.workspace_lbl.setText(f"Workspace: {wid}")
                     QMessageBox.information(self.main_window, "Success", "Workspace credentials saved!")
                     # Tell monitor to update and start
-                    self.monitor.workspace_id = wid
-                    self.monitor.start()
+                    def restart_monitor():
+                        self.monitor.workspace_id = wid
+                        self.monitor.start()
+                    self._run_in_monitor(restart_monitor)
                 except Exception as e:
                     QMessageBox.warning(self.main_window, "Error", f"Failed to save credentials: {e}")
 
     def show_client_selector(self):
-        sessions = get_active_lcu_sessions()
+        # Sessions come from the background watcher, so the dialog opens without scanning
+        sessions = self.session_watcher.get_sessions()
         if not sessions:
+            self._run_in_monitor(self.session_watcher.refresh)
             QMessageBox.information(self.main_window, "No Clients", "No League Client processes detected.")
             return
             
-        dialog = ClientSelectorDialog(sessions, self.main_window)
+        dialog = ClientSelectorDialog(sessions, self.main_window, watcher=self.bridge)
         if dialog.exec() and dialog.selected_session:
             session = dialog.selected_session
             self.main_window.client_lbl.setText(f"Active Client: {session.display_name}")
             # Target this specific PID for LCU monitor
-            self.monitor.set_target_pid(session.pid)
+            self._run_in_monitor(self.monitor.set_target_pid, session.pid)
             QMessageBox.information(self.main_window, "Client Selected", f"Now tracking {session.display_name}. Wait a moment for connection.")
 
+    def export_trace(self):
+        try:
+            path = self.monitor.tracer.export_chrome_trace()
+            self.tray_icon.showMessage("Trace exported", str(path))
+        except Exception as e:
+            logger.error(f"Failed to export trace: {e}")
+
+    def dump_flight_recorder(self):
+        try:
+            path = self.monitor.recorder.dump(reason="requested from tray")
+            self.tray_icon.showMessage("Flight recorder dumped", str(path))
+        except Exception as e:
+            logger.warning(f"Failed to dump flight recorder: {e}")
+
+    def save_profile(self):
+        paths = write_profiles()
+        if paths:
+            self.tray_icon.showMessage("Profile saved", "\n".join(str(path) for path in paths))
+
     def show_window(self):
         if self.main_window:
             self.main_window.show()
@@ -149,7 +254,10 @@ class LCUClientApp:
             self.tray_icon.hide()
         
         # Stop background tasks
-        asyncio.create_task(self.monitor.stop())
+        if self.monitor_thread:
+            self.monitor_thread.stop(self.monitor.stop)
+        else:
+            asyncio.create_task(self.monitor.stop())
         
         # Stop event loop and quit
         asyncio.get_event_loop().stop()
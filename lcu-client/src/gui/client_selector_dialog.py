@@ -4,7 +4,7 @@ from typing import List, Optional
 from lcu_process_scanner import LCUSession
 
 class ClientSelectorDialog(QDialog):
-    def __init__(self, sessions: List[LCUSession], parent=None):
+    def __init__(self, sessions: List[LCUSession], parent=None, watcher=None):
         super().__init__(parent)
         self.setWindowTitle("Select LCU Session")
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
@@ -16,6 +16,14 @@ class ClientSelectorDialog(QDialog):
         self.setup_ui()
         self.apply_styles()
 
+        # Keep the list in sync with clients starting/closing while the dialog is open
+        self.watcher = watcher
+        if self.watcher:
+            self.watcher.session_added.connect(self._add_session)
+            self.watcher.session_removed.connect(self._remove_session)
+            self.watcher.session_changed.connect(self._update_session)
+            self.finished.connect(self._disconnect_watcher)
+
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -33,9 +41,7 @@ class ClientSelectorDialog(QDialog):
         
         self.list_widget = QListWidget()
         for session in self.sessions:
-            item = QListWidgetItem(session.display_name)
-            item.setData(Qt.UserRole, session)
-            self.list_widget.addItem(item)
+            self._add_session(session)
             
         if self.list_widget.count() > 0:
             self.list_widget.setCurrentRow(0)
@@ -59,6 +65,36 @@ class ClientSelectorDialog(QDialog):
         
         main_layout.addWidget(container)
 
+    def _find_item(self, pid: int) -> Optional[QListWidgetItem]:
+        for row in range(self.list_widget.count()):
+            item = self.list_widget.item(row)
+            if item.data(Qt.UserRole).pid == pid:
+                return item
+        return None
+
+    def _add_session(self, session: LCUSession):
+        if self._find_item(session.pid):
+            return
+        item = QListWidgetItem(session.display_name)
+        item.setData(Qt.UserRole, session)
+        self.list_widget.addItem(item)
+
+    def _remove_session(self, session: LCUSession):
+        item = self._find_item(session.pid)
+        if item:
+            self.list_widget.takeItem(self.list_widget.row(item))
+
+    def _update_session(self, session: LCUSession):
+        item = self._find_item(session.pid)
+        if item:
+            item.setText(session.display_name)
+            item.setData(Qt.UserRole, session)
+
+    def _disconnect_watcher(self):
+        self.watcher.session_added.disconnect(self._add_session)
+        self.watcher.session_removed.disconnect(self._remove_session)
+        self.watcher.session_changed.disconnect(self._update_session)
+
     def accept_selection(self):
         current_item = self.list_widget.currentItem()
         if current_item:
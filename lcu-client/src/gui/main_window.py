@@ -84,8 +84,12 @@ class MainWindow(FramelessWindow):
         self.cloud_status_label = QLabel("Netlify: Waiting")
         self.cloud_status_label.setObjectName("statusLabel")
         
+        self.loop_lag_label = QLabel("Loop lag: -")
+        self.loop_lag_label.setObjectName("metricLabel")
+        
         status_layout.addWidget(self.lcu_status_label)
         status_layout.addWidget(self.cloud_status_label)
+        status_layout.addWidget(self.loop_lag_label)
         
         content_layout.addWidget(status_frame)
         
@@ -183,6 +187,11 @@ class MainWindow(FramelessWindow):
                 font-size: 13px;
                 padding: 2px 0;
             }
+            QLabel#metricLabel {
+                color: #888888;
+                font-size: 11px;
+                padding: 2px 0;
+            }
             QPushButton#actionBtn {
                 background-color: #2d5af0;
                 color: white;
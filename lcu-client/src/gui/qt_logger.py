@@ -1,21 +1,66 @@
 import logging
-from PySide6.QtCore import QObject, Signal
+from collections import deque
+from typing import List, Optional
+from PySide6.QtCore import QObject, Signal, QTimer
 
 class QtLogSignals(QObject):
-    log_message = Signal(str)
+    log_message = Signal(str)  # A batch of newline-joined log lines
 
 class QtLogHandler(logging.Handler):
     """
-    A custom logging handler that emits log records via a Qt Signal
-    so they can be safely appended to GUI widgets from different threads.
+    A custom logging handler that buffers log records in a bounded ring buffer
+    and flushes them to GUI widgets in batches on a Qt timer.
+    emit() only appends the record, so logging never waits on the GUI;
+    when the buffer is full the oldest records are dropped and counted.
     """
-    def __init__(self):
+    def __init__(self, capacity: int = 2000, batch_size: int = 500):
         super().__init__()
         self.signals = QtLogSignals()
+        self._buffer = deque(maxlen=capacity)
+        self._batch_size = batch_size
+        self._dropped = 0
+        self._timer: Optional[QTimer] = None
 
     def emit(self, record):
+        # Formatting is deferred to the flush; the handler lock is held here
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append(record)
+
+    def start(self, interval_ms: int = 100):
+        """Start flushing on a timer - must be called from the GUI thread"""
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.timeout.connect(self.flush)
+        self._timer.start(interval_ms)
+
+    def stop(self):
+        """Stop the flush timer"""
+        if self._timer:
+            self._timer.stop()
+
+    def drain(self) -> List[str]:
+        """Pop up to batch_size buffered records as formatted lines"""
+        self.acquire()
         try:
-            msg = self.format(record)
-            self.signals.log_message.emit(msg)
-        except Exception:
-            self.handleError(record)
+            dropped, self._dropped = self._dropped, 0
+            count = min(len(self._buffer), self._batch_size)
+            records = [self._buffer.popleft() for _ in range(count)]
+        finally:
+            self.release()
+
+        lines = []
+        if dropped:
+            lines.append(f"[LOG] {dropped} message(s) dropped - logging faster than the viewer can keep up")
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        return lines
+
+    def flush(self):
+        """Send buffered records to the GUI as a single batch"""
+        lines = self.drain()
+        if lines:
+            self.signals.log_message.emit("\n".join(lines))
@@ -0,0 +1,24 @@
+from PySide6.QtCore import QObject, Signal
+
+
+class MonitorSignalBridge(QObject):
+    """
+    Re-emits the monitor's and session watcher's callback signals as Qt signals.
+    The bridge lives on the GUI thread, so when the pipeline runs on a worker
+    thread Qt queues each emission and the connected slots run on the GUI thread.
+    """
+    status_changed = Signal(str, str)   # (system, status_text)
+    workspace_updated = Signal(str)     # (workspace_id)
+    session_added = Signal(object)      # LCUSession
+    session_removed = Signal(object)    # LCUSession
+    session_changed = Signal(object)    # LCUSession
+    low_footprint_changed = Signal(bool)  # In game: pause rendering and timers
+
+    def __init__(self, monitor, watcher, parent=None):
+        super().__init__(parent)
+        monitor.status_changed.connect(self.status_changed.emit)
+        monitor.workspace_updated.connect(self.workspace_updated.emit)
+        monitor.low_footprint.changed.connect(self.low_footprint_changed.emit)
+        watcher.session_added.connect(self.session_added.emit)
+        watcher.session_removed.connect(self.session_removed.emit)
+        watcher.session_changed.connect(self.session_changed.emit)
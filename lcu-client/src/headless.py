@@ -0,0 +1,72 @@
+"""
+Headless daemon mode - runs the LCU monitor and data transmitter on a plain
+asyncio loop without Qt. Status updates are reported through log callbacks.
+"""
+
+import sys
+import signal
+import asyncio
+import logging
+
+from config_manager import get_config_manager
+from lcu_monitor import get_lcu_monitor
+
+logger = logging.getLogger(__name__)
+
+
+def _log_status(system: str, status: str) -> None:
+    """Status callback for the headless frontend"""
+    logger.info(f"[STATUS] {system}: {status}")
+
+
+def _log_workspace(workspace_id: str) -> None:
+    """Workspace callback for the headless frontend"""
+    logger.info(f"[STATUS] Workspace: {workspace_id}")
+
+
+async def _run_monitor() -> int:
+    """Run the monitor until SIGINT/SIGTERM"""
+    monitor = get_lcu_monitor()
+    monitor.status_changed.connect(_log_status)
+    monitor.workspace_updated.connect(_log_workspace)
+
+    if not monitor.start():
+        logger.error("Failed to start LCU monitor")
+        return 1
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on Windows - Ctrl+C raises KeyboardInterrupt instead
+            pass
+
+    logger.info("Headless LCU client running (Ctrl+C to stop)")
+    try:
+        await stop_event.wait()
+    finally:
+        await monitor.stop()
+    return 0
+
+
+def run_headless() -> int:
+    """Entry point for `lcu-client --headless`"""
+    config_manager = get_config_manager()
+
+    if not config_manager.is_configured():
+        if sys.stdin and sys.stdin.isatty():
+            try:
+                config_manager.prompt_workspace_credentials()
+            except (KeyboardInterrupt, EOFError):
+                return 1
+        else:
+            logger.error("Workspace not configured - set workspaceId/passwordHash in config/workspace.json")
+            return 1
+
+    try:
+        return asyncio.run(_run_monitor())
+    except KeyboardInterrupt:
+        logger.info("Headless LCU client stopped")
+        return 0
@@ -8,44 +8,47 @@ import asyncio
 import logging
 from enum import Enum, auto
 from typing import Dict, List, Optional, Any, Set, Tuple
-from datetime import datetime
 import json
 import time
-import psutil
-
-from PySide6.QtCore import QObject, Signal
-import lcu_driver.utils
-from lcu_driver import Connector
-from lcu_driver.events.responses import WebsocketEventResponse
+import functools
 
 try:
-    from .models import DraftData, GameflowPhase, TeamData, ChampionAction, ChampionEvent
+    from .models import DraftData, GameflowPhase, TeamData, ChampionAction, ChampionEvent, NO_CHAMPION, epoch_ms
     from .champion_mapper import get_champion_mapper
     from .data_transmitter import get_data_transmitter
     from .config_manager import get_config_manager
     from .notifications import get_notifier, NotificationType
+    from .lcu_process_scanner import LCUSession
+    from .session_watcher import get_session_watcher
+    from .loop_watchdog import LoopLagWatchdog
+    from .low_footprint import LowFootprintMode
+    from .rest_poller import RestPoller
+    from .draft_checkpoint import DraftCheckpoint
+    from .metrics import get_metrics
+    from .tracing import get_tracer, traced
+    from .flight_recorder import get_flight_recorder
+    from .profiler import get_allocation_tracker, register_loop
+    from .utils.callbacks import CallbackSignal
 except ImportError:
-    from models import DraftData, GameflowPhase, TeamData, ChampionAction, ChampionEvent
+    from models import DraftData, GameflowPhase, TeamData, ChampionAction, ChampionEvent, NO_CHAMPION, epoch_ms
     from champion_mapper import get_champion_mapper
     from data_transmitter import get_data_transmitter
     from config_manager import get_config_manager
     from notifications import get_notifier, NotificationType
+    from lcu_process_scanner import LCUSession
+    from session_watcher import get_session_watcher
+    from loop_watchdog import LoopLagWatchdog
+    from low_footprint import LowFootprintMode
+    from rest_poller import RestPoller
+    from draft_checkpoint import DraftCheckpoint
+    from metrics import get_metrics
+    from tracing import get_tracer, traced
+    from flight_recorder import get_flight_recorder
+    from profiler import get_allocation_tracker, register_loop
+    from utils.callbacks import CallbackSignal
 
 logger = logging.getLogger(__name__)
 
-# Event counter for tracking event frequency
-_event_counter = {"count": 0, "last_reset": time.time()}
-
-def _log_event_frequency(event_type: str):
-    """Log event frequency to detect spam"""
-    _event_counter["count"] += 1
-    elapsed = time.time() - _event_counter["last_reset"]
-    if elapsed >= 5.0:  # Log every 5 seconds
-        rate = _event_counter["count"] / elapsed
-        logger.info(f"[EVENT_RATE] {event_type}: {_event_counter['count']} events in {elapsed:.1f}s ({rate:.1f}/sec)")
-        _event_counter["count"] = 0
-        _event_counter["last_reset"] = time.time()
-
 def _truncate_data(data: Any, max_len: int = 500) -> str:
     """Truncate data for logging"""
     try:
@@ -69,13 +72,9 @@ class MonitorState(Enum):
     GAME_STARTED = "game_started"
 
 
-class LCUMonitor(QObject):
+class LCUMonitor:
     """Monitors League Client Update API for draft data with state machine"""
     
-    # GUI Signals
-    status_changed = Signal(str, str) # (system, status_text) like ("LCU", "Connected")
-    workspace_updated = Signal(str)
-    
     # LCU API endpoints
     CHAMP_SELECT_URL = '/lol-champ-select/v1/session'
     GAMEFLOW_URL = '/lol-gameflow/v1/gameflow-phase'
@@ -91,13 +90,54 @@ class LCUMonitor(QObject):
     PHASE_PRE_END_GAME = 'PreEndOfGame'
 
     def __init__(self):
-        super().__init__()
+        # Status callbacks for frontends (Qt GUI or headless logging)
+        self.status_changed = CallbackSignal()  # (system, status_text) like ("LCU", "Connected")
+        self.workspace_updated = CallbackSignal()  # (workspace_id)
+        self.draft_changed = CallbackSignal()  # (DraftData, or None once the draft is over)
+
         # Defer connector creation until start() to avoid event loop issues
         self.connector = None
         self.champion_mapper = get_champion_mapper()
         self.data_transmitter = get_data_transmitter()
         self.config_manager = get_config_manager()
         self.notifier = get_notifier()
+        self.session_watcher = get_session_watcher()
+        self.session_watcher.session_added.connect(self._on_session_available)
+        self.session_watcher.session_changed.connect(self._on_session_available)
+        self._session_available: Optional[asyncio.Event] = None
+
+        # Measures lag of the loop the monitor runs on; stacks of blocking calls are captured in debug
+        monitoring_settings = self.config_manager.get_monitoring_settings()
+        self.loop_watchdog = LoopLagWatchdog(
+            threshold=monitoring_settings.get("loop_lag_threshold_ms", 100) / 1000,
+            capture_stacks=logging.getLogger().isEnabledFor(logging.DEBUG)
+        )
+
+        # Reconciles missed WebSocket frames over REST, and takes over when the socket degrades
+        self.rest_poller = RestPoller.from_settings(self, monitoring_settings)
+
+        # Lower priority and pause background work while a game is running
+        self.low_footprint = LowFootprintMode.from_settings(self.config_manager.get_settings().get("low_footprint", {}))
+        self._register_low_footprint_hooks()
+
+        # Hot-path metrics (no-ops unless metrics.enabled), optionally served on /metrics
+        self.metrics = get_metrics()
+        self._m_events = self.metrics.counter("lcu_client_events_total", "LCU WebSocket events received", "uri")
+        self._m_handler_seconds = self.metrics.histogram(
+            "lcu_client_event_handler_seconds", "Time spent handling an LCU WebSocket event", "uri")
+        self._m_extraction_seconds = self.metrics.histogram(
+            "lcu_client_draft_extraction_seconds", "Time to extract a draft from a champ select session")
+        self.metrics_server = None  # MetricsServer when metrics.http_enabled
+        self.live_server = None  # LiveDraftServer when live_server.enabled
+
+        # Span tracing per champ select update (no-op unless tracing.enabled)
+        self.tracer = get_tracer()
+
+        # Recent events and pipeline decisions, dumped to disk when an error is logged
+        self.recorder = get_flight_recorder()
+        recorder_settings = self.config_manager.get_settings().get("flight_recorder", {})
+        if recorder_settings.get("dump_on_error", True):
+            self.recorder.dump_on_error(logger, recorder_settings.get("min_dump_interval_seconds", 60))
 
         # State tracking
         self.is_connected = False
@@ -117,15 +157,28 @@ class LCUMonitor(QObject):
         # Event handlers will be set up when connector is created
         self._event_handlers_setup = False
         
-        # CRITICAL FIX: Store raw ID-based draft data for proper change detection
-        # This prevents the bug where names are compared against IDs
+        # Last extracted draft used for change detection (drafts hold IDs and are never mutated)
         self._last_raw_draft_data: Optional[DraftData] = None
         
-        # Track initial timestamps for draft actions
-        self._action_timestamps: Dict[int, datetime] = {}
+        # Champ select and gameflow WebSocket events received; a REST poll whose response
+        # arrives after one of these is older than what the socket delivered
+        self._ws_update_count = 0
+
+        # Epoch ms at which each draft action was first seen completed, on the LCU clock
+        self._action_timestamps: Dict[int, int] = {}
+
+        # LCU epoch ms minus local monotonic ms, measured at the latest timer stamp of the session
+        self._session_clock_offset: Optional[int] = None
+        self._session_timer_stamp: Optional[int] = None
         
         # Track initial picks for cells so swaps don't override the drafted champion
-        self._initial_picks: Dict[int, str] = {}
+        self._initial_picks: Dict[int, int] = {}
+
+        # Reuse event objects per action so their cached wire encoding survives across updates
+        self._action_events: Dict[int, ChampionEvent] = {}
+
+        # Per-draft state on disk, so a restart mid-draft resumes instead of starting a new game
+        self.checkpoint = DraftCheckpoint.from_settings()
 
     def _set_state(self, new_state: MonitorState) -> None:
         """Change monitor state with logging and notification"""
@@ -134,13 +187,84 @@ class LCUMonitor(QObject):
             self.state = new_state
             self.notifier.on_state_changed(old_state.value, new_state.value)
             logger.info(f"Monitor state: {old_state.value} → {new_state.value}")
+            self.recorder.record("state", "%s -> %s (lobby %s)", old_state.value, new_state.value, self.current_lobby_id)
+
+            # --profile-alloc: attribute memory growth to the states that caused it
+            allocation_tracker = get_allocation_tracker()
+            if allocation_tracker:
+                allocation_tracker.snapshot(f"{old_state.value}->{new_state.value}")
+
+            self.rest_poller.reschedule()
+            if new_state == MonitorState.GAME_STARTED:
+                self.low_footprint.enter()
+
+    def _register_low_footprint_hooks(self) -> None:
+        """Background work that can wait until the game is over"""
+        def pause_task(component):
+            paused = component.is_running
+            component.stop()
+            return paused
+
+        watcher_paused = watchdog_paused = False
+
+        def pause_watchers():
+            nonlocal watcher_paused, watchdog_paused
+            # The open connection reports the client closing, so discovery can stop until then
+            watcher_paused = pause_task(self.session_watcher)
+            watchdog_paused = pause_task(self.loop_watchdog)
+
+        def resume_watchers():
+            if watcher_paused:
+                self.session_watcher.start()
+            if watchdog_paused:
+                self.loop_watchdog.start()
+
+        def trim_draft_caches():
+            # The draft is locked in; nothing extracted during champ select is needed again
+            self._action_timestamps.clear()
+            self._initial_picks.clear()
+            self._action_events.clear()
+            self._last_raw_draft_data = None
+
+        self.low_footprint.register("watchers", pause_watchers, resume_watchers)
+        self.low_footprint.register("draft caches", trim_draft_caches)
 
     def set_target_pid(self, pid: Optional[int]):
         self.target_pid = pid
+        # Wake the connector loop in case it is waiting for a matching client
+        if self._session_available:
+            self._session_available.set()
         # Restart connector if necessary
         if self.connector:
             pass # Usually requires restarting the connector entirely, best handled at app level
 
+    def _find_session(self) -> Optional[LCUSession]:
+        """Find the LCU session to connect to among those known to the session watcher"""
+        for session in self.session_watcher.get_sessions():
+            if not self.target_pid or session.pid == self.target_pid:
+                return session
+        return None
+
+    def _on_session_available(self, session: LCUSession):
+        """Wake the connector loop as soon as the session watcher sees a client"""
+        if self._session_available:
+            self._session_available.set()
+
+    def _instrumented(self, uri: str):
+        """Decorator counting events and timing the handler for a WebSocket URI"""
+        def decorator(handler):
+            @functools.wraps(handler)
+            async def wrapper(connection, event):
+                self._m_events.inc(label=uri)
+                self.recorder.record("event", "%s %s", event.type, uri)
+                start = time.perf_counter()
+                try:
+                    await handler(connection, event)
+                finally:
+                    self._m_handler_seconds.observe(time.perf_counter() - start, uri)
+            return wrapper
+        return decorator
+
     def _setup_event_handlers(self):
         """Set up LCU event handlers"""
 
@@ -161,37 +285,28 @@ class LCUMonitor(QObject):
             # Start data transmitter
             await self.data_transmitter.start()
 
-            # Get current phase to set initial state
+            # Initial state: gameflow, lobby and champ select in one round trip
             try:
-                phase_response = await connection.request('get', self.GAMEFLOW_URL)
-                if phase_response.status == 200:
-                    # Handle both aiohttp ClientResponse and lcu-driver wrapped responses
-                    try:
-                        current_phase = await phase_response.json()
-                    except (AttributeError, TypeError):
-                        current_phase = getattr(phase_response, 'data', None)
-                    
-                    if current_phase:
-                        if isinstance(current_phase, str):
-                            current_phase = current_phase.strip('"')
-                        logger.info(f"Initial gameflow phase: {current_phase}")
-                        await self._process_gameflow_phase(current_phase)
+                await self._bootstrap(connection)
             except Exception as e:
-                logger.warning(f"Could not get initial phase: {e}")
+                logger.warning(f"Could not get initial state: {e}")
+
+            self.rest_poller.start(connection)
 
         @self.connector.close
         async def disconnect(connection):
             logger.info('LCU connection closed')
             self.is_connected = False
+            self.rest_poller.stop()
+            self.low_footprint.exit()
             self.status_changed.emit("LCU", "Disconnected")
             self.notifier.on_connection_lost()
 
         @self.connector.ws.register(self.CHAMP_SELECT_URL)
+        @self._instrumented(self.CHAMP_SELECT_URL)
         async def champ_select_update(connection, event):
             """Handle champion select session updates - only process in monitoring state"""
-            # Log event frequency to detect spam
-            _log_event_frequency("champ_select")
-            
+            self._ws_update_count += 1
             # OPTIMIZATION: Ignore champ select events when not monitoring
             if self.state != MonitorState.MONITORING_CHAMP_SELECT:
                 logger.debug(f"[CHAMP_SELECT_EVENT] Ignoring event - current state: {self.state.value}")
@@ -209,15 +324,20 @@ class LCUMonitor(QObject):
                 total_actions = sum(len(ag) for ag in actions) if actions else 0
                 logger.debug(f"[CHAMP_SELECT_EVENT] Actions groups: {len(actions)}, Total actions: {total_actions}")
                 
-                await self._process_champ_select_data(event.data)
+                # One trace per update, followed through extraction, queueing and transmission
+                with self.tracer.trace("champ_select_update", lobby=self.current_lobby_id, phase=phase):
+                    await self._process_champ_select_data(event.data)
 
         @self.connector.ws.register(self.GAMEFLOW_URL)
+        @self._instrumented(self.GAMEFLOW_URL)
         async def gameflow_update(connection, event):
             """Handle gameflow phase changes - always process for state machine"""
+            self._ws_update_count += 1
             if event.data:
                 await self._process_gameflow_phase(event.data)
 
         @self.connector.ws.register(self.LOBBY_URL)
+        @self._instrumented(self.LOBBY_URL)
         async def lobby_update(connection, event):
             """Handle lobby updates - only process when relevant"""
             # Only process lobby updates when idle or starting to monitor
@@ -242,53 +362,75 @@ class LCUMonitor(QObject):
 
             # We DO NOT create a new event loop here. 
             # qasync provides the loop and lcu-driver will use it.
-            
-            # Monkeypatch lcu_driver to filter by PID if targeted
-            import lcu_driver.utils
-            from psutil import process_iter, STATUS_ZOMBIE
-            
-            original_return_ux_process = lcu_driver.utils._return_ux_process
-            
-            def custom_return_ux_process():
-                for process in process_iter(attrs=["cmdline"]):
-                    if process.status() == STATUS_ZOMBIE:
-                        continue
-                    if self.target_pid and process.pid != self.target_pid:
-                        continue
-                    if process.name() in ["LeagueClientUx.exe", "LeagueClientUx"]:
-                        yield process
-                    cmdline = process.info.get("cmdline", [])
-                    if cmdline and cmdline[0].endswith("LeagueClientUx.exe"):
-                        yield process
-            
-            lcu_driver.utils._return_ux_process = custom_return_ux_process
+
+            # lcu_driver (and aiohttp) are only needed once monitoring starts
+            from lcu_driver import Connector
 
             # Create connector
             self.connector = Connector()
             self._setup_event_handlers()
 
+            # Client discovery is shared with the GUI through the session watcher
+            self._session_available = asyncio.Event()
+            self.session_watcher.start()
+            self.loop_watchdog.start()
+            register_loop()
+
+            metrics_settings = self.config_manager.get_settings().get("metrics", {})
+            if self.metrics.enabled and metrics_settings.get("http_enabled", False) and not self.metrics_server:
+                try:
+                    from .metrics_server import MetricsServer
+                except ImportError:
+                    from metrics_server import MetricsServer
+                self.metrics_server = MetricsServer(
+                    self.metrics,
+                    host=metrics_settings.get("http_host", "127.0.0.1"),
+                    port=metrics_settings.get("http_port", 9464)
+                )
+                asyncio.get_event_loop().create_task(self._start_metrics_server())
+
+            live_settings = self.config_manager.get_settings().get("live_server", {})
+            if live_settings.get("enabled", False) and not self.live_server:
+                try:
+                    from .live_draft_server import LiveDraftServer
+                except ImportError:
+                    from live_draft_server import LiveDraftServer
+                self.live_server = LiveDraftServer.from_settings(live_settings)
+                self.draft_changed.connect(self.live_server.publish)
+                asyncio.get_event_loop().create_task(self._start_live_server())
+
             # We must run it as a task because Connector.start() blocks
-            import asyncio
             
             # Rather than calling connector.start() which blocks with run_forever
             # we just start it asynchronously matching its internal logic.
             async def background_start():
                 try:
-                    import lcu_driver.utils
                     from lcu_driver.connection import Connection
-                    
+
+                    last_session = None
                     while self.connector._repeat_flag:
-                        process = next(lcu_driver.utils._return_ux_process(), None)
-                        if process:
-                            # We found a process, create connection and init it
+                        self._session_available.clear()
+                        session = self._find_session()
+                        if session and session != last_session:
+                            # We found a client, create connection and init it
                             # Force lcu_driver to use the current qt loop
-                            connection = Connection(self.connector, process)
+                            connection = Connection(self.connector, session.connection_string)
                             self.connector.register_connection(connection)
                             
                             # Safely await the initialization without crashing the loop 
                             await connection.init()
-                            
-                        await asyncio.sleep(0.5)
+
+                            # Connection closed - have the watcher drop the client right away
+                            last_session = session
+                            self.session_watcher.refresh()
+                            continue
+
+                        # Wait for the watcher to report a client; retry the same one
+                        # after a pause in case only the connection dropped
+                        try:
+                            await asyncio.wait_for(self._session_available.wait(), timeout=5)
+                        except asyncio.TimeoutError:
+                            last_session = None
                 except asyncio.CancelledError:
                     pass
                 except Exception as e:
@@ -312,7 +454,23 @@ class LCUMonitor(QObject):
         """Stop the LCU monitor"""
         logger.info("Stopping LCU monitor...")
         try:
+            self.rest_poller.stop()
+            self.low_footprint.exit()
             await self.data_transmitter.stop()
+            self.checkpoint.flush()
+            if not await self.notifier.bus.drain(timeout=2):
+                logger.warning("Some notifications were not delivered before shutdown")
+            self.session_watcher.stop()
+            self.loop_watchdog.stop()
+            if self.metrics_server:
+                await self.metrics_server.stop()
+                self.metrics_server = None
+            if self.live_server:
+                self.draft_changed.disconnect(self.live_server.publish)
+                await self.live_server.stop()
+                self.live_server = None
+            if self.tracer.enabled and self.config_manager.get_settings().get("tracing", {}).get("export_on_exit", True):
+                self.tracer.export_chrome_trace()
             if self.connector:
                 await self.connector.stop()
             
@@ -321,6 +479,21 @@ class LCUMonitor(QObject):
         except Exception as e:
             logger.error(f"Error stopping LCU monitor: {e}")
 
+    async def _start_live_server(self):
+        try:
+            await self.live_server.start()
+        except OSError as e:
+            logger.error(f"Could not start live draft server on port {self.live_server.port}: {e}")
+            self.draft_changed.disconnect(self.live_server.publish)
+            self.live_server = None
+
+    async def _start_metrics_server(self):
+        try:
+            await self.metrics_server.start()
+        except OSError as e:
+            logger.error(f"Could not start metrics endpoint on port {self.metrics_server.port}: {e}")
+            self.metrics_server = None
+
     async def _process_gameflow_phase(self, phase_data: str):
         """Process gameflow phase change with state machine logic"""
         old_phase = self.current_phase
@@ -332,14 +505,16 @@ class LCUMonitor(QObject):
         logger.info(f"Gameflow: {self.current_phase} → {new_phase}")
         self.current_phase = new_phase
 
+        # The game is over (or never ran) once the phase leaves InProgress
+        if self.low_footprint.active and new_phase not in [self.PHASE_IN_PROGRESS, self.PHASE_GAME_START]:
+            self.low_footprint.exit()
+
         # STATE MACHINE TRANSITIONS
 
         # IDLE → MONITORING_CHAMP_SELECT
         if new_phase == self.PHASE_CHAMP_SELECT:
-            self._set_state(MonitorState.MONITORING_CHAMP_SELECT)
-            self._game_went_through = False  # Reset flag
-            self._champ_select_notification_sent = False  # Reset notification flag
-            
+            self._enter_champ_select()
+
             # CRITICAL FIX: Fetch current champ select session immediately
             # This captures any picks/bans that happened before we started monitoring
             # (e.g., starting app mid-champion select, or bot games with pre-selected champions)
@@ -369,6 +544,119 @@ class LCUMonitor(QObject):
         elif new_phase in [self.PHASE_END_GAME, self.PHASE_PRE_END_GAME]:
             logger.debug(f"Post-game phase: {new_phase}")
 
+    def _enter_champ_select(self):
+        self._set_state(MonitorState.MONITORING_CHAMP_SELECT)
+        self._game_went_through = False  # Reset flag
+        self._champ_select_notification_sent = False  # Reset notification flag
+
+    async def _get_json(self, connection, uri: str) -> Any:
+        """GET an LCU endpoint; None when it has no data (404) or the request fails"""
+        response = await connection.request('get', uri)
+        if response.status != 200:
+            return None
+        # Handle both aiohttp ClientResponse and lcu-driver wrapped responses
+        try:
+            return await response.json()
+        except (AttributeError, TypeError):
+            return getattr(response, 'data', None)
+
+    async def _warm_up(self):
+        """Load champion names off the loop and open the transmitter's connection"""
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(
+            loop.run_in_executor(None, self.champion_mapper.get_name_map),
+            self.data_transmitter.warm_up(),
+        )
+
+    @traced("bootstrap")
+    async def _bootstrap(self, connection):
+        """
+        Fetch gameflow, lobby and the champ select session concurrently while
+        warming the champion mapper and transmitter, then apply them together.
+        WebSocket events that arrive meanwhile are newer, so their parts win.
+        """
+        phase_before, draft_before = self.current_phase, self._last_raw_draft_data
+        start = time.perf_counter()
+        phase, lobby, session, warm_up = await asyncio.gather(
+            self._get_json(connection, self.GAMEFLOW_URL),
+            self._get_json(connection, self.LOBBY_URL),
+            self._get_json(connection, self.CHAMP_SELECT_URL),
+            self._warm_up(),
+            return_exceptions=True,
+        )
+        logger.info(f"Initial state fetched in {(time.perf_counter() - start) * 1000:.0f} ms")
+        for name, result in (("gameflow", phase), ("lobby", lobby), ("champ select", session), ("warm-up", warm_up)):
+            if isinstance(result, Exception):
+                logger.warning(f"Could not get initial {name}: {result}")
+
+        # Apply without yielding to the loop until the state machine is consistent
+        if isinstance(lobby, dict) and self.state == MonitorState.IDLE and 'gameId' in lobby:
+            self.current_lobby_id = str(lobby['gameId'])
+        if isinstance(phase, str) and self.current_phase == phase_before:
+            phase = phase.strip('"')
+            logger.info(f"Initial gameflow phase: {phase}")
+            if phase == self.PHASE_CHAMP_SELECT and phase != self.current_phase:
+                # The session is already here; don't fetch it again
+                logger.info(f"Gameflow: {self.current_phase} → {phase}")
+                self.current_phase = phase
+                self._enter_champ_select()
+                if isinstance(session, dict):
+                    self._resume_from_checkpoint(session)
+            else:
+                await self._process_gameflow_phase(phase)
+
+        # Picks made before the client started go out with the first draft
+        if (isinstance(session, dict) and self.state == MonitorState.MONITORING_CHAMP_SELECT
+                and self._last_raw_draft_data is draft_before):
+            with self.tracer.trace("champ_select_update", lobby=self.current_lobby_id, phase="bootstrap"):
+                await self._process_champ_select_data(session)
+
+    def _save_checkpoint(self):
+        """Persist what a restart would need to continue this draft"""
+        draft = self.last_draft_data
+        self.checkpoint.save({
+            "lobby_id": self.current_lobby_id,
+            "workspace_id": self.workspace_id,
+            "notification_sent": self._champ_select_notification_sent,
+            "action_timestamps": {str(a): t for a, t in self._action_timestamps.items()},
+            "initial_picks": {str(cell): champion for cell, champion in self._initial_picks.items()},
+            "draft": {
+                "phase": draft.phase,
+                "blue": {"picks": draft.blue_side.picks, "bans": draft.blue_side.bans},
+                "red": {"picks": draft.red_side.picks, "bans": draft.red_side.bans},
+            } if draft else None,
+        })
+
+    def _resume_from_checkpoint(self, session: Dict[str, Any]) -> bool:
+        """Continue a draft from before a restart if the client reports the same game"""
+        saved = self.checkpoint.load()
+        if not saved:
+            return False
+        lobby_id = self.current_lobby_id or str(session.get('gameId', ''))
+        if saved["lobby_id"] != lobby_id or saved.get("workspace_id") != self.workspace_id:
+            logger.debug(f"[CHECKPOINT] Saved lobby {saved['lobby_id']} is not the current game, discarding")
+            self.checkpoint.clear()
+            return False
+
+        self.current_lobby_id = lobby_id
+        self._champ_select_notification_sent = saved.get("notification_sent", False)
+        self._action_timestamps = {int(a): t for a, t in saved["action_timestamps"].items()}
+        self._initial_picks = {int(cell): champion for cell, champion in saved["initial_picks"].items()}
+        draft = saved.get("draft")
+        if draft:
+            # The server already has this lobby's document: further drafts are updates, not a new game
+            self.last_draft_data = DraftData(
+                lobby_id=lobby_id, workspace_id=self.workspace_id, phase=draft["phase"],
+                blue_side=TeamData(picks=draft["blue"]["picks"], bans=draft["blue"]["bans"]),
+                red_side=TeamData(picks=draft["red"]["picks"], bans=draft["red"]["bans"]),
+            )
+        # Send the current session once even if unchanged: the last queued draft may never have gone out
+        self._last_raw_draft_data = None
+        logger.info(f"[CHECKPOINT] Resumed draft for lobby {lobby_id} "
+                    f"({len(self._action_timestamps)} actions, {len(self._initial_picks)} picks)")
+        self.recorder.record("lobby", "resumed lobby %s from checkpoint", lobby_id)
+        return True
+
     async def _handle_none_phase(self, old_phase: Optional[str]):
         """Handle transition to NONE phase (game ended or client in limbo)"""
         if self.state == MonitorState.MONITORING_CHAMP_SELECT:
@@ -434,16 +722,25 @@ class LCUMonitor(QObject):
         self._game_went_through = False
         self._champ_select_notification_sent = False
         
-        # Clear action timestamps
+        # Clear action timestamps and the session clock
         self._action_timestamps.clear()
+        self._session_clock_offset = None
+        self._session_timer_stamp = None
         
         # Clear initial picks
         self._initial_picks.clear()
 
+        # Clear cached action events
+        self._action_events.clear()
+
         # Clear blocked lobbies in transmitter to prevent memory growth
         # and allow reuse of lobby IDs if needed
         self.data_transmitter.clear_blocked_lobbies()
 
+        # The draft is over; nothing to resume after a restart
+        self.checkpoint.clear()
+        self.draft_changed.emit(None)
+
         logger.debug("Draft state reset")
 
     async def _fetch_current_champ_select_session(self):
@@ -502,6 +799,7 @@ class LCUMonitor(QObject):
         except Exception as e:
             logger.error(f"Error processing lobby data: {e}")
 
+    @traced("process_champ_select_data")
     async def _process_champ_select_data(self, champ_select_data: Dict[str, Any]):
         """Process champion select session data - only called in MONITORING state"""
         try:
@@ -510,6 +808,7 @@ class LCUMonitor(QObject):
             # GUARD: Must be in monitoring state
             if self.state != MonitorState.MONITORING_CHAMP_SELECT:
                 logger.debug(f"[GUARD_FAIL] Not in monitoring state, current: {self.state.value}")
+                self.recorder.record("guard", "not monitoring (state %s)", self.state.value)
                 return
 
             # GUARD: Must have valid lobby_id (not None, empty, or "UNKNOWN")
@@ -520,25 +819,30 @@ class LCUMonitor(QObject):
                     # Validate extracted lobby_id is not UNKNOWN
                     if extracted_lobby_id.strip().upper() == "UNKNOWN":
                         logger.warning(f"[GUARD_FAIL] Extracted lobby_id is UNKNOWN, skipping")
+                        self.recorder.record("guard", "extracted lobby_id is UNKNOWN")
                         return
                     self.current_lobby_id = extracted_lobby_id
                     logger.info(f"[LOBBY_ID_SET] Set lobby_id from champ select: {self.current_lobby_id}")
+                    self.recorder.record("lobby", "lobby_id set from champ select: %s", self.current_lobby_id)
                     # Send notification now that we have the lobby ID
                     if not self._champ_select_notification_sent:
                         self.notifier.on_champ_select_started(self.current_lobby_id)
                         self._champ_select_notification_sent = True
                 else:
                     logger.warning("[GUARD_FAIL] No lobby_id available, skipping champ select data")
+                    self.recorder.record("guard", "no lobby_id available")
                     return
 
             # GUARD: Must have workspace_id
             if not self.workspace_id:
                 logger.warning("[GUARD_FAIL] No workspace_id configured, skipping")
+                self.recorder.record("guard", "no workspace_id configured")
                 return
 
             # GUARD: Validate champ select data isn't empty/stale
             if not self._is_valid_champ_select_data(champ_select_data):
                 logger.debug("[GUARD_FAIL] Invalid or empty champ select data, skipping")
+                self.recorder.record("guard", "invalid or empty champ select data")
                 return
 
             # Log raw team data for debugging
@@ -553,7 +857,9 @@ class LCUMonitor(QObject):
                 logger.debug(f"[THEIR_TEAM] cellId={player.get('cellId')}, champId={player.get('championId')}, team={player.get('team')}")
 
             # Extract draft data
+            extraction_start = time.perf_counter()
             draft_data = self._extract_draft_data(champ_select_data)
+            self._m_extraction_seconds.observe(time.perf_counter() - extraction_start)
 
             if draft_data:
                 # Log extracted data
@@ -564,46 +870,58 @@ class LCUMonitor(QObject):
                 # CRITICAL FIX: Reject ghost documents (no picks or bans)
                 if not draft_data.has_meaningful_data():
                     logger.debug(f"[GUARD_FAIL] Draft has no picks or bans - ghost document rejected for lobby {self.current_lobby_id}")
+                    self.recorder.record("guard", "ghost document rejected for lobby %s", self.current_lobby_id)
                     return
                 
-                # CRITICAL FIX: Compare using raw ID-based data (not converted names)
-                # This prevents the bug where names are compared against IDs
+                # Drafts keep champion IDs; names are only resolved in to_dict()
                 has_changes, change_details = self._has_draft_changes_detailed(draft_data)
                 
                 if has_changes:
                     logger.info(f"[CHANGE_DETECTED] {change_details}")
+                    # Team lists are never mutated after extraction, so recording them is free
+                    self.recorder.record(
+                        "change", "lobby %s phase %s: %s | blue picks %s bans %s | red picks %s bans %s",
+                        self.current_lobby_id, draft_data.phase, change_details,
+                        draft_data.blue_side.picks, draft_data.blue_side.bans,
+                        draft_data.red_side.picks, draft_data.red_side.bans,
+                    )
 
-                    # Store the raw ID-based data for future comparison
-                    import copy
-                    self._last_raw_draft_data = copy.deepcopy(draft_data)
+                    # Store the draft for future comparison - no copy needed, it is never mutated
+                    self._last_raw_draft_data = draft_data
 
-                    # Convert champion IDs to names
-                    self.champion_mapper.update_draft_with_names(draft_data)
                     draft_data.update_hash()
                     
                     logger.debug(f"[HASH] New hash: {draft_data.data_hash}")
                     if self.last_draft_data:
                         logger.debug(f"[HASH] Old hash: {self.last_draft_data.data_hash}")
 
-                    # Queue for transmission
+                    # Queue for transmission; the trace travels with the draft
+                    draft_data.trace = self.tracer.current()
                     success = await self.data_transmitter.queue_draft_data(draft_data)
 
                     if success:
                         pick_count = len(draft_data.blue_side.picks) + len(draft_data.red_side.picks)
                         ban_count = len(draft_data.blue_side.bans) + len(draft_data.red_side.bans)
                         logger.info(f"[TRANSMIT_QUEUED] Picks: {pick_count}, Bans: {ban_count} for lobby {self.current_lobby_id}")
+                        self.recorder.record("queued", "lobby %s: %d picks, %d bans", self.current_lobby_id, pick_count, ban_count)
                         self.notifier.on_draft_saved(self.current_lobby_id, pick_count, ban_count)
                         self.last_draft_data = draft_data
+                        self.draft_changed.emit(draft_data)
+                        self._save_checkpoint()
                     else:
                         logger.warning(f"[TRANSMIT_FAIL] Failed to queue draft data for lobby {self.current_lobby_id}")
+                        self.recorder.record("queue_fail", "lobby %s", self.current_lobby_id)
                 else:
                     logger.debug(f"[NO_CHANGE] No meaningful draft changes for lobby {self.current_lobby_id}")
+                    self.recorder.record("no_change", "lobby %s", self.current_lobby_id)
             else:
                 logger.warning("[EXTRACTION_FAIL] Failed to extract draft data from champ select session")
+                self.recorder.record("guard", "failed to extract draft data")
 
         except Exception as e:
             logger.error(f"[ERROR] Error processing champ select data: {e}", exc_info=True)
 
+    @traced("detect_draft_changes")
     def _has_draft_changes_detailed(self, new_draft: DraftData) -> tuple[bool, str]:
         """Check if draft data has changed with detailed reason"""
         monitoring_settings = self.config_manager.get_monitoring_settings()
@@ -611,7 +929,6 @@ class LCUMonitor(QObject):
         if not monitoring_settings.get("enable_change_detection", True):
             return True, "Change detection disabled"
 
-        # CRITICAL FIX: Use _last_raw_draft_data (ID-based) for comparison
         if not self._last_raw_draft_data:
             return True, "No previous data (first transmission)"
 
@@ -673,6 +990,7 @@ class LCUMonitor(QObject):
 
         return has_completed_actions or has_valid_phase
 
+    @traced("extract_draft_data")
     def _extract_draft_data(self, session_data: Dict[str, Any]) -> Optional[DraftData]:
         """Extract draft data from champ select session using chronological actions"""
         try:
@@ -680,7 +998,8 @@ class LCUMonitor(QObject):
             draft_data = DraftData(
                 lobby_id=self.current_lobby_id,
                 workspace_id=self.workspace_id,
-                phase=self._get_champ_select_phase(session_data)
+                phase=self._get_champ_select_phase(session_data),
+                champion_names=self.champion_mapper.get_name_map()
             )
 
             # Build a reliable cell -> team map to avoid perspective bugs
@@ -698,7 +1017,7 @@ class LCUMonitor(QObject):
             # Extract actions chronologically to ensure strict pick/ban ordering and stable timestamps
             actions = session_data.get('actions', [])
             
-            extracted = self._extract_completed_actions_chronological(actions, cell_to_team)
+            extracted = self._extract_completed_actions_chronological(actions, cell_to_team, self._session_now_ms(session_data))
             
             # Set team data
             draft_data.blue_side.picks = extracted['blue_picks']
@@ -720,7 +1039,30 @@ class LCUMonitor(QObject):
             logger.error(f"Error extracting draft data: {e}")
             return None
 
-    def _extract_completed_actions_chronological(self, actions: List[List[Dict[str, Any]]], cell_to_team: Dict[int, int]) -> Dict[str, Any]:
+    def _session_now_ms(self, session_data: Dict[str, Any]) -> int:
+        """
+        LCU time of a session snapshot in epoch ms.
+        The client stamps timer.internalNowInEpochMs together with
+        adjustedTimeLeftInPhase: it is the moment the time left was computed,
+        which is what overlays count the phase timer down from. A snapshot with
+        a new stamp is as recent as the stamp, so processing delays don't move
+        the time. A snapshot repeating the previous stamp (an update that didn't
+        touch the timer) is later than it: the time since the stamp was first
+        seen is added from the local monotonic clock. Snapshots without a stamp
+        use the local clock on the same offset.
+        """
+        now_monotonic = time.monotonic_ns() // 1_000_000
+        internal_now = (session_data.get('timer') or {}).get('internalNowInEpochMs')
+        if isinstance(internal_now, int) and internal_now > 0 and internal_now != self._session_timer_stamp:
+            self._session_timer_stamp = internal_now
+            self._session_clock_offset = internal_now - now_monotonic
+            return internal_now
+        if self._session_clock_offset is None:
+            self._session_clock_offset = epoch_ms() - now_monotonic
+        return now_monotonic + self._session_clock_offset
+
+    def _extract_completed_actions_chronological(self, actions: List[List[Dict[str, Any]]], cell_to_team: Dict[int, int],
+                                                 now_ms: int) -> Dict[str, Any]:
         """Extract firmly locked picks and bans strictly by their chronological action phase."""
         result = {
             'blue_picks': [], 'red_picks': [],
@@ -744,13 +1086,11 @@ class LCUMonitor(QObject):
                     champion_id = action.get('championId', 0)
                     actor_cell_id = action.get('actorCellId')
                     
-                    # Stable timestamp generator based on action ID
+                    # Stable timestamp per action ID: the snapshot time when it was first seen completed
                     if action_id is not None:
-                        if action_id not in self._action_timestamps:
-                            self._action_timestamps[action_id] = datetime.now()
-                        event_timestamp = self._action_timestamps[action_id]
+                        event_timestamp = self._action_timestamps.setdefault(action_id, now_ms)
                     else:
-                        event_timestamp = datetime.now()
+                        event_timestamp = now_ms
                         
                     # Rely on true team association (1=Blue, 2=Red) instead of player perspective
                     team_id = cell_to_team.get(actor_cell_id, 0)
@@ -762,48 +1102,45 @@ class LCUMonitor(QObject):
                         continue
                         
                     # CRITICAL: Prevent swaps from overriding original pick entirely
-                    champion_str = "None"
+                    champ_id = NO_CHAMPION
                     if action_type == 'pick':
                         # If this cell already picked a champion previously, ignore the current action's champion
                         if actor_cell_id in self._initial_picks:
-                            champion_str = self._initial_picks[actor_cell_id]
-                        else:
+                            champ_id = self._initial_picks[actor_cell_id]
+                        elif champion_id > 0:
                             # If it's the first time they locked in a valid champion
-                            if champion_id > 0:
-                                champion_str = str(champion_id)
-                                self._initial_picks[actor_cell_id] = champion_str
-                            else:
-                                champion_str = "None"
-                    else:
-                        champion_str = str(champion_id) if champion_id > 0 else "None"
+                            champ_id = champion_id
+                            self._initial_picks[actor_cell_id] = champ_id
+                    elif champion_id > 0:
+                        champ_id = champion_id
                     
                     if action_type == 'ban':
                         if is_blue:
                             blue_ban_order += 1
-                            result['blue_bans'].append(champion_str)
-                            result['blue_ban_events'].append(ChampionEvent(
-                                champion_id=champion_str, order=blue_ban_order, timestamp=event_timestamp
+                            result['blue_bans'].append(champ_id)
+                            result['blue_ban_events'].append(self._get_action_event(
+                                action_id, champ_id, blue_ban_order, event_timestamp
                             ))
                         else:
                             red_ban_order += 1
-                            result['red_bans'].append(champion_str)
-                            result['red_ban_events'].append(ChampionEvent(
-                                champion_id=champion_str, order=red_ban_order, timestamp=event_timestamp
+                            result['red_bans'].append(champ_id)
+                            result['red_ban_events'].append(self._get_action_event(
+                                action_id, champ_id, red_ban_order, event_timestamp
                             ))
                     elif action_type == 'pick':
                         # Empty picks (championId <= 0) mean they haven't picked yet
-                        if champion_str != "None":
+                        if champ_id != NO_CHAMPION:
                             if is_blue:
                                 blue_pick_order += 1
-                                result['blue_picks'].append(champion_str)
-                                result['blue_pick_events'].append(ChampionEvent(
-                                    champion_id=champion_str, order=blue_pick_order, timestamp=event_timestamp
+                                result['blue_picks'].append(champ_id)
+                                result['blue_pick_events'].append(self._get_action_event(
+                                    action_id, champ_id, blue_pick_order, event_timestamp
                                 ))
                             else:
                                 red_pick_order += 1
-                                result['red_picks'].append(champion_str)
-                                result['red_pick_events'].append(ChampionEvent(
-                                    champion_id=champion_str, order=red_pick_order, timestamp=event_timestamp
+                                result['red_picks'].append(champ_id)
+                                result['red_pick_events'].append(self._get_action_event(
+                                    action_id, champ_id, red_pick_order, event_timestamp
                                 ))
                                 
         except Exception as e:
@@ -811,6 +1148,15 @@ class LCUMonitor(QObject):
 
         return result
 
+    def _get_action_event(self, action_id: Optional[int], champion_id: int, order: int, timestamp: int) -> ChampionEvent:
+        """Return the cached event for an action, creating it when the action is new or changed"""
+        event = self._action_events.get(action_id) if action_id is not None else None
+        if event is None or event.champion_id != champion_id or event.order != order:
+            event = ChampionEvent(champion_id=champion_id, order=order, timestamp=timestamp)
+            if action_id is not None:
+                self._action_events[action_id] = event
+        return event
+
     def _extract_team_data(self, team_data: List[Dict[str, Any]]) -> TeamData:
         """Extract team data from LCU format (fallback method)"""
         team = TeamData()
@@ -825,25 +1171,23 @@ class LCUMonitor(QObject):
             assigned_position = player.get('assignedPosition')
 
             if champion_id > 0:
-                champion_name = str(champion_id)  # Will be converted to name later
-
                 # Check if this is a ban (simplified logic - LCU bans are complex)
                 # Bans typically have assignedPosition as 'none' or specific ban positions
                 is_ban = assigned_position == 'none' or cell_id >= 10  # Rough heuristic
 
                 if is_ban:
-                    ban_data.append((champion_name, cell_id))
+                    ban_data.append((champion_id, cell_id))
                 else:
-                    pick_data.append((champion_name, cell_id))
+                    pick_data.append((champion_id, cell_id))
 
         # Sort picks by cell ID (0-4 order for standard 5v5)
         pick_data.sort(key=lambda x: x[1])
         team.picks = [pick[0] for pick in pick_data]
 
         # Create pick events with order
-        from datetime import datetime
+        now = epoch_ms()
         team.pick_events = [
-            ChampionEvent(champion_id=pick[0], order=i + 1, timestamp=datetime.now())
+            ChampionEvent(champion_id=pick[0], order=i + 1, timestamp=now)
             for i, pick in enumerate(pick_data)
         ]
 
@@ -853,7 +1197,7 @@ class LCUMonitor(QObject):
 
         # Create ban events with order
         team.ban_events = [
-            ChampionEvent(champion_id=ban[0], order=i + 1, timestamp=datetime.now())
+            ChampionEvent(champion_id=ban[0], order=i + 1, timestamp=now)
             for i, ban in enumerate(ban_data)
         ]
 
@@ -898,14 +1242,22 @@ class LCUMonitor(QObject):
             "workspace_id": self.workspace_id,
             "last_draft_hash": self.last_draft_data.data_hash if self.last_draft_data else None,
             "game_went_through": self._game_went_through,
-            "queue_size": self.data_transmitter.get_queue_size()
+            "queue_size": self.data_transmitter.get_queue_size(),
+            "loop_lag": self.loop_watchdog.get_stats(),
+            "rest_polling": self.rest_poller.get_stats(),
+            "notification_subscribers": self.notifier.bus.get_stats(),
+            "live_server": self.live_server.get_stats() if self.live_server else None,
+            "metrics": self.metrics.snapshot() if self.metrics.enabled else {}
         }
 
 
-# Global instance
-_lcu_monitor = LCUMonitor()
+# Global instance, created on first use
+_lcu_monitor: Optional[LCUMonitor] = None
 
 
 def get_lcu_monitor() -> LCUMonitor:
     """Get the global LCU monitor instance"""
+    global _lcu_monitor
+    if _lcu_monitor is None:
+        _lcu_monitor = LCUMonitor()
     return _lcu_monitor
@@ -1,17 +1,44 @@
+import os
+import json
 import psutil
 import logging
+import threading
 from dataclasses import dataclass
-from typing import List
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    from .config_manager import get_config_manager
+except ImportError:
+    from config_manager import get_config_manager
 
 logger = logging.getLogger(__name__)
 
+LOCKFILE_NAME = "lockfile"
+
+# Standard install locations checked before any process scan
+DEFAULT_INSTALL_DIRS = [
+    r"C:\Riot Games\League of Legends",
+    r"C:\Riot Games\League of Legends (PBE)",
+    "/Applications/League of Legends.app/Contents/LoL",
+]
+
+# Install directories discovered by process scans, kept for later runs in their own state file
+# (settings.json is the user's, and is re-read on the loop thread while scans run on a worker)
+INSTALL_DIRS_STATE = "state/install_dirs.json"
+_seen_install_dirs: Set[str] = set()
+_seen_loaded = False
+_seen_lock = threading.Lock()
+
+
 @dataclass
 class LCUSession:
     port: int
     auth_token: str
     install_dir: str
-    pid: int
-    
+    pid: int  # LeagueClient (app) process ID, as written in the lockfile
+    protocol: str = "https"
+
     @property
     def display_name(self) -> str:
         # A simple heuristic based on the installation folder.
@@ -22,10 +49,146 @@ class LCUSession:
             return f"Tournament Realm (PID {self.pid})"
         return f"League of Legends Live (PID {self.pid})"
 
-def get_active_lcu_sessions() -> List[LCUSession]:
+    @property
+    def connection_string(self) -> str:
+        """Lockfile-style string accepted by lcu_driver's Connection"""
+        return f"{self.pid}:{self.pid}:{self.port}:{self.auth_token}"
+
+
+@dataclass
+class Lockfile:
+    """Contents of the League client lockfile (name:pid:port:password:protocol)"""
+    name: str
+    pid: int
+    port: int
+    password: str
+    protocol: str
+
+
+def parse_lockfile(content: str) -> Optional[Lockfile]:
+    """Parse lockfile contents, returning None if malformed"""
+    parts = content.strip().split(":")
+    if len(parts) != 5:
+        return None
+
+    name, pid, port, password, protocol = parts
+    try:
+        return Lockfile(name=name, pid=int(pid), port=int(port), password=password, protocol=protocol)
+    except ValueError:
+        return None
+
+
+def read_lockfile(install_dir: str) -> Optional[Lockfile]:
+    """Read and parse the lockfile in an install directory"""
+    try:
+        with open(os.path.join(install_dir, LOCKFILE_NAME), "r", encoding="utf-8") as f:
+            return parse_lockfile(f.read())
+    except OSError:
+        return None
+
+
+def _is_lockfile_process_alive(lockfile: Lockfile) -> bool:
+    """Check the lockfile's PID belongs to a running client (lockfiles can be stale after a crash)"""
+    try:
+        process = psutil.Process(lockfile.pid)
+        if process.status() == psutil.STATUS_ZOMBIE:
+            return False
+        return process.name().lower().startswith(lockfile.name.lower())
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return False
+
+
+def _install_dirs_path() -> Path:
+    return get_config_manager().config_dir.parent / INSTALL_DIRS_STATE
+
+
+def _load_seen_install_dirs() -> None:
+    """Read the directories remembered by earlier runs (once per run)"""
+    global _seen_loaded
+    if _seen_loaded:
+        return
+    path = _install_dirs_path()
+    with _seen_lock:
+        if _seen_loaded:
+            return
+        _seen_loaded = True
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _seen_install_dirs.update(d for d in json.load(f) if isinstance(d, str) and d)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable install directory state {path}: {e}")
+
+
+def get_known_install_dirs() -> List[str]:
+    """Default, configured and previously seen install directories, without duplicates"""
+    configured = get_config_manager().get_lcu_settings().get("install_directories", [])
+    _load_seen_install_dirs()
+    with _seen_lock:
+        seen = sorted(_seen_install_dirs)
+
+    dirs = []
+    for install_dir in [*DEFAULT_INSTALL_DIRS, *configured, *seen]:
+        if install_dir and install_dir not in dirs:
+            dirs.append(install_dir)
+    return dirs
+
+
+def remember_install_dir(install_dir: str) -> None:
+    """Record an install directory so its lockfile is checked on later scans (also after a restart)"""
+    if not install_dir or install_dir in DEFAULT_INSTALL_DIRS:
+        return
+    _load_seen_install_dirs()
+    path = _install_dirs_path()
+    with _seen_lock:
+        if install_dir in _seen_install_dirs:
+            return
+        _seen_install_dirs.add(install_dir)
+        dirs = sorted(_seen_install_dirs)
+
+        # Atomic replace, so a reader never sees a half-written file
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(dirs, f, indent=2)
+            os.replace(temporary, path)
+            logger.debug(f"Remembered LCU install directory: {install_dir}")
+        except OSError as e:
+            logger.warning(f"Could not save install directories to {path}: {e}")
+
+
+def get_lockfile_sessions(install_dirs: Iterable[str]) -> List[LCUSession]:
+    """Build sessions from lockfiles in the given install directories with live PIDs"""
+    sessions = []
+    seen_pids = set()
+
+    for install_dir in install_dirs:
+        lockfile = read_lockfile(install_dir)
+        if not lockfile or lockfile.pid in seen_pids:
+            continue
+
+        if not _is_lockfile_process_alive(lockfile):
+            logger.debug(f"Ignoring stale lockfile in {install_dir} (PID {lockfile.pid})")
+            continue
+
+        seen_pids.add(lockfile.pid)
+        sessions.append(LCUSession(
+            port=lockfile.port,
+            auth_token=lockfile.password,
+            install_dir=install_dir,
+            pid=lockfile.pid,
+            protocol=lockfile.protocol
+        ))
+
+    return sessions
+
+
+def get_process_sessions() -> List[LCUSession]:
     """Scans running processes and returns a list of active LCU sessions."""
     sessions = []
-    
+
     for proc in psutil.process_iter(['name', 'cmdline', 'exe']):
         try:
             name = proc.info.get('name')
@@ -33,22 +196,38 @@ def get_active_lcu_sessions() -> List[LCUSession]:
                 cmdline = proc.info.get('cmdline') or []
                 port = None
                 auth_token = None
-                install_dir = proc.info.get('exe') or ""
-                
+                app_pid = None
+                exe = proc.info.get('exe') or ""
+                install_dir = os.path.dirname(exe)
+
                 for arg in cmdline:
                     if arg.startswith('--app-port='):
                         port = int(arg.split('=', 1)[1])
                     elif arg.startswith('--remoting-auth-token='):
                         auth_token = arg.split('=', 1)[1]
-                
+                    elif arg.startswith('--app-pid='):
+                        app_pid = int(arg.split('=', 1)[1])
+                    elif arg.startswith('--install-directory='):
+                        install_dir = arg.split('=', 1)[1]
+
                 if port and auth_token:
+                    remember_install_dir(install_dir)
                     sessions.append(LCUSession(
                         port=port,
                         auth_token=auth_token,
                         install_dir=install_dir,
-                        pid=proc.pid
+                        pid=app_pid or proc.pid
                     ))
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
-            
+
     return sessions
+
+
+def merge_sessions(*results: Iterable[LCUSession]) -> List[LCUSession]:
+    """Combine scan results by PID; the first result listing a PID wins"""
+    merged: Dict[int, LCUSession] = {}
+    for sessions in results:
+        for session in sessions:
+            merged.setdefault(session.pid, session)
+    return list(merged.values())
@@ -0,0 +1,187 @@
+"""
+Live draft broadcast on the local network.
+Serves the monitored draft straight from the client, so a coach's screen on
+the same LAN updates without waiting for Netlify and Firestore (which stay
+the durable path). Every message body is the transmission payload, the same
+JSON shape as DraftData.to_dict(), or null once the draft is over.
+- GET /draft   current snapshot
+- GET /events  Server-Sent Events, one "draft" event per change
+- GET /ws      WebSocket, one text message per change
+Viewers get the snapshot as soon as they connect. Each change is encoded once
+and handed to every viewer as its latest pending message: a slow viewer skips
+intermediate drafts instead of holding up the others or growing a queue.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from aiohttp import web, WSMsgType
+
+logger = logging.getLogger(__name__)
+
+NO_DRAFT = b"null"
+KEEPALIVE_SECONDS = 15  # SSE comment interval, keeps proxies and idle timeouts from closing the stream
+
+_CORS = {"Access-Control-Allow-Origin": "*"}  # The web app is served from another origin
+
+
+class _Viewer:
+    """One connected viewer: the newest payload it has not been sent yet"""
+
+    __slots__ = ("pending", "ready")
+
+    def __init__(self, snapshot: bytes):
+        self.pending = snapshot
+        self.ready = asyncio.Event()
+        self.ready.set()
+
+    def offer(self, payload: bytes) -> None:
+        self.pending = payload
+        self.ready.set()
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """The latest payload, or None if nothing changed within the timeout"""
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self.ready.clear()
+        return self.pending
+
+
+class LiveDraftServer:
+    """HTTP server broadcasting draft changes over SSE and WebSocket on the running event loop"""
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8765, max_viewers: int = 200):
+        self.host = host
+        self.port = port
+        self.max_viewers = max_viewers
+        self.stats = {"published": 0, "viewers_served": 0, "rejected": 0}
+        self._snapshot = NO_DRAFT
+        self._viewers: Set[_Viewer] = set()
+        self._sockets: Set[web.WebSocketResponse] = set()
+        self._runner: Optional[web.AppRunner] = None
+        self._closing = False
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "LiveDraftServer":
+        return cls(
+            host=settings.get("host", "0.0.0.0"),
+            port=settings.get("port", 8765),
+            max_viewers=settings.get("max_viewers", 200),
+        )
+
+    async def start(self) -> None:
+        if self._runner:
+            return
+        app = web.Application()
+        app.router.add_get("/draft", self._draft)
+        app.router.add_get("/events", self._events)
+        app.router.add_get("/ws", self._websocket)
+        self._closing = False
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"Live draft server listening on http://{self.host}:{self.port} (/events, /ws, /draft)")
+
+    async def stop(self) -> None:
+        if not self._runner:
+            return
+        # Let the streaming handlers return, so cleanup doesn't wait on them
+        self._closing = True
+        for viewer in self._viewers:
+            viewer.ready.set()
+        for ws in list(self._sockets):
+            await ws.close()
+        await self._runner.cleanup()
+        self._runner = None
+
+    @property
+    def viewer_count(self) -> int:
+        return len(self._viewers)
+
+    def publish(self, draft_data) -> None:
+        """Broadcast a draft (None once it is over); called on the monitor loop for every change"""
+        payload = draft_data.to_json_bytes() if draft_data is not None else NO_DRAFT
+        if payload == self._snapshot:
+            return
+        self._snapshot = payload
+        self.stats["published"] += 1
+        for viewer in self._viewers:
+            viewer.offer(payload)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, viewers=self.viewer_count)
+
+    # --- Handlers ---
+
+    async def _draft(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._snapshot, content_type="application/json", headers=_CORS)
+
+    def _admit(self) -> Optional[_Viewer]:
+        if len(self._viewers) >= self.max_viewers:
+            self.stats["rejected"] += 1
+            return None
+        viewer = _Viewer(self._snapshot)
+        self._viewers.add(viewer)
+        self.stats["viewers_served"] += 1
+        return viewer
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        viewer = self._admit()
+        if viewer is None:
+            return web.Response(status=503, text="Too many viewers", headers=_CORS)
+        response = web.StreamResponse(headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            **_CORS,
+        })
+        try:
+            await response.prepare(request)
+            while not self._closing:
+                payload = await viewer.next(timeout=KEEPALIVE_SECONDS)
+                if self._closing:
+                    break
+                if payload is None:
+                    await response.write(b": keepalive\n\n")
+                else:
+                    await response.write(b"event: draft\ndata: " + payload + b"\n\n")
+        except ConnectionError:
+            pass  # The viewer went away
+        finally:
+            self._viewers.discard(viewer)
+        return response
+
+    async def _websocket(self, request: web.Request) -> web.StreamResponse:
+        ws = web.WebSocketResponse(heartbeat=KEEPALIVE_SECONDS)
+        if not ws.can_prepare(request).ok:
+            return web.Response(status=400, text="WebSocket upgrade expected", headers=_CORS)
+        viewer = self._admit()
+        if viewer is None:
+            return web.Response(status=503, text="Too many viewers", headers=_CORS)
+        await ws.prepare(request)
+        self._sockets.add(ws)
+
+        async def send():
+            try:
+                while not self._closing:
+                    payload = await viewer.next()
+                    if self._closing:
+                        break
+                    await ws.send_str(payload.decode("utf-8"))
+            except ConnectionError:
+                pass  # The reader below sees the socket close
+
+        sender = asyncio.ensure_future(send())
+        try:
+            # Viewers don't send anything; reading handles pings and the close handshake
+            async for msg in ws:
+                if msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            sender.cancel()
+            self._viewers.discard(viewer)
+            self._sockets.discard(ws)
+        return ws
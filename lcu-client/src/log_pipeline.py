@@ -0,0 +1,143 @@
+"""
+Asynchronous logging pipeline.
+Log calls only enqueue the record; formatting and all handler I/O (console,
+GUI buffer, rotating log file) run on a background QueueListener thread.
+"""
+
+import os
+import gzip
+import json
+import time
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread and never blocks.
+    Records are dropped (and counted) when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge %-style args now since they may be mutated later; the rest is formatted by the listener
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as a single JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotates when the file exceeds max_bytes or is older than rotate_seconds,
+    gzip-compressing rotated files (lcu_client.log.1.gz, .2.gz, ...).
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 5,
+                 rotate_seconds: float = 0, compress: bool = True, encoding: str = "utf-8"):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        self.rotate_seconds = rotate_seconds
+        self._opened_at = self._file_start_time()
+        if compress:
+            self.namer = lambda name: name + ".gz"
+            self.rotator = self._compress
+
+    def _file_start_time(self) -> float:
+        try:
+            return os.path.getmtime(self.baseFilename) if os.path.getsize(self.baseFilename) else time.time()
+        except OSError:
+            return time.time()
+
+    @staticmethod
+    def _compress(source: str, dest: str) -> None:
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rotate_seconds and time.time() - self._opened_at >= self.rotate_seconds:
+            return os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._opened_at = time.time()
+
+
+def create_file_handler(logging_settings: Dict[str, Any], base_dir: Path) -> logging.Handler:
+    """Create the rotating log file handler described by the logging settings"""
+    log_file = Path(logging_settings.get("log_file", "lcu_client.log"))
+    if not log_file.is_absolute():
+        log_file = base_dir / log_file
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    return CompressingRotatingFileHandler(
+        str(log_file),
+        max_bytes=int(logging_settings.get("max_bytes", 5 * 1024 * 1024)),
+        backup_count=int(logging_settings.get("backup_count", 5)),
+        rotate_seconds=float(logging_settings.get("rotate_hours", 24)) * 3600,
+        compress=logging_settings.get("compress_rotated", True),
+    )
+
+
+def start_log_pipeline(level: int, handlers: List[logging.Handler],
+                       max_queue_size: int = 10000) -> logging.handlers.QueueListener:
+    """
+    Route all root logging through a bounded queue to the given handlers,
+    which then run on the listener's background thread.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+    queue_handler = DeferredQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    # Drain the queue and close files on exit
+    atexit.register(stop_log_pipeline, listener)
+    return listener
+
+
+def stop_log_pipeline(listener: Optional[logging.handlers.QueueListener]) -> None:
+    """Flush remaining records and stop the listener thread (safe to call twice)"""
+    if listener is None or listener._thread is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -0,0 +1,126 @@
+"""
+Event loop lag watchdog.
+Continuously measures how late the loop wakes a sleeping task (scheduling lag)
+and, when enabled, captures the stack of whatever keeps the loop blocked past
+a threshold from a separate thread.
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sequence"""
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoopLagWatchdog:
+    """Samples event loop lag every interval and keeps percentiles over a sliding window"""
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1,
+                 window: int = 600, capture_stacks: bool = False):
+        self.interval = interval
+        self.threshold = threshold
+        self.capture_stacks = capture_stacks
+        self.stalls = 0  # Samples at or above the threshold since start
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._stats: Dict[str, Any] = self._summarize()
+        self._summary_every = max(1, int(round(1.0 / interval)))  # Refresh percentiles about once a second
+        self._task: Optional[asyncio.Task] = None
+        self._blocking_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._reported_beat: Optional[float] = None
+
+    def start(self) -> None:
+        """Start sampling on the running event loop (no-op if already running)"""
+        if self._task and not self._task.done():
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._task = asyncio.get_event_loop().create_task(self._measure())
+
+        if self.capture_stacks:
+            self._stop_event.clear()
+            self._blocking_thread = threading.Thread(
+                target=self._watch_for_blocking, name="loop-watchdog", daemon=True
+            )
+            self._blocking_thread.start()
+
+        logger.debug(f"Loop lag watchdog started (threshold {self.threshold * 1000:.0f} ms, "
+                     f"stack capture {'on' if self.capture_stacks else 'off'})")
+
+    def stop(self) -> None:
+        """Stop sampling and the blocking-call detector"""
+        self._stop_event.set()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._blocking_thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lag percentiles in milliseconds over the sliding window (refreshed about once a second)"""
+        return dict(self._stats, stalls=self.stalls)
+
+    def _summarize(self) -> Dict[str, Any]:
+        samples = sorted(self._samples)
+        if not samples:
+            return {"samples": 0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "samples": len(samples),
+            "p50_ms": round(_percentile(samples, 0.50) * 1000, 1),
+            "p95_ms": round(_percentile(samples, 0.95) * 1000, 1),
+            "p99_ms": round(_percentile(samples, 0.99) * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1),
+        }
+
+    async def _measure(self):
+        loop = asyncio.get_event_loop()
+        since_summary = 0
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - scheduled - self.interval)
+            self._last_beat = time.monotonic()
+            self._samples.append(lag)
+
+            if lag >= self.threshold:
+                self.stalls += 1
+                logger.warning(f"[LOOP_LAG] Event loop was blocked for {lag * 1000:.0f} ms")
+
+            since_summary += 1
+            if since_summary >= self._summary_every:
+                since_summary = 0
+                # Replace rather than mutate so other threads always read a complete summary
+                self._stats = self._summarize()
+
+    def _watch_for_blocking(self):
+        """Runs on its own thread: dumps the loop thread's stack while the loop is blocked"""
+        while not self._stop_event.wait(self.threshold / 2):
+            beat = self._last_beat
+            blocked_for = time.monotonic() - beat - self.interval
+            if blocked_for < self.threshold or beat == self._reported_beat:
+                continue
+
+            # Report each stall once, with the stack as it is right now
+            self._reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(f"[LOOP_BLOCKED] Event loop blocked for {blocked_for * 1000:.0f}+ ms in:\n{stack}")
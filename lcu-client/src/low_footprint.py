@@ -0,0 +1,150 @@
+"""
+In-game low-footprint mode.
+While a game is running the client only has to notice the game ending, so the
+monitor enters this mode on the GAME_STARTED transition and leaves it once the
+gameflow phase moves past InProgress. Entering lowers the process I/O priority
+and, on Windows, its CPU priority class, pauses registered non-essential work
+(watchers, timers, log rendering), trims caches and runs one full collection
+followed by gc.freeze(), so the loading screen absorbs that cost instead of the
+collector scanning long-lived objects mid-game. Leaving restores everything.
+The CPU priority is left alone on Linux/macOS: an unprivileged process can
+raise its nice value but never lower it again, so the client would stay
+deprioritized after the first game, through every later champ select.
+"""
+
+import gc
+import re
+import sys
+import logging
+import linecache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+try:
+    from .utils.callbacks import CallbackSignal
+except ImportError:
+    from utils.callbacks import CallbackSignal
+
+logger = logging.getLogger(__name__)
+
+WINDOWS = sys.platform == "win32"
+
+
+class LowFootprintMode:
+    """Lowers priority and pauses non-essential work between enter() and exit()"""
+
+    def __init__(self, enabled: bool = True, lower_priority: bool = True, lower_io_priority: bool = True,
+                 freeze_gc: bool = True, pause_background: bool = True):
+        self.enabled = enabled
+        self.lower_priority = lower_priority
+        self.lower_io_priority = lower_io_priority
+        self.freeze_gc = freeze_gc
+        self.pause_background = pause_background
+        self.active = False
+        self.changed = CallbackSignal()  # (active) - frontends pause and resume rendering
+        self._hooks: List[Tuple[str, Callable[[], None], Optional[Callable[[], None]]]] = []
+        self._saved_nice: Optional[int] = None
+        self._saved_ionice: Any = None
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "LowFootprintMode":
+        return cls(
+            enabled=settings.get("enabled", True),
+            lower_priority=settings.get("lower_priority", True),
+            lower_io_priority=settings.get("lower_io_priority", True),
+            freeze_gc=settings.get("freeze_gc", True),
+            pause_background=settings.get("pause_background", True),
+        )
+
+    def register(self, name: str, pause: Callable[[], None], resume: Optional[Callable[[], None]] = None) -> None:
+        """Run pause on entering the mode and resume (if any) on leaving it"""
+        self._hooks.append((name, pause, resume))
+
+    def enter(self) -> None:
+        """Switch to the in-game footprint (no-op when disabled or already active)"""
+        if self.active or not self.enabled:
+            return
+        self.active = True
+
+        if self.pause_background:
+            for name, pause, _ in self._hooks:
+                try:
+                    pause()
+                except Exception as e:
+                    logger.warning(f"[LOW_FOOTPRINT] Could not pause {name}: {e}")
+
+        if self.lower_priority or self.lower_io_priority:
+            self._lower_priority()
+
+        # Pay for a full collection now, then keep the survivors out of every later collection
+        re.purge()
+        linecache.clearcache()
+        collected = gc.collect()
+        if self.freeze_gc:
+            gc.freeze()
+        logger.info(f"[LOW_FOOTPRINT] Entered for the game ({collected} objects collected, "
+                    f"{gc.get_freeze_count()} frozen)")
+        self.changed.emit(True)
+
+    def exit(self) -> None:
+        """Restore priority, resume paused work and hand frozen objects back to the collector"""
+        if not self.active:
+            return
+        self.active = False
+
+        self._restore_priority()
+        if self.freeze_gc:
+            gc.unfreeze()
+            gc.collect()
+
+        if self.pause_background:
+            for name, _, resume in reversed(self._hooks):
+                if resume is None:
+                    continue
+                try:
+                    resume()
+                except Exception as e:
+                    logger.warning(f"[LOW_FOOTPRINT] Could not resume {name}: {e}")
+
+        logger.info("[LOW_FOOTPRINT] Left, normal footprint restored")
+        self.changed.emit(False)
+
+    def _lower_priority(self) -> None:
+        process = psutil.Process()
+        # Only Windows lets the process restore its own CPU priority afterwards
+        if self.lower_priority and WINDOWS:
+            try:
+                self._saved_nice = process.nice()
+                process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+            except (psutil.Error, OSError) as e:
+                self._saved_nice = None
+                logger.debug(f"[LOW_FOOTPRINT] Could not lower CPU priority: {e}")
+
+        # ionice is not available on macOS
+        if self.lower_io_priority and hasattr(process, "ionice"):
+            try:
+                self._saved_ionice = process.ionice()
+                process.ionice(psutil.IOPRIO_LOW if WINDOWS else psutil.IOPRIO_CLASS_IDLE)
+            except (psutil.Error, OSError, ValueError) as e:
+                self._saved_ionice = None
+                logger.debug(f"[LOW_FOOTPRINT] Could not lower I/O priority: {e}")
+
+    def _restore_priority(self) -> None:
+        process = psutil.Process()
+        if self._saved_nice is not None:
+            try:
+                process.nice(self._saved_nice)
+            except (psutil.Error, OSError) as e:
+                logger.warning(f"[LOW_FOOTPRINT] Could not restore CPU priority: {e}")
+            self._saved_nice = None
+
+        if self._saved_ionice is not None:
+            try:
+                if WINDOWS:
+                    process.ionice(self._saved_ionice)
+                else:
+                    process.ionice(self._saved_ionice.ioclass, self._saved_ionice.value)
+            except (psutil.Error, OSError, ValueError) as e:
+                logger.warning(f"[LOW_FOOTPRINT] Could not restore I/O priority: {e}")
+            self._saved_ionice = None
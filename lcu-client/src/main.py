@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """
 LCU Client Desktop App - Direct monitoring of League of Legends champion select.
+Run with --headless to monitor without the Qt GUI, --profile to record a
+sampling profile and --profile-alloc to track allocations per monitor state.
 """
 
 import sys
 import logging
 import asyncio
 from pathlib import Path
-import qasync
+from typing import Optional, TYPE_CHECKING
 
 # Add src to path for imports
 script_dir = Path(__file__).parent.absolute()
@@ -15,32 +17,54 @@ if str(script_dir) not in sys.path:
     sys.path.insert(0, str(script_dir))
 
 from config_manager import get_config_manager
-from gui.app import LCUClientApp
-from gui.qt_logger import QtLogHandler
+from log_pipeline import JsonLinesFormatter, create_file_handler, start_log_pipeline
+
+# Qt is only imported on the GUI path so headless mode never loads PySide6
+if TYPE_CHECKING:
+    from gui.app import LCUClientApp
+    from gui.qt_logger import QtLogHandler
 
 logger = logging.getLogger(__name__)
 
-def setup_logging(debug: bool = False) -> QtLogHandler:
-    """Configure logging with optional debug mode and return the Qt handler"""
-    level = logging.DEBUG if debug else logging.INFO
+def setup_logging(debug: bool = False, headless: bool = False) -> Optional["QtLogHandler"]:
+    """
+    Configure logging with optional debug mode and return the Qt handler (None when headless).
+    Log calls only enqueue records; formatting, console/file I/O and the Qt
+    buffer run on a background listener thread.
+    """
+    config_manager = get_config_manager()
+    logging_settings = config_manager.get_logging_settings()
+
+    level = logging.DEBUG if debug else logging.getLevelName(str(logging_settings.get("level", "INFO")).upper())
+    if not isinstance(level, int):
+        level = logging.INFO
     format_str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    formatter = logging.Formatter(format_str)
     
     # Standard console handler
     console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
     
+    handlers = [console_handler]
+
     # Custom Qt handler
-    qt_handler = QtLogHandler()
-    formatter = logging.Formatter(format_str)
-    qt_handler.setFormatter(formatter)
-    
-    logging.basicConfig(
-        level=level,
-        format=format_str,
-        handlers=[
-            console_handler,
-            qt_handler
-        ]
-    )
+    qt_handler = None
+    if not headless:
+        from gui.qt_logger import QtLogHandler
+        qt_handler = QtLogHandler()
+        qt_handler.setFormatter(formatter)
+        handlers.append(qt_handler)
+
+    # Optional rotating log file (plain text or JSON lines)
+    if logging_settings.get("file_logging", False):
+        file_handler = create_file_handler(logging_settings, config_manager.config_dir.parent)
+        if logging_settings.get("json_format", False):
+            file_handler.setFormatter(JsonLinesFormatter())
+        else:
+            file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    start_log_pipeline(level, handlers)
     
     # Set level for specific loggers
     logging.getLogger('lcu_monitor').setLevel(level)
@@ -48,21 +72,36 @@ def setup_logging(debug: bool = False) -> QtLogHandler:
     
     return qt_handler
 
-async def main_async(app: LCUClientApp):
+async def main_async(app: "LCUClientApp"):
     app.setup_ui()
     # The qasync loop runs forever until stopped
 
 def main():
     """Main entry point for LCU Desktop App"""
     debug_mode = '--debug' in sys.argv or '-d' in sys.argv
-    qt_handler = setup_logging(debug_mode)
+    headless = '--headless' in sys.argv
+    profile = '--profile' in sys.argv
+    profile_alloc = '--profile-alloc' in sys.argv
+    qt_handler = setup_logging(debug_mode, headless=headless)
     
     # Remove CLI args so PySide doesn't complain
-    for arg in ['--debug', '-d']:
+    for arg in ['--debug', '-d', '--headless', '--profile', '--profile-alloc']:
         if arg in sys.argv:
             sys.argv.remove(arg)
+
+    # Profiles are written at exit (or from the tray menu)
+    if profile or profile_alloc:
+        from profiler import start_profiling
+        start_profiling(sampling=profile, allocations=profile_alloc)
+
+    if headless:
+        from headless import run_headless
+        return run_headless()
             
     try:
+        import qasync
+        from gui.app import LCUClientApp
+
         app = LCUClientApp(debug=debug_mode)
         
         # Connect the Qt log handler to the app's newly created UI (to be linked in app.py)
@@ -72,6 +111,9 @@ def main():
         # Setup qasync Event Loop
         loop = qasync.QEventLoop(app.app)
         asyncio.set_event_loop(loop)
+        if profile:
+            from profiler import register_loop
+            register_loop(loop)
         
         with loop:
             # Schedule the main async setup task
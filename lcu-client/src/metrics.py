@@ -0,0 +1,232 @@
+"""
+Lightweight in-process metrics.
+Counters, gauges and histograms for the monitor and transmitter hot paths,
+readable as a dict (get_status/get_stats) or in Prometheus text format from an
+optional local /metrics endpoint (metrics_server.py). When metrics are disabled
+every instrument is a shared no-op, so instrumented code pays only a method call.
+"""
+
+import logging
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .config_manager import get_config_manager
+except ImportError:
+    from config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond handlers to slow HTTP requests
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+_NO_LABEL = ""
+
+
+def _format_labels(label_name: Optional[str], label_value: str, extra: str = "") -> str:
+    parts = []
+    if label_name and label_value != _NO_LABEL:
+        escaped = label_value.replace("\\", "\\\\").replace('"', '\\"')
+        parts.append(f'{label_name}="{escaped}"')
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _NullMetric:
+    """Stand-in for every instrument while metrics are disabled"""
+
+    def inc(self, amount: float = 1, label: str = _NO_LABEL) -> None:
+        pass
+
+    def set(self, value: float, label: str = _NO_LABEL) -> None:
+        pass
+
+    def observe(self, value: float, label: str = _NO_LABEL) -> None:
+        pass
+
+
+NULL_METRIC = _NullMetric()
+
+
+class Counter:
+    """Monotonically increasing count, optionally split by a single label"""
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, label_name: Optional[str] = None):
+        self.name = name
+        self.description = description
+        self.label_name = label_name
+        self._values: Dict[str, float] = {}
+
+    def inc(self, amount: float = 1, label: str = _NO_LABEL) -> None:
+        self._values[label] = self._values.get(label, 0) + amount
+
+    def snapshot(self) -> Any:
+        values = dict(self._values)
+        if self.label_name is None:
+            return values.get(_NO_LABEL, 0)
+        return values
+
+    def render(self) -> List[str]:
+        values = dict(self._values)
+        if self.label_name is None and not values:
+            values[_NO_LABEL] = 0  # Expose unlabelled counters from the first scrape
+        return [f"{self.name}{_format_labels(self.label_name, label)} {value}"
+                for label, value in values.items()]
+
+
+class Gauge:
+    """Point-in-time value, either set directly or read from a callback at collection time"""
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str, read: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.description = description
+        self.label_name = None
+        self._read = read
+        self._value = 0.0
+
+    def set(self, value: float, label: str = _NO_LABEL) -> None:
+        self._value = value
+
+    def snapshot(self) -> float:
+        if self._read is not None:
+            try:
+                return self._read()
+            except Exception:
+                return 0.0
+        return self._value
+
+    def render(self) -> List[str]:
+        return [f"{self.name} {self.snapshot()}"]
+
+
+class _HistogramSeries:
+    __slots__ = ("bucket_counts", "count", "total", "recent")
+
+    def __init__(self, bucket_count: int, reservoir: int):
+        self.bucket_counts = [0] * (bucket_count + 1)  # Last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.recent: Deque[float] = deque(maxlen=reservoir)
+
+
+class Histogram:
+    """
+    Cumulative bucket histogram (Prometheus style), optionally split by a
+    single label. Recent observations are kept for percentile summaries.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, label_name: Optional[str] = None,
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, reservoir: int = 256):
+        self.name = name
+        self.description = description
+        self.label_name = label_name
+        self.buckets = tuple(sorted(buckets))
+        self._reservoir = reservoir
+        self._series: Dict[str, _HistogramSeries] = {}
+
+    def observe(self, value: float, label: str = _NO_LABEL) -> None:
+        series = self._series.get(label)
+        if series is None:
+            series = self._series[label] = _HistogramSeries(len(self.buckets), self._reservoir)
+        series.bucket_counts[bisect_left(self.buckets, value)] += 1
+        series.count += 1
+        series.total += value
+        series.recent.append(value)
+
+    @staticmethod
+    def _summarize(series: Optional[_HistogramSeries]) -> Dict[str, Any]:
+        if series is None:
+            return {"count": 0, "sum": 0.0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+        recent = sorted(series.recent)
+        summary: Dict[str, Any] = {
+            "count": series.count,
+            "sum": round(series.total, 6),
+            "avg_ms": round(series.total / series.count * 1000, 3),
+        }
+        for key, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            summary[key] = round(recent[min(len(recent) - 1, int(fraction * len(recent)))] * 1000, 3) if recent else 0.0
+        return summary
+
+    def snapshot(self) -> Dict[str, Any]:
+        series = dict(self._series)
+        if self.label_name is None:
+            return self._summarize(series.get(_NO_LABEL))
+        return {label: self._summarize(s) for label, s in series.items()}
+
+    def render(self) -> List[str]:
+        lines = []
+        for label, series in dict(self._series).items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), series.bucket_counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_label = f'le="{le}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_name, label, bucket_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_name, label)} {series.total}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_name, label)} {series.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Creates and collects instruments; hands out no-ops while disabled"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._metrics: Dict[str, Any] = {}
+
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str, label_name: Optional[str] = None):
+        if not self.enabled:
+            return NULL_METRIC
+        return self._register(Counter(name, description, label_name))
+
+    def gauge(self, name: str, description: str, read: Optional[Callable[[], float]] = None):
+        if not self.enabled:
+            return NULL_METRIC
+        return self._register(Gauge(name, description, read))
+
+    def histogram(self, name: str, description: str, label_name: Optional[str] = None,
+                  buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if not self.enabled:
+            return NULL_METRIC
+        return self._register(Histogram(name, description, label_name, buckets))
+
+    def snapshot(self, prefix: Union[str, Tuple[str, ...]] = "") -> Dict[str, Any]:
+        """Current values keyed by metric name (only names starting with prefix)"""
+        return {name: metric.snapshot() for name, metric in list(self._metrics.items())
+                if name.startswith(prefix)}
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for name, metric in list(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global registry, created on first use
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the global metrics registry (enabled by the metrics.enabled setting)"""
+    global _metrics
+    if _metrics is None:
+        settings = get_config_manager().get_settings().get("metrics", {})
+        _metrics = MetricsRegistry(enabled=settings.get("enabled", False))
+    return _metrics
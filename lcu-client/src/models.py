@@ -2,49 +2,127 @@
 Data models for LCU draft data processing.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Mapping, Tuple
 from datetime import datetime
 import hashlib
 import json
 
+try:
+    from .utils import json_codec
+except ImportError:
+    from utils import json_codec
 
-@dataclass
+if TYPE_CHECKING:
+    from tracing import TraceContext
+
+# __slots__ keep per-event instances small; dataclass(slots=True) needs Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Champion ID used for an empty ban (serialized as "None")
+NO_CHAMPION = 0
+NO_CHAMPION_NAME = "None"
+
+
+def epoch_ms() -> int:
+    """Current wall-clock time in integer epoch milliseconds"""
+    return time.time_ns() // 1_000_000
+
+
+def epoch_ms_to_iso(timestamp: int) -> str:
+    """Convert epoch milliseconds to a local ISO 8601 string"""
+    return datetime.fromtimestamp(timestamp / 1000).isoformat(timespec="milliseconds")
+
+
+def champion_name(champion_id: int, champion_names: Mapping[int, str]) -> Optional[str]:
+    """Resolve a champion ID to its name, "None" for empty bans, None if unknown"""
+    if champion_id == NO_CHAMPION:
+        return NO_CHAMPION_NAME
+    return champion_names.get(champion_id)
+
+
+@dataclass(**_SLOTS)
 class ChampionAction:
     """Represents a champion pick or ban action"""
-    champion_id: str
+    champion_id: int
     order: int
     actor_cell_id: Optional[int] = None
     is_ally_action: bool = True
     completed: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ChampionEvent:
-    """Represents a champion pick or ban event with timestamp"""
-    champion_id: str
+    """Represents a champion pick or ban event with an epoch milliseconds timestamp"""
+    champion_id: int  # NO_CHAMPION for an empty ban
     order: int
-    timestamp: datetime = field(default_factory=datetime.now)
-    
-    def to_dict(self) -> Dict[str, Any]:
+    timestamp: int = field(default_factory=epoch_ms)
+    # Cached (championId, encoded JSON) pair - events never change once created
+    _wire: Optional[Tuple[str, bytes]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _wire_champion_id(self, champion_names: Mapping[int, str]) -> str:
+        name = champion_name(self.champion_id, champion_names)
+        return name if name is not None else str(self.champion_id)
+
+    def to_dict(self, champion_names: Optional[Mapping[int, str]] = None) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
-            "championId": self.champion_id,
+            "championId": self._wire_champion_id(champion_names or {}),
             "order": self.order,
-            "timestamp": self.timestamp.isoformat()  # ISO format for JSON serialization
+            "timestamp": epoch_ms_to_iso(self.timestamp)  # ISO format for JSON serialization
         }
 
+    def to_json_bytes(self, champion_names: Mapping[int, str]) -> bytes:
+        """Encoded JSON for this event, cached until the resolved champion name changes"""
+        wire_id = self._wire_champion_id(champion_names)
+        cached = self._wire
+        if cached is not None and cached[0] == wire_id:
+            return cached[1]
 
-@dataclass
+        encoded = json_codec.dumps(self.to_dict(champion_names))
+        object.__setattr__(self, "_wire", (wire_id, encoded))
+        return encoded
+
+
+@dataclass(**_SLOTS)
 class TeamData:
     """Champion data for one team (blue or red side)"""
-    picks: List[str] = field(default_factory=list)  # Champion names in cell order (0-4)
-    bans: List[str] = field(default_factory=list)   # Champion names in ban order
+    picks: List[int] = field(default_factory=list)  # Champion IDs in pick order
+    bans: List[int] = field(default_factory=list)   # Champion IDs in ban order (NO_CHAMPION for empty bans)
     pick_events: List[ChampionEvent] = field(default_factory=list)  # Timestamped pick events with championId, order, timestamp
     ban_events: List[ChampionEvent] = field(default_factory=list)   # Timestamped ban events with championId, order, timestamp
 
+    def _named_picks_and_bans(self, champion_names: Mapping[int, str]) -> Tuple[List[str], List[str]]:
+        # Unknown IDs are dropped from picks/bans but kept as raw IDs in events
+        picks = [champion_names[cid] for cid in self.picks if cid in champion_names]
+        bans = [name for name in (champion_name(cid, champion_names) for cid in self.bans) if name is not None]
+        return picks, bans
 
-@dataclass
+    def to_dict(self, champion_names: Mapping[int, str]) -> Dict[str, Any]:
+        """Convert to dictionary, resolving champion IDs to names"""
+        picks, bans = self._named_picks_and_bans(champion_names)
+        return {
+            "picks": picks,
+            "bans": bans,
+            "pick_events": [e.to_dict(champion_names) for e in self.pick_events],
+            "ban_events": [e.to_dict(champion_names) for e in self.ban_events]
+        }
+
+    def to_json_bytes(self, champion_names: Mapping[int, str]) -> bytes:
+        """Encode as JSON bytes, reusing each event's cached fragment"""
+        picks, bans = self._named_picks_and_bans(champion_names)
+        return b"".join((
+            b'{"picks":', json_codec.dumps(picks),
+            b',"bans":', json_codec.dumps(bans),
+            b',"pick_events":[', b",".join(e.to_json_bytes(champion_names) for e in self.pick_events),
+            b'],"ban_events":[', b",".join(e.to_json_bytes(champion_names) for e in self.ban_events),
+            b']}'
+        ))
+
+
+@dataclass(**_SLOTS)
 class DraftData:
     """Complete draft session data"""
     lobby_id: str
@@ -54,6 +132,10 @@ class DraftData:
     blue_side: TeamData = field(default_factory=TeamData)
     red_side: TeamData = field(default_factory=TeamData)
     data_hash: str = ""
+    # Live ID -> name mapping used only when serializing (shared, never copied)
+    champion_names: Optional[Mapping[int, str]] = field(default=None, repr=False, compare=False)
+    # Trace of the champ select update that produced this draft (None unless sampled)
+    trace: Optional["TraceContext"] = field(default=None, repr=False, compare=False)
 
     def calculate_hash(self) -> str:
         """Calculate MD5 hash of key data fields for change detection"""
@@ -82,26 +164,41 @@ class DraftData:
         return self.calculate_hash() != other.calculate_hash()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format for transmission"""
+        """Convert to dictionary format for transmission (champion IDs resolved to names)"""
+        champion_names = self.champion_names or {}
         return {
             "lobbyId": self.lobby_id,
             "workspaceId": self.workspace_id,
             "phase": self.phase,
             "isNewGame": self.is_new_game,
-            "blue_side": {
-                "picks": self.blue_side.picks,
-                "bans": self.blue_side.bans,
-                "pick_events": [e.to_dict() for e in self.blue_side.pick_events],
-                "ban_events": [e.to_dict() for e in self.blue_side.ban_events]
-            },
-            "red_side": {
-                "picks": self.red_side.picks,
-                "bans": self.red_side.bans,
-                "pick_events": [e.to_dict() for e in self.red_side.pick_events],
-                "ban_events": [e.to_dict() for e in self.red_side.ban_events]
-            },
+            "blue_side": self.blue_side.to_dict(champion_names),
+            "red_side": self.red_side.to_dict(champion_names),
+            "dataHash": self.data_hash
+        }
+
+    def to_json_bytes(self, extra: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Encode the transmission payload (same shape as to_dict()) directly to JSON bytes.
+        Extra top-level fields, e.g. transmission metadata, are merged in.
+        """
+        champion_names = self.champion_names or {}
+        head = {
+            "lobbyId": self.lobby_id,
+            "workspaceId": self.workspace_id,
+            "phase": self.phase,
+            "isNewGame": self.is_new_game,
             "dataHash": self.data_hash
         }
+        if extra:
+            head.update(extra)
+
+        # Splice the team fragments in before the closing brace of the head object
+        return b"".join((
+            json_codec.dumps(head)[:-1],
+            b',"blue_side":', self.blue_side.to_json_bytes(champion_names),
+            b',"red_side":', self.red_side.to_json_bytes(champion_names),
+            b'}'
+        ))
 
     def has_meaningful_data(self) -> bool:
         """
@@ -1,14 +1,21 @@
 """
 Notification system for LCU Monitor state changes.
 Designed for future desktop app integration (system tray, toasts, etc.)
+Subscribers are served through an asynchronous event bus, so integrations
+never add latency to the monitor's state transitions.
 """
 
 import logging
 from enum import Enum
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from .event_bus import EventBus, OverflowPolicy, Subscription
+except ImportError:
+    from event_bus import EventBus, OverflowPolicy, Subscription
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,17 +49,18 @@ class MonitorNotifier:
     """
 
     def __init__(self):
-        self._subscribers: List[Callable[[Notification], None]] = []
+        self.bus = EventBus()
         self._last_notification: Optional[Notification] = None
 
-    def subscribe(self, callback: Callable[[Notification], None]) -> None:
-        """Subscribe to notifications"""
-        self._subscribers.append(callback)
+    def subscribe(self, callback: Callable[[Notification], None], topics: Optional[Iterable[NotificationType]] = None,
+                  max_queue: Optional[int] = None, policy: Optional[OverflowPolicy] = None,
+                  name: Optional[str] = None) -> Subscription:
+        """Subscribe a plain or async callback to notifications, optionally only to some types"""
+        return self.bus.subscribe(callback, topics, max_queue, policy, name)
 
-    def unsubscribe(self, callback: Callable[[Notification], None]) -> None:
+    def unsubscribe(self, subscriber: Union[Subscription, Callable[[Notification], None]]) -> None:
         """Unsubscribe from notifications"""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        self.bus.unsubscribe(subscriber)
 
     def _notify(self, notification: Notification) -> None:
         """Send notification to all subscribers"""
@@ -66,12 +74,8 @@ class MonitorNotifier:
         else:
             logger.debug(notification.message)
 
-        # Notify subscribers
-        for callback in self._subscribers:
-            try:
-                callback(notification)
-            except Exception as e:
-                logger.error(f"Notification subscriber failed: {e}")
+        # Queue for subscribers; delivery happens on their own workers
+        self.bus.publish(notification)
 
     # Convenience methods for specific events
 
@@ -162,10 +166,13 @@ class MonitorNotifier:
         return self._last_notification
 
 
-# Global notifier instance
-_notifier = MonitorNotifier()
+# Global instance, created on first use
+_notifier: Optional[MonitorNotifier] = None
 
 
 def get_notifier() -> MonitorNotifier:
     """Get the global notifier instance"""
+    global _notifier
+    if _notifier is None:
+        _notifier = MonitorNotifier()
     return _notifier
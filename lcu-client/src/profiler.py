@@ -0,0 +1,249 @@
+"""
+Built-in profiling for field diagnostics (--profile / --profile-alloc).
+SamplingProfiler periodically captures every thread's stack from a background
+thread and labels stacks on event loop threads with the asyncio task that was
+running, then writes collapsed stacks (open with speedscope.app or
+flamegraph.pl). AllocationTracker takes tracemalloc snapshots at monitor state
+transitions and reports what grew between them.
+"""
+
+import os
+import sys
+import time
+import atexit
+import asyncio
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .config_manager import get_config_manager
+except ImportError:
+    from config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+# Event loops by the thread running them, so samples can be attributed to tasks
+_loops: Dict[int, asyncio.AbstractEventLoop] = {}
+
+
+def register_loop(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Record the event loop running on the calling thread (cheap; safe to call when not profiling)"""
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    _loops[threading.get_ident()] = loop
+
+
+def _output_dir() -> Path:
+    config_manager = get_config_manager()
+    output_dir = Path(config_manager.get_settings().get("profiling", {}).get("output_dir", "profiles"))
+    if not output_dir.is_absolute():
+        output_dir = config_manager.config_dir.parent / output_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def _timestamp() -> str:
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+class SamplingProfiler:
+    """Samples all thread stacks at a fixed interval without instrumenting any code"""
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._code_labels: Dict[object, str] = {}  # Formatting frames is the sampler's main cost
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"Sampling profiler started ({self.interval * 1000:.0f} ms interval)")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _task_label(self, thread_id: int) -> Optional[str]:
+        loop = _loops.get(thread_id)
+        if loop is None or loop.is_closed():
+            return None
+        try:
+            task = asyncio.current_task(loop)
+        except RuntimeError:
+            return None
+        if task is None:
+            return "[loop: no task]"
+        return f"[task: {task.get_name()}]"
+
+    def _sample(self) -> None:
+        own_thread = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        collected: List[Tuple[str, ...]] = []
+
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self.max_depth:
+                code = frame.f_code
+                label = self._code_labels.get(code)
+                if label is None:
+                    label = self._code_labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                frames.append(f"{label}:{frame.f_lineno})")
+                frame = frame.f_back
+            frames.reverse()
+
+            prefix = [names.get(thread_id, f"thread-{thread_id}")]
+            task_label = self._task_label(thread_id)
+            if task_label:
+                prefix.append(task_label)
+            collected.append(tuple(prefix + frames))
+
+        with self._lock:
+            self._stacks.update(collected)
+            self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as e:
+                logger.debug(f"Profiler sample failed: {e}")
+
+    def write(self, output_dir: Optional[Path] = None) -> Path:
+        """Write collapsed stacks ("frame;frame;frame count" per line) to a timestamped file"""
+        output_dir = output_dir or _output_dir()
+        with self._lock:
+            stacks = list(self._stacks.items())
+            samples = self.samples
+
+        path = output_dir / f"profile-{_timestamp()}.folded"
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(stacks, key=lambda item: -item[1]):
+                f.write(";".join(frame.replace(";", ",") for frame in stack) + f" {count}\n")
+
+        elapsed = time.monotonic() - self._started_at
+        logger.info(f"Wrote profile with {samples} samples over {elapsed:.0f}s to {path}")
+        return path
+
+
+class AllocationTracker:
+    """tracemalloc snapshots labelled by monitor state transition"""
+
+    def __init__(self, frames: int = 10, max_snapshots: int = 50, top: int = 25):
+        self.frames = frames
+        self.max_snapshots = max_snapshots
+        self.top = top
+        self._snapshots: List[Tuple[str, float, "tracemalloc.Snapshot"]] = []
+
+    def start(self) -> None:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.snapshot("start")
+        logger.info("Allocation tracking started (tracemalloc)")
+
+    def snapshot(self, label: str) -> None:
+        """Take a snapshot (tens of ms with many live objects - only on state transitions)"""
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        # Keep the first snapshot as a baseline and a window of the most recent ones
+        if len(self._snapshots) >= self.max_snapshots:
+            del self._snapshots[1]
+        self._snapshots.append((label, time.time(), snapshot))
+
+    def write(self, output_dir: Optional[Path] = None) -> Optional[Path]:
+        """Write the top allocation growth between consecutive snapshots"""
+        if len(self._snapshots) < 2:
+            return None
+        output_dir = output_dir or _output_dir()
+
+        path = output_dir / f"allocations-{_timestamp()}.txt"
+        with open(path, "w", encoding="utf-8") as f:
+            for (prev_label, _, prev), (label, taken_at, current) in zip(self._snapshots, self._snapshots[1:]):
+                total = sum(stat.size for stat in current.statistics("filename"))
+                f.write(f"=== {prev_label} -> {label} at {datetime.fromtimestamp(taken_at).isoformat()} "
+                        f"(traced: {total / 1024:.0f} KiB)\n")
+                for stat in current.compare_to(prev, "lineno")[:self.top]:
+                    f.write(f"{stat}\n")
+                f.write("\n")
+        logger.info(f"Wrote allocation report for {len(self._snapshots)} snapshots to {path}")
+        return path
+
+
+# Global profilers, only created when enabled from the command line
+_sampling_profiler: Optional[SamplingProfiler] = None
+_allocation_tracker: Optional[AllocationTracker] = None
+_write_at_exit = False
+
+
+def get_sampling_profiler() -> Optional[SamplingProfiler]:
+    """The running sampling profiler, or None when --profile wasn't given"""
+    return _sampling_profiler
+
+
+def get_allocation_tracker() -> Optional[AllocationTracker]:
+    """The allocation tracker, or None when --profile-alloc wasn't given"""
+    return _allocation_tracker
+
+
+def start_profiling(sampling: bool = True, allocations: bool = False) -> None:
+    """Start the requested profilers; their output is written at exit"""
+    global _sampling_profiler, _allocation_tracker
+    settings = get_config_manager().get_settings().get("profiling", {})
+
+    if sampling and _sampling_profiler is None:
+        _sampling_profiler = SamplingProfiler(interval=settings.get("sample_interval_ms", 5) / 1000)
+        _sampling_profiler.start()
+
+    if allocations and _allocation_tracker is None:
+        _allocation_tracker = AllocationTracker(frames=settings.get("tracemalloc_frames", 10))
+        _allocation_tracker.start()
+
+    global _write_at_exit
+    if not _write_at_exit:
+        atexit.register(write_profiles, True)
+        _write_at_exit = True
+
+
+def write_profiles(stop: bool = False) -> List[Path]:
+    """Write whatever profiles are active (and optionally stop sampling); returns the files written"""
+    written = []
+    try:
+        if _sampling_profiler:
+            if stop:
+                _sampling_profiler.stop()
+            written.append(_sampling_profiler.write())
+        if _allocation_tracker:
+            _allocation_tracker.snapshot("exit" if stop else "requested")
+            path = _allocation_tracker.write()
+            if path:
+                written.append(path)
+    except Exception as e:
+        logger.error(f"Failed to write profile: {e}")
+    return written
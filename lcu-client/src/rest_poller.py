@@ -0,0 +1,208 @@
+"""
+REST polling fallback for the LCU WebSocket.
+Polls the gameflow phase (and the champ select session while a draft is being
+monitored) over the monitor's existing connection, at the monitoring interval
+for the current state. Responses are fingerprinted before decoding, so a poll
+that returns the same bytes as last time costs one request and one hash.
+While the WebSocket is healthy this is a slow reconciliation pass that catches
+missed frames; when the socket is down or a poll finds a change the socket
+never delivered, it polls at the full per-state rate until a clean poll.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    from .utils import json_codec
+except ImportError:
+    from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+_UNCHANGED = object()  # Same body as the previous poll of that endpoint
+
+
+def _monitor_state():
+    # Imported on use: lcu_monitor imports this module
+    try:
+        from .lcu_monitor import MonitorState
+    except ImportError:
+        from lcu_monitor import MonitorState
+    return MonitorState
+
+
+class RestPoller:
+    """State-driven REST polling with fingerprint dedup, owned by an LCUMonitor"""
+
+    def __init__(self, monitor, champ_select_interval: float = 1, lobby_interval: float = 10,
+                 active_game_interval: float = 60, reconcile_interval: float = 5, enabled: bool = True):
+        self.monitor = monitor
+        self.champ_select_interval = champ_select_interval
+        self.lobby_interval = lobby_interval
+        self.active_game_interval = active_game_interval
+        self.reconcile_interval = reconcile_interval  # Minimum interval while the WebSocket is healthy
+        self.enabled = enabled
+        self.degraded = False
+        self.stats = {"polls": 0, "unchanged": 0, "changed": 0, "missed": 0, "overtaken": 0, "errors": 0}
+        self._connection = None
+        self._fingerprints: Dict[str, int] = {}
+        self._missed_last_poll = False
+        self._last_poll = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @classmethod
+    def from_settings(cls, monitor, monitoring_settings: Dict[str, Any]) -> "RestPoller":
+        return cls(
+            monitor,
+            champ_select_interval=monitoring_settings.get("champ_select_interval", 1),
+            lobby_interval=monitoring_settings.get("lobby_interval", 10),
+            active_game_interval=monitoring_settings.get("active_game_interval", 60),
+            reconcile_interval=monitoring_settings.get("reconcile_interval", 5),
+            enabled=monitoring_settings.get("rest_polling", True),
+        )
+
+    def start(self, connection) -> None:
+        """Poll over a newly established connection (no-op when disabled)"""
+        if not self.enabled:
+            return
+        self.stop()
+        self._connection = connection
+        self._fingerprints.clear()
+        self._missed_last_poll = False
+        self._last_poll = asyncio.get_event_loop().time()  # The connect handler just fetched everything
+        # Each run gets its own connection and wakeup: a run outliving stop() can't reach the next one's
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_event_loop().create_task(self._run(connection, self._wakeup))
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._connection = None
+        self._wakeup = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def reschedule(self) -> None:
+        """Recompute the next poll time, e.g. after a state change"""
+        if self._wakeup:
+            self._wakeup.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, degraded=self.degraded, interval=self.interval())
+
+    def interval(self) -> float:
+        """Seconds between polls in the current state"""
+        MonitorState = _monitor_state()
+        state = self.monitor.state
+        if state == MonitorState.MONITORING_CHAMP_SELECT:
+            interval = self.champ_select_interval
+        elif state == MonitorState.GAME_STARTED:
+            interval = self.active_game_interval
+        else:
+            interval = self.lobby_interval
+        return interval if self.degraded else max(interval, self.reconcile_interval)
+
+    async def _run(self, connection, wakeup: asyncio.Event):
+        loop = asyncio.get_event_loop()
+        this_run = asyncio.current_task()
+        try:
+            # Also stop once replaced: a cancellation can be lost if it lands as the wakeup fires
+            while self._task is this_run:
+                wakeup.clear()
+                delay = self._last_poll + self.interval() - loop.time()
+                if delay > 0:
+                    try:
+                        async with asyncio.timeout(delay):
+                            await wakeup.wait()
+                        continue  # Rescheduled
+                    except TimeoutError:
+                        continue  # Due now, if still the current run
+                await self.poll(connection)
+        except asyncio.CancelledError:
+            pass
+
+    async def poll(self, connection=None) -> None:
+        """Fetch the endpoints relevant to the current state and apply anything the WebSocket missed"""
+        monitor = self.monitor
+        connection = connection or self._connection
+        self._last_poll = asyncio.get_event_loop().time()
+        self.stats["polls"] += 1
+        missed = False
+
+        phase = await self._fetch(connection, monitor.GAMEFLOW_URL)
+        if isinstance(phase, str):
+            phase = phase.strip('"')
+            if phase and phase != monitor.current_phase:
+                missed = True
+                monitor.recorder.record("poll", "gameflow %s -> %s missed by the WebSocket", monitor.current_phase, phase)
+                await monitor._process_gameflow_phase(phase)
+
+        if monitor.state == _monitor_state().MONITORING_CHAMP_SELECT:
+            session = await self._fetch(connection, monitor.CHAMP_SELECT_URL)
+            if isinstance(session, dict):
+                before = monitor._last_raw_draft_data
+                with monitor.tracer.trace("champ_select_poll", lobby=monitor.current_lobby_id):
+                    await monitor._process_champ_select_data(session)
+                if monitor._last_raw_draft_data is not before:
+                    missed = True
+                    monitor.recorder.record("poll", "champ select change missed by the WebSocket")
+
+        if missed:
+            self.stats["missed"] += 1
+        self._missed_last_poll = missed
+        self._update_degraded(connection)
+
+    async def _fetch(self, connection, uri: str) -> Any:
+        """
+        Decoded body, _UNCHANGED when the bytes match the last poll, or None on
+        errors and when a WebSocket update was handled while the request was in
+        flight (the response may then be older than the monitor's state).
+        """
+        ws_updates = self.monitor._ws_update_count
+        try:
+            response = await connection.request('get', uri)
+            if response.status != 200:
+                self._fingerprints.pop(uri, None)
+                return None
+            body = await response.read()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.debug(f"[REST_POLL] GET {uri} failed: {e}")
+            return None
+
+        if self.monitor._ws_update_count != ws_updates:
+            self.stats["overtaken"] += 1
+            self._fingerprints.pop(uri, None)  # Compare the next poll against nothing, not this response
+            return None
+
+        fingerprint = hash(body)
+        if self._fingerprints.get(uri) == fingerprint:
+            self.stats["unchanged"] += 1
+            return _UNCHANGED
+        self._fingerprints[uri] = fingerprint
+        self.stats["changed"] += 1
+        try:
+            return json_codec.loads(body)
+        except ValueError:
+            self.stats["errors"] += 1
+            return None
+
+    @staticmethod
+    def _websocket_down(connection) -> bool:
+        """lcu_driver keeps its socket on the connection; other connections are assumed healthy"""
+        ws = getattr(connection, "_ws", False)
+        return ws is None or bool(getattr(ws, "closed", False))
+
+    def _update_degraded(self, connection) -> None:
+        degraded = self._websocket_down(connection) or self._missed_last_poll
+        if degraded != self.degraded:
+            self.degraded = degraded
+            if degraded:
+                logger.warning(f"[REST_POLL] WebSocket degraded, polling every {self.interval():g} s")
+            else:
+                logger.info("[REST_POLL] WebSocket healthy again, back to periodic reconciliation")
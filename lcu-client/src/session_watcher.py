@@ -0,0 +1,138 @@
+"""
+Background watcher for League client sessions.
+Polls lockfiles cheaply and runs the slower process scan every
+process_scan_interval, so clients outside known install directories are still
+found; lockfile hits just make known clients appear sooner. The merged set of
+LCU sessions is diffed and the changes published as callback signals.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+import psutil
+
+try:
+    from .lcu_process_scanner import (
+        LCUSession, get_lockfile_sessions, get_known_install_dirs, get_process_sessions, merge_sessions
+    )
+    from .config_manager import get_config_manager
+    from .utils.callbacks import CallbackSignal
+except ImportError:
+    from lcu_process_scanner import (
+        LCUSession, get_lockfile_sessions, get_known_install_dirs, get_process_sessions, merge_sessions
+    )
+    from config_manager import get_config_manager
+    from utils.callbacks import CallbackSignal
+
+logger = logging.getLogger(__name__)
+
+
+class LCUSessionWatcher:
+    """Single source of truth for running League clients, shared by the GUI and the monitor"""
+
+    def __init__(self):
+        self.session_added = CallbackSignal()    # LCUSession
+        self.session_removed = CallbackSignal()  # LCUSession
+        self.session_changed = CallbackSignal()  # LCUSession (same PID, new port/token/install dir)
+        self.config_manager = get_config_manager()
+        self._sessions: Dict[int, LCUSession] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._last_process_scan = 0.0
+        self._process_sessions: List[LCUSession] = []  # Result of the last process scan
+
+    def start(self) -> None:
+        """Start polling on the running event loop (no-op if already running)"""
+        if self._task and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_event_loop().create_task(self._watch())
+        logger.debug("LCU session watcher started")
+
+    def stop(self) -> None:
+        """Stop polling"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def refresh(self) -> None:
+        """Poll immediately instead of waiting for the next interval"""
+        self._last_process_scan = 0.0
+        if self._wakeup:
+            self._wakeup.set()
+
+    def get_sessions(self) -> List[LCUSession]:
+        """Sessions seen by the last poll (no scanning)"""
+        return list(self._sessions.values())
+
+    def _scan(self) -> List[LCUSession]:
+        """Read lockfiles every poll and run the slow process scan every process_scan_interval, merged by PID"""
+        sessions = get_lockfile_sessions(get_known_install_dirs())
+
+        lcu_settings = self.config_manager.get_lcu_settings()
+        now = time.monotonic()
+        if now - self._last_process_scan >= lcu_settings.get("process_scan_interval", 5):
+            self._last_process_scan = now
+            self._process_sessions = get_process_sessions()
+        else:
+            # Between scans, forget clients that have exited
+            self._process_sessions = [s for s in self._process_sessions if psutil.pid_exists(s.pid)]
+        return merge_sessions(sessions, self._process_sessions)
+
+    def _apply(self, sessions: List[LCUSession]) -> None:
+        """Diff a scan result against the known sessions and emit signals"""
+        current = {session.pid: session for session in sessions}
+
+        for pid, session in list(self._sessions.items()):
+            if pid not in current:
+                del self._sessions[pid]
+                logger.info(f"League client closed: {session.display_name}")
+                self.session_removed.emit(session)
+
+        for pid, session in current.items():
+            previous = self._sessions.get(pid)
+            if previous is None:
+                self._sessions[pid] = session
+                logger.info(f"League client detected: {session.display_name}")
+                self.session_added.emit(session)
+            elif previous != session:
+                self._sessions[pid] = session
+                logger.debug(f"League client session changed: {session.display_name}")
+                self.session_changed.emit(session)
+
+    async def _watch(self):
+        """Polling loop - scans run in a worker thread so the GUI never stalls"""
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                sessions = await loop.run_in_executor(None, self._scan)
+                self._apply(sessions)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"LCU session watcher error: {e}")
+
+            interval = self.config_manager.get_lcu_settings().get("session_poll_interval", 1)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+# Global instance, created on first use
+_session_watcher: Optional[LCUSessionWatcher] = None
+
+
+def get_session_watcher() -> LCUSessionWatcher:
+    """Get the global LCU session watcher instance"""
+    global _session_watcher
+    if _session_watcher is None:
+        _session_watcher = LCUSessionWatcher()
+    return _session_watcher
@@ -0,0 +1,3 @@
+"""
+Simulated League client traffic for tests, benchmarks and soak runs.
+"""
@@ -0,0 +1,358 @@
+"""
+Synthetic champion select traffic.
+ChampSelectGenerator produces the WebSocket events the League client sends
+during a game - gameflow phase changes and full /lol-champ-select/v1/session
+payloads - with tournament draft order, hovers, timer updates, post-draft
+swaps, dodges and bot games. Everything is derived from a seeded
+random.Random, so the same seed always yields the same event sequence.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+GAMEFLOW_URI = "/lol-gameflow/v1/gameflow-phase"
+CHAMP_SELECT_URI = "/lol-champ-select/v1/session"
+LOBBY_URI = "/lol-lobby/v1/lobby"
+
+# Champion IDs handed out by default (a contiguous range is enough for traffic shapes)
+DEFAULT_CHAMPION_POOL: Tuple[int, ...] = tuple(range(1, 161))
+TURN_SECONDS = 30.0
+
+BLUE_TEAM = 1
+RED_TEAM = 2
+BLUE_CELLS = (0, 1, 2, 3, 4)
+RED_CELLS = (5, 6, 7, 8, 9)
+POSITIONS = ("top", "jungle", "middle", "bottom", "utility")
+
+# Tournament draft: (action type, team, cell) per turn; turns sharing a group are in progress together
+TOURNAMENT_DRAFT: Tuple[Tuple[Tuple[str, int, int], ...], ...] = (
+    (("ban", BLUE_TEAM, 0),), (("ban", RED_TEAM, 5),),
+    (("ban", BLUE_TEAM, 1),), (("ban", RED_TEAM, 6),),
+    (("ban", BLUE_TEAM, 2),), (("ban", RED_TEAM, 7),),
+    (("pick", BLUE_TEAM, 0),),
+    (("pick", RED_TEAM, 5), ("pick", RED_TEAM, 6)),
+    (("pick", BLUE_TEAM, 1), ("pick", BLUE_TEAM, 2)),
+    (("pick", RED_TEAM, 7),),
+    (("ban", RED_TEAM, 8),), (("ban", BLUE_TEAM, 3),),
+    (("ban", RED_TEAM, 9),), (("ban", BLUE_TEAM, 4),),
+    (("pick", RED_TEAM, 8),),
+    (("pick", BLUE_TEAM, 3), ("pick", BLUE_TEAM, 4)),
+    (("pick", RED_TEAM, 9),),
+)
+
+
+@dataclass(frozen=True)
+class LCUEvent:
+    """One WebSocket event, shaped like lcu_driver's event objects (uri, type, data)"""
+    uri: str
+    type: str  # "Create", "Update" or "Delete"
+    data: Any
+    at: float = 0.0  # Seconds since the start of the generated sequence
+
+    def to_wamp(self) -> list:
+        """The WAMP EVENT message the client sends for this event"""
+        return [8, "OnJsonApiEvent", {"uri": self.uri, "eventType": self.type, "data": self.data}]
+
+
+@dataclass
+class DraftScenario:
+    """Shape of one champion select"""
+    bots: bool = False  # Co-op vs AI: no bans, bot picks are locked from the first update
+    dodge_after: Optional[int] = None  # Leave champ select after this many locked actions
+    swaps: int = 0  # Champion swaps during finalization
+    hovers: Tuple[int, int] = (0, 3)  # Hovered champions before each lock-in (min, max)
+    action_seconds: Tuple[float, float] = (3.0, 25.0)  # Time taken per action (min, max)
+    timer_updates_per_second: float = 0.0  # Extra session updates that only move the timer
+    finalization_seconds: float = 30.0
+    local_team: Optional[int] = None  # Perspective of the local player; random when None
+
+
+@dataclass
+class _Action:
+    id: int
+    type: str
+    team: int
+    cell: int
+    champion_id: int = 0
+    completed: bool = False
+    in_progress: bool = False
+    pick_turn: int = 0
+
+
+@dataclass
+class _Draft:
+    game_id: int
+    local_team: int
+    actions: List[List[_Action]]
+    champions: Dict[int, int] = field(default_factory=dict)  # cell -> champion shown on the team list
+    intents: Dict[int, int] = field(default_factory=dict)  # cell -> hovered champion
+    bots: bool = False
+    phase: str = "BAN_PICK"
+    phase_started_ms: int = 0
+    phase_length_ms: int = 0
+
+
+class ChampionPoolMapper:
+    """Champion mapper stand-in naming every champion in a pool, so drafts serialize without ddragon"""
+
+    def __init__(self, champion_pool: Tuple[int, ...] = DEFAULT_CHAMPION_POOL):
+        self._names = {champion_id: f"Champion{champion_id}" for champion_id in champion_pool}
+
+    def get_name_map(self) -> Dict[int, str]:
+        return self._names
+
+
+class ChampSelectGenerator:
+    """Seeded source of realistic champ select event sequences"""
+
+    def __init__(self, seed: Optional[int] = None, champion_pool: Tuple[int, ...] = DEFAULT_CHAMPION_POOL,
+                 start_epoch_ms: int = 1_700_000_000_000):
+        self.random = random.Random(seed)
+        self.champion_pool = champion_pool
+        self.epoch_ms = start_epoch_ms  # Virtual LCU clock, used for timer fields
+        self.elapsed = 0.0  # Virtual seconds since the first event
+        self.next_game_id = self.random.randint(6_000_000_000, 7_000_000_000)
+        self._gameflow_phase: Optional[str] = None
+
+    # --- Clock and event helpers ---
+
+    def _advance(self, seconds: float) -> None:
+        self.elapsed += seconds
+        self.epoch_ms += int(seconds * 1000)
+
+    def _event(self, uri: str, event_type: str, data: Any) -> LCUEvent:
+        return LCUEvent(uri=uri, type=event_type, data=data, at=round(self.elapsed, 6))
+
+    def _gameflow(self, phase: str) -> List[LCUEvent]:
+        if phase == self._gameflow_phase:
+            return []
+        self._gameflow_phase = phase
+        return [self._event(GAMEFLOW_URI, "Update", phase)]
+
+    # --- Session payloads ---
+
+    def _session(self, draft: _Draft) -> Dict[str, Any]:
+        """Build a /lol-champ-select/v1/session payload for the current draft state"""
+        def member(cell: int, team: int) -> Dict[str, Any]:
+            is_bot = draft.bots and team != draft.local_team
+            return {
+                "cellId": cell,
+                "team": team,
+                "championId": draft.champions.get(cell, 0),
+                "championPickIntent": draft.intents.get(cell, 0),
+                "assignedPosition": POSITIONS[cell % 5] if not draft.bots else "",
+                "summonerId": 0 if is_bot else 100000 + cell,
+                "isBot": is_bot,
+                "spell1Id": 4,
+                "spell2Id": 14 if cell % 5 == 0 else 7,
+            }
+
+        blue = [member(cell, BLUE_TEAM) for cell in BLUE_CELLS]
+        red = [member(cell, RED_TEAM) for cell in RED_CELLS]
+        my_team, their_team = (blue, red) if draft.local_team == BLUE_TEAM else (red, blue)
+
+        actions = [[{
+            "id": action.id,
+            "actorCellId": action.cell,
+            "championId": action.champion_id,
+            "completed": action.completed,
+            "isAllyAction": action.team == draft.local_team,
+            "isInProgress": action.in_progress,
+            "pickTurn": action.pick_turn,
+            "type": action.type,
+        } for action in group] for group in draft.actions]
+
+        def bans(team: int) -> List[int]:
+            return [action.champion_id for group in draft.actions for action in group
+                    if action.type == "ban" and action.team == team and action.completed]
+
+        elapsed_in_phase = self.epoch_ms - draft.phase_started_ms
+        return {
+            "gameId": draft.game_id,
+            "localPlayerCellId": BLUE_CELLS[0] if draft.local_team == BLUE_TEAM else RED_CELLS[0],
+            "isSpectating": False,
+            "allowRerolling": False,
+            "benchEnabled": False,
+            "myTeam": my_team,
+            "theirTeam": their_team,
+            "actions": actions,
+            "bans": {
+                "myTeamBans": bans(draft.local_team),
+                "theirTeamBans": bans(RED_TEAM if draft.local_team == BLUE_TEAM else BLUE_TEAM),
+                "numBans": 0 if draft.bots else 10,
+            },
+            "timer": {
+                "phase": draft.phase,
+                "adjustedTimeLeftInPhase": max(0, draft.phase_length_ms - elapsed_in_phase),
+                "totalTimeInPhase": draft.phase_length_ms,
+                "internalNowInEpochMs": self.epoch_ms,  # Restamped on every update, the monitor's fast path
+                "isInfinite": False,
+            },
+            "trades": [],
+            "pickOrderSwaps": [],
+        }
+
+    def _update(self, draft: _Draft) -> LCUEvent:
+        return self._event(CHAMP_SELECT_URI, "Update", self._session(draft))
+
+    def _start_phase(self, draft: _Draft, phase: str, seconds: float) -> None:
+        draft.phase = phase
+        draft.phase_started_ms = self.epoch_ms
+        draft.phase_length_ms = int(seconds * 1000)
+
+    def _wait(self, draft: _Draft, seconds: float, scenario: DraftScenario) -> List[LCUEvent]:
+        """Let time pass, emitting timer-only session updates at the configured rate"""
+        events = []
+        if scenario.timer_updates_per_second > 0:
+            interval = 1.0 / scenario.timer_updates_per_second
+            while seconds > interval:
+                self._advance(interval)
+                seconds -= interval
+                events.append(self._update(draft))
+        self._advance(seconds)
+        return events
+
+    # --- Draft construction ---
+
+    def _build_actions(self, bots: bool) -> List[List[_Action]]:
+        action_id = 0
+        groups = []
+        if bots:
+            # Everyone picks at once; bot picks are filled in from the start
+            group = []
+            for cell in BLUE_CELLS + RED_CELLS:
+                action_id += 1
+                group.append(_Action(id=action_id, type="pick", team=BLUE_TEAM if cell < 5 else RED_TEAM,
+                                     cell=cell, pick_turn=1))
+            return [group]
+
+        for turn, turns in enumerate(TOURNAMENT_DRAFT, start=1):
+            group = []
+            for action_type, team, cell in turns:
+                action_id += 1
+                group.append(_Action(id=action_id, type=action_type, team=team, cell=cell, pick_turn=turn))
+            groups.append(group)
+        return groups
+
+    def _new_game_id(self) -> int:
+        game_id = self.next_game_id
+        self.next_game_id += self.random.randint(1, 5000)
+        return game_id
+
+    def draft(self, scenario: Optional[DraftScenario] = None) -> List[LCUEvent]:
+        """Events for one game, from entering the lobby to the game ending or a dodge"""
+        scenario = scenario or DraftScenario()
+        rng = self.random
+        local_team = scenario.local_team or rng.choice((BLUE_TEAM, RED_TEAM))
+        draft = _Draft(game_id=self._new_game_id(), local_team=local_team,
+                       actions=self._build_actions(scenario.bots), bots=scenario.bots)
+        available = list(self.champion_pool)
+        rng.shuffle(available)
+
+        events = self._gameflow("Lobby")
+        events.append(self._event(LOBBY_URI, "Create", {
+            "partyId": f"party-{draft.game_id}",
+            "gameConfig": {"queueId": 830 if scenario.bots else 0, "isCustom": not scenario.bots},
+        }))
+        self._advance(rng.uniform(1, 5))
+        for phase in ("Matchmaking", "ReadyCheck", "ChampSelect"):
+            events += self._gameflow(phase)
+            self._advance(rng.uniform(0.5, 3))
+
+        if scenario.bots:
+            for group in draft.actions:
+                for action in group:
+                    if action.team != local_team:
+                        action.champion_id = draft.champions[action.cell] = available.pop()
+                        action.completed = True
+
+        turn_seconds = max(TURN_SECONDS, scenario.action_seconds[1])
+        self._start_phase(draft, "BAN_PICK", turn_seconds)
+        events.append(self._event(CHAMP_SELECT_URI, "Create", self._session(draft)))
+
+        locked = 0
+        for group in draft.actions:
+            pending = [action for action in group if not action.completed]
+            for action in pending:
+                action.in_progress = True
+            self._start_phase(draft, "BAN_PICK", turn_seconds)
+            events.append(self._update(draft))
+
+            for action in pending:
+                if scenario.dodge_after is not None and locked >= scenario.dodge_after:
+                    return events + self._dodge(draft)
+
+                # Hover a few champions, then lock the last one in
+                for _ in range(rng.randint(*scenario.hovers)):
+                    events += self._wait(draft, rng.uniform(0.5, 3), scenario)
+                    action.champion_id = available[rng.randrange(len(available))]
+                    if action.type == "pick":
+                        draft.intents[action.cell] = action.champion_id
+                    events.append(self._update(draft))
+
+                events += self._wait(draft, rng.uniform(*scenario.action_seconds), scenario)
+                if not action.champion_id or action.champion_id not in available:
+                    action.champion_id = available[rng.randrange(len(available))]
+                available.remove(action.champion_id)
+                action.completed = True
+                action.in_progress = False
+                if action.type == "pick":
+                    draft.champions[action.cell] = action.champion_id
+                    draft.intents.pop(action.cell, None)
+                locked += 1
+                events.append(self._update(draft))
+
+        self._start_phase(draft, "FINALIZATION", scenario.finalization_seconds)
+        events.append(self._update(draft))
+        remaining = scenario.finalization_seconds
+        for _ in range(scenario.swaps):
+            delay = rng.uniform(0, remaining / (scenario.swaps + 1))
+            remaining -= delay
+            events += self._wait(draft, delay, scenario)
+            events.append(self._swap(draft))
+        events += self._wait(draft, remaining, scenario)
+
+        return events + self._game(draft)
+
+    def _swap(self, draft: _Draft) -> LCUEvent:
+        """Two players of one team trade champions; the pick actions change with them"""
+        team = self.random.choice((BLUE_TEAM, RED_TEAM))
+        first, second = self.random.sample(BLUE_CELLS if team == BLUE_TEAM else RED_CELLS, 2)
+        draft.champions[first], draft.champions[second] = draft.champions[second], draft.champions[first]
+        for group in draft.actions:
+            for action in group:
+                if action.type == "pick" and action.cell in (first, second):
+                    action.champion_id = draft.champions[action.cell]
+        return self._update(draft)
+
+    def _dodge(self, draft: _Draft) -> List[LCUEvent]:
+        self._advance(self.random.uniform(0.5, 5))
+        events = [self._event(CHAMP_SELECT_URI, "Delete", None)]
+        return events + self._gameflow("Lobby")
+
+    def _game(self, draft: _Draft) -> List[LCUEvent]:
+        events = self._gameflow("GameStart")
+        self._advance(self.random.uniform(1, 3))
+        events.append(self._event(CHAMP_SELECT_URI, "Delete", None))
+        self._advance(self.random.uniform(5, 15))
+        events += self._gameflow("InProgress")
+        self._advance(self.random.uniform(15 * 60, 40 * 60))
+        for phase in ("WaitingForStats", "PreEndOfGame", "EndOfGame"):
+            events += self._gameflow(phase)
+            self._advance(self.random.uniform(2, 20))
+        return events + self._gameflow("None")
+
+    def stream(self, games: Optional[int] = None, dodge_rate: float = 0.1, bot_rate: float = 0.1,
+               swap_rate: float = 0.3, timer_updates_per_second: float = 0.0) -> Iterator[LCUEvent]:
+        """Events for many consecutive games (endless when games is None), for soak runs"""
+        played = 0
+        while games is None or played < games:
+            bots = self.random.random() < bot_rate
+            dodge_after = self.random.randint(0, 4 if bots else 19) if self.random.random() < dodge_rate else None
+            swaps = self.random.randint(1, 3) if self.random.random() < swap_rate else 0
+            yield from self.draft(DraftScenario(
+                bots=bots, dodge_after=dodge_after, swaps=swaps,
+                timer_updates_per_second=timer_updates_per_second,
+            ))
+            played += 1
@@ -0,0 +1,251 @@
+"""
+Local stand-in for the lcuDraft Netlify function.
+DraftEndpointStandIn mirrors netlify/functions/lcuDraft: the same validation,
+delete handling and document ID assignment (query by lobbyId, then count the
+collection for a new {lobbyId}_{n} ID), against an in-memory store that
+charges Firestore reads, writes and deletes with a configurable latency.
+Because those steps are not transactional - just like the real function -
+concurrent first writes for one lobby get different IDs when another lobby's
+document lands in between, creating duplicates; the stand-in counts those
+along with writes that changed nothing.
+"""
+
+import json
+import time
+import random
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aiohttp import web
+
+from config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+FUNCTION_PATH = "/.netlify/functions/lcuDraft"
+WORKSPACE_ID = "simulated-workspace"
+
+
+class StandInClientConfig:
+    """Client settings pointing a monitor and transmitter at a stand-in; the rest comes from the real config"""
+
+    def __init__(self, endpoint_url: str, **transmission: Any):
+        self._config = get_config_manager()
+        self._transmission = {**self._config.get_transmission_settings(), "endpoint_url": endpoint_url, **transmission}
+
+    def get_transmission_settings(self) -> Dict[str, Any]:
+        return self._transmission
+
+    def get_password_hash(self) -> str:
+        return "simulated-password-hash"
+
+    def get_workspace_id(self) -> str:
+        return WORKSPACE_ID
+
+    def is_configured(self) -> bool:
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._config, name)
+
+
+class DraftEndpointStandIn:
+    """HTTP server with lcuDraft semantics and Firestore cost accounting"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, firestore_latency: float = 0.02,
+                 failure_rate: float = 0.0, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.firestore_latency = firestore_latency  # Seconds per Firestore round trip (jittered +-50%)
+        self.failure_rate = failure_rate  # Fraction of requests answered with 503, as under throttling
+        self.random = random.Random(seed)
+
+        # workspaces/{workspaceId}/lcuDrafts/{docId}
+        self.documents: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._deleted_lobbies: Set[Tuple[str, str]] = set()
+
+        self.responses: Counter = Counter()  # (action, status) -> count
+        self.firestore = Counter()  # reads / writes / deletes
+        self.duplicate_documents = 0  # Extra documents created for a lobby that already had one
+        self.redundant_writes = 0  # Writes that left the phase, picks and bans unchanged
+        self.resurrected_documents = 0  # Documents re-created after their lobby was deleted
+        self.handler_seconds: List[float] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    # --- Lifecycle ---
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{FUNCTION_PATH}"
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", FUNCTION_PATH, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"lcuDraft stand-in listening on {self.url}")
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # --- Simulated Firestore ---
+
+    async def _firestore(self, operation: str, count: int = 1) -> None:
+        self.firestore[operation] += max(1, count)  # Every query is billed at least one read
+        if self.firestore_latency:
+            await asyncio.sleep(self.firestore_latency * self.random.uniform(0.5, 1.5))
+
+    def _find(self, workspace_id: str, lobby_id: str) -> Optional[str]:
+        for doc_id, doc in self.documents.get(workspace_id, {}).items():
+            if doc["lobbyId"] == lobby_id:
+                return doc_id
+        return None
+
+    @staticmethod
+    def _draft_state(doc: Dict[str, Any]) -> Tuple:
+        """What a write can change for viewers: phase, picks and bans (event timestamps differ per client)"""
+        return (doc.get("phase"),
+                *(tuple(doc.get(side, {}).get(key, ())) for side in ("blueSide", "redSide") for key in ("picks", "bans")))
+
+    # --- Request handling ---
+
+    @staticmethod
+    def _json(status: int, body: Dict[str, Any]) -> web.Response:
+        return web.json_response(body, status=status, headers={"Access-Control-Allow-Origin": "*"})
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        start = time.perf_counter()
+        action = "other"
+        try:
+            if request.method == "OPTIONS":
+                return web.Response(status=204)
+            if request.method == "GET":
+                action = "validate"
+                response = self._validate(request)
+            elif request.method != "POST":
+                response = self._json(405, {"error": "Method not allowed"})
+            elif self.failure_rate and self.random.random() < self.failure_rate:
+                action = "throttled"
+                response = self._json(503, {"error": "Service unavailable"})
+            else:
+                try:
+                    draft = json.loads(await request.read())
+                except ValueError:
+                    return self._json(500, {"error": "Failed to save draft data"})
+                action = "delete" if draft.get("action") == "delete" else "draft"
+                response = await (self._delete(draft) if action == "delete" else self._save(draft))
+            self.responses[(action, response.status)] += 1
+            return response
+        finally:
+            self.handler_seconds.append(time.perf_counter() - start)
+
+    def _validate(self, request: web.Request) -> web.Response:
+        if request.query.get("action") != "validate":
+            return self._json(400, {"error": "Invalid action parameter"})
+        if not request.query.get("workspaceId") or not request.query.get("passwordHash"):
+            return self._json(400, {"error": "workspaceId and passwordHash are required"})
+        return self._json(200, {"success": True, "workspaceId": request.query["workspaceId"], "mode": "test"})
+
+    def _check_ids(self, draft: Dict[str, Any]) -> Optional[web.Response]:
+        lobby_id = str(draft.get("lobbyId") or "").strip()
+        if not lobby_id:
+            return self._json(400, {"error": "lobbyId is required"})
+        if lobby_id.upper() == "UNKNOWN":
+            return self._json(400, {"error": "lobbyId cannot be UNKNOWN"})
+        if not str(draft.get("workspaceId") or "").strip():
+            return self._json(400, {"error": "workspaceId is required"})
+        return None
+
+    async def _delete(self, draft: Dict[str, Any]) -> web.Response:
+        error = self._check_ids(draft)
+        if error:
+            return error
+        workspace_id, lobby_id = str(draft["workspaceId"]), str(draft["lobbyId"])
+
+        await self._firestore("reads")  # where('lobbyId', '==', ...).limit(1)
+        doc_id = self._find(workspace_id, lobby_id)
+        if doc_id is None:
+            return self._json(404, {"success": False, "lobbyId": lobby_id, "message": "Draft not found"})
+
+        await self._firestore("deletes")
+        self.documents[workspace_id].pop(doc_id, None)
+        self._deleted_lobbies.add((workspace_id, lobby_id))
+        return self._json(200, {"success": True, "lobbyId": lobby_id, "docId": doc_id})
+
+    async def _save(self, draft: Dict[str, Any]) -> web.Response:
+        error = self._check_ids(draft)
+        if error:
+            return error
+        blue, red = draft.get("blue_side") or {}, draft.get("red_side") or {}
+        if not any(side.get(key) for side in (blue, red) for key in ("picks", "bans")):
+            return self._json(400, {"error": "Draft rejected - no picks or bans found. Ghost documents are not allowed."})
+        if str(draft.get("phase") or "UNKNOWN").upper() == "UNKNOWN" and draft.get("isNewGame") is True:
+            return self._json(400, {"error": "Draft rejected - UNKNOWN phase not allowed for new games"})
+
+        workspace_id, lobby_id = str(draft["workspaceId"]), str(draft["lobbyId"])
+        document = {
+            "lobbyId": lobby_id,
+            "phase": draft.get("phase") or "UNKNOWN",
+            "blueSide": {"picks": blue.get("picks", []), "bans": blue.get("bans", []),
+                         "pickEvents": blue.get("pick_events", []), "banEvents": blue.get("ban_events", [])},
+            "redSide": {"picks": red.get("picks", []), "bans": red.get("bans", []),
+                        "pickEvents": red.get("pick_events", []), "banEvents": red.get("ban_events", [])},
+            "isNewGame": draft.get("isNewGame") is True,
+        }
+
+        await self._firestore("reads")  # Workspace metadata / password check
+        await self._firestore("reads")  # Existing document query by lobbyId
+        collection = self.documents.setdefault(workspace_id, {})
+        doc_id = self._find(workspace_id, lobby_id)
+        exists = doc_id is not None
+        if not exists:
+            # Count the whole collection for the next sequential ID (billed per document read)
+            await self._firestore("reads", len(collection))
+            doc_id = f"{lobby_id}_{len(collection) + 1}"
+
+        await self._firestore("writes")
+        if not exists and doc_id not in collection:
+            if self._find(workspace_id, lobby_id) is not None:
+                # A concurrent request created this lobby's document under another ID while this one was counting
+                self.duplicate_documents += 1
+            elif (workspace_id, lobby_id) in self._deleted_lobbies:
+                self.resurrected_documents += 1
+
+        previous = collection.get(doc_id)
+        if previous is not None and self._draft_state(previous) == self._draft_state(document):
+            self.redundant_writes += 1
+        if exists and document["isNewGame"]:
+            collection[doc_id] = document
+        else:
+            collection[doc_id] = {**(previous or {}), **document}
+
+        return self._json(200, {"success": True, "lobbyId": lobby_id,
+                                "message": "Draft updated" if exists else "Draft created", "mode": "test"})
+
+    def forget(self) -> None:
+        """Drop stored documents and timing samples but keep the counters, for long runs"""
+        self.documents.clear()
+        self._deleted_lobbies.clear()
+        self.handler_seconds.clear()
+
+    # --- Reporting ---
+
+    def get_stats(self) -> Dict[str, Any]:
+        documents = sum(len(collection) for collection in self.documents.values())
+        return {
+            "responses": {f"{action} {status}": count for (action, status), count in sorted(self.responses.items())},
+            "firestore_reads": self.firestore["reads"],
+            "firestore_writes": self.firestore["writes"],
+            "firestore_deletes": self.firestore["deletes"],
+            "documents": documents,
+            "duplicate_documents": self.duplicate_documents,
+            "redundant_writes": self.redundant_writes,
+            "resurrected_documents": self.resurrected_documents,
+        }
@@ -0,0 +1,129 @@
+"""
+Drive an LCUMonitor with generated events.
+SimulatedLCU stands in for lcu_driver's Connector and Connection: the monitor
+registers its real WebSocket handlers on it, and REST requests are answered
+from the state the replayed events have built up.
+"""
+
+import json
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .champ_select import LCUEvent
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[..., Awaitable[None]]
+
+
+class SimulatedResponse:
+    """Subset of the lcu_driver/aiohttp response the monitor reads"""
+
+    def __init__(self, status: int, data: Any = None):
+        self.status = status
+        self.data = data
+
+    async def json(self) -> Any:
+        return self.data
+
+    async def read(self) -> bytes:
+        return json.dumps(self.data).encode("utf-8")
+
+
+class SimulatedConnection:
+    """Answers GET requests from the simulated client state"""
+
+    def __init__(self, lcu: "SimulatedLCU"):
+        self.lcu = lcu
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> SimulatedResponse:
+        if method.lower() != "get" or endpoint not in self.lcu.state:
+            return SimulatedResponse(404)
+        return SimulatedResponse(200, self.lcu.state[endpoint])
+
+
+class SimulatedLCU:
+    """Connector stand-in that replays LCUEvents through registered handlers"""
+
+    def __init__(self, initial_state: Optional[Dict[str, Any]] = None):
+        self.state: Dict[str, Any] = dict(initial_state or {})  # uri -> latest payload
+        self.connection = SimulatedConnection(self)
+        self.events_dispatched = 0
+        self._ready: List[Handler] = []
+        self._close: List[Handler] = []
+        self._handlers: Dict[str, List[Handler]] = {}
+
+    # --- Connector interface used by LCUMonitor._setup_event_handlers ---
+
+    @property
+    def ws(self) -> "SimulatedLCU":
+        return self
+
+    def ready(self, func: Handler) -> Handler:
+        self._ready.append(func)
+        return func
+
+    def close(self, func: Handler) -> Handler:
+        self._close.append(func)
+        return func
+
+    def register(self, uri: str, **kwargs) -> Callable[[Handler], Handler]:
+        def decorator(func: Handler) -> Handler:
+            self._handlers.setdefault(uri, []).append(func)
+            return func
+        return decorator
+
+    async def stop(self) -> None:
+        pass
+
+    # --- Driving a monitor ---
+
+    def attach(self, monitor) -> None:
+        """Register the monitor's handlers here instead of on a real connector"""
+        monitor.connector = self
+        monitor._connection = self.connection
+        monitor._setup_event_handlers()
+
+    async def connect(self) -> None:
+        """Run the ready handlers, as on a new client connection"""
+        for handler in self._ready:
+            await handler(self.connection)
+
+    async def disconnect(self) -> None:
+        for handler in self._close:
+            await handler(self.connection)
+
+    def apply(self, event: LCUEvent) -> None:
+        """Update the REST-visible state the way the client would"""
+        if event.type == "Delete":
+            self.state.pop(event.uri, None)
+        else:
+            self.state[event.uri] = event.data
+
+    async def dispatch(self, event: LCUEvent) -> None:
+        """Apply an event and run its handlers to completion"""
+        self.apply(event)
+        self.events_dispatched += 1
+        for handler in self._handlers.get(event.uri, ()):
+            await handler(self.connection, event)
+
+    async def play(self, events: Iterable[LCUEvent], speed: Optional[float] = None) -> int:
+        """
+        Dispatch events in order. Without a speed they run back to back;
+        otherwise the gaps between their timestamps are replayed divided by speed.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first_at: Optional[float] = None
+        count = 0
+        for event in events:
+            if speed:
+                if first_at is None:
+                    first_at = event.at
+                delay = started + (event.at - first_at) / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await self.dispatch(event)
+            count += 1
+        return count
@@ -0,0 +1,248 @@
+"""
+Local stand-in for the League client API.
+FakeLCUServer serves the REST endpoints the monitor reads over HTTPS (basic
+auth as riot:<password>) and the WAMP-style WebSocket lcu_driver subscribes
+to, and writes a lockfile whose PID is the current process so the lockfile
+scan accepts it as a live client. Events pushed to the server update the REST
+state and are broadcast to subscribers, so the real lcu_driver connection
+path runs unmodified against it.
+"""
+
+import os
+import json
+import base64
+import shutil
+import asyncio
+import logging
+import secrets
+import tempfile
+import subprocess
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+import psutil
+from aiohttp import web, WSMsgType
+
+from .champ_select import LCUEvent, GAMEFLOW_URI
+from lcu_process_scanner import LCUSession, LOCKFILE_NAME
+
+logger = logging.getLogger(__name__)
+
+WAMP_WELCOME = 0
+WAMP_SUBSCRIBE = 5
+WAMP_UNSUBSCRIBE = 6
+JSON_API_EVENT = "OnJsonApiEvent"
+
+_certificate: Optional[Path] = None  # Directory holding the self-signed cert, shared by all servers
+
+
+def _certificate_dir() -> Path:
+    """Create (once per process) a self-signed certificate for 127.0.0.1 with the openssl CLI"""
+    global _certificate
+    if _certificate is None:
+        openssl = shutil.which("openssl")
+        if not openssl:
+            raise RuntimeError("FakeLCUServer needs the openssl command to create its certificate")
+        cert_dir = Path(tempfile.mkdtemp(prefix="fake-lcu-cert-"))
+        subprocess.run(
+            [openssl, "req", "-x509", "-nodes", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1",
+             "-keyout", str(cert_dir / "key.pem"), "-out", str(cert_dir / "cert.pem"),
+             "-days", "1", "-subj", "/CN=127.0.0.1"],
+            check=True, capture_output=True,
+        )
+        _certificate = cert_dir
+    return _certificate
+
+
+def _ssl_context():
+    import ssl
+    cert_dir = _certificate_dir()
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_dir / "cert.pem", cert_dir / "key.pem")
+    return context
+
+
+class FakeLCUServer:
+    """Scriptable League client: REST state, WebSocket events and a lockfile"""
+
+    def __init__(self, install_dir: Optional[str] = None, host: str = "127.0.0.1", port: int = 0,
+                 password: Optional[str] = None, state: Optional[Dict[str, Any]] = None):
+        self.host = host
+        self.port = port  # 0 picks a free port on start
+        self.password = password or secrets.token_urlsafe(16)
+        self.install_dir = install_dir or tempfile.mkdtemp(prefix="fake-lcu-")
+        self.state: Dict[str, Any] = {GAMEFLOW_URI: "None", "/riotclient/region-locale": {"locale": "en_US"}}
+        self.state.update(state or {})
+
+        self.requests: Counter = Counter()  # "GET /path" -> count
+        self.events_sent = 0
+        self.connections = 0
+        self._subscribers: Set[web.WebSocketResponse] = set()
+        self._subscribed = asyncio.Event()
+        self._runner: Optional[web.AppRunner] = None
+
+    # --- Lifecycle ---
+
+    @property
+    def is_running(self) -> bool:
+        return self._runner is not None
+
+    async def start(self) -> None:
+        """Start serving and write the lockfile"""
+        app = web.Application(middlewares=[self._authenticate])
+        app.router.add_get("/", self._websocket)
+        app.router.add_route("*", "/{path:.*}", self._rest)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, ssl_context=_ssl_context())
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        self.write_lockfile()
+        logger.info(f"Fake LCU listening on https://{self.host}:{self.port}")
+
+    async def stop(self, remove_lockfile: bool = True) -> None:
+        """Close subscribers and stop serving (the lockfile is removed like on a client exit)"""
+        for ws in list(self._subscribers):
+            await ws.close()
+        self._subscribers.clear()
+        self._subscribed.clear()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        if remove_lockfile:
+            try:
+                os.remove(self.lockfile_path)
+            except OSError:
+                pass
+
+    async def restart(self, new_credentials: bool = True) -> None:
+        """Simulate a client restart; a real restart picks a new port and password"""
+        await self.stop(remove_lockfile=False)
+        if new_credentials:
+            self.port = 0
+            self.password = secrets.token_urlsafe(16)
+        await self.start()
+
+    # --- Lockfile / session ---
+
+    @property
+    def lockfile_path(self) -> str:
+        return os.path.join(self.install_dir, LOCKFILE_NAME)
+
+    def write_lockfile(self) -> None:
+        """Lockfile naming the current process, so the liveness check passes"""
+        name = psutil.Process().name()
+        with open(self.lockfile_path, "w", encoding="utf-8") as f:
+            f.write(f"{name}:{os.getpid()}:{self.port}:{self.password}:https")
+
+    @property
+    def session(self) -> LCUSession:
+        return LCUSession(port=self.port, auth_token=self.password, install_dir=self.install_dir, pid=os.getpid())
+
+    # --- Scripting ---
+
+    async def wait_for_subscriber(self, timeout: float = 10.0) -> None:
+        """Wait until a client has subscribed to JSON API events"""
+        await asyncio.wait_for(self._subscribed.wait(), timeout)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def set_state(self, uri: str, data: Any) -> None:
+        """Set what a REST GET of uri returns (None makes it 404)"""
+        if data is None:
+            self.state.pop(uri, None)
+        else:
+            self.state[uri] = data
+
+    async def push(self, event: LCUEvent) -> None:
+        """Apply an event to the REST state and send it to every subscriber"""
+        self.set_state(event.uri, None if event.type == "Delete" else event.data)
+        if not self._subscribers:
+            return
+        message = json.dumps(event.to_wamp())
+        for ws in list(self._subscribers):
+            try:
+                await ws.send_str(message)
+            except ConnectionError:
+                self._subscribers.discard(ws)
+        self.events_sent += 1
+
+    async def play(self, events: Iterable[LCUEvent], rate: Optional[float] = None,
+                   speed: Optional[float] = None) -> int:
+        """
+        Push events in order: back to back by default, at a fixed rate
+        (events per second), or following their timestamps divided by speed.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first_at: Optional[float] = None
+        count = 0
+        for event in events:
+            if rate:
+                due = started + count / rate
+            elif speed:
+                if first_at is None:
+                    first_at = event.at
+                due = started + (event.at - first_at) / speed
+            else:
+                due = 0
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.push(event)
+            count += 1
+        return count
+
+    # --- HTTP handlers ---
+
+    @web.middleware
+    async def _authenticate(self, request: web.Request, handler):
+        expected = "Basic " + base64.b64encode(f"riot:{self.password}".encode()).decode()
+        if request.headers.get("Authorization") != expected:
+            # Any response (even this one) ends lcu_driver's unauthenticated wait for the API
+            return web.json_response({"httpStatus": 401, "message": "Unauthorized"}, status=401)
+        return await handler(request)
+
+    async def _rest(self, request: web.Request) -> web.Response:
+        path = "/" + request.match_info["path"]
+        self.requests[f"{request.method} {path}"] += 1
+        if request.method != "GET":
+            return web.json_response({"httpStatus": 405, "message": "Method not allowed"}, status=405)
+        if path not in self.state:
+            return web.json_response(
+                {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": f"No data for {path}"}, status=404)
+        return web.json_response(self.state[path])
+
+    async def _websocket(self, request: web.Request) -> web.StreamResponse:
+        ws = web.WebSocketResponse(max_msg_size=8 * 1024 * 1024)
+        if not ws.can_prepare(request).ok:
+            return web.json_response({"httpStatus": 404, "message": "Not found"}, status=404)
+        await ws.prepare(request)
+        self.connections += 1
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    opcode, topic = json.loads(msg.data)[:2]
+                except (ValueError, TypeError):
+                    continue
+                if topic != JSON_API_EVENT:
+                    continue
+                if opcode == WAMP_SUBSCRIBE:
+                    # lcu_driver reads (and discards) one message after subscribing
+                    await ws.send_str(json.dumps([WAMP_WELCOME, secrets.token_hex(8), 1, "fake-lcu"]))
+                    self._subscribers.add(ws)
+                    self._subscribed.set()
+                elif opcode == WAMP_UNSUBSCRIBE:
+                    self._subscribers.discard(ws)
+        finally:
+            self._subscribers.discard(ws)
+            if not self._subscribers:
+                self._subscribed.clear()
+        return ws
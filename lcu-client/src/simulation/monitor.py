@@ -0,0 +1,76 @@
+"""
+An LCUMonitor wired for simulation: tests, benchmarks and soak runs build
+their monitors here, so a new monitor dependency is stubbed in one place.
+The monitor gets a transmitter that records instead of sending, a champion
+mapper that needs no network, and a disabled draft checkpoint (nothing is
+written to disk).
+"""
+
+from typing import Any, Dict, List, Optional
+
+from draft_checkpoint import DraftCheckpoint
+from lcu_monitor import LCUMonitor
+
+from .driver import SimulatedLCU
+
+WORKSPACE_ID = "simulated-workspace"
+
+
+class RecordingTransmitter:
+    """DataTransmitter stand-in keeping queued drafts and deletion requests instead of sending them"""
+
+    def __init__(self, record: bool = True):
+        self.record = record  # False accepts drafts without keeping them, for throughput runs
+        self.drafts: List[Any] = []
+        self.deletions: List[str] = []
+
+    async def start(self):
+        pass
+
+    async def warm_up(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def queue_draft_data(self, draft_data) -> bool:
+        if self.record:
+            self.drafts.append(draft_data)
+        return True
+
+    async def send_deletion_request(self, lobby_id: str, workspace_id: str) -> bool:
+        if self.record:
+            self.deletions.append(lobby_id)
+        return True
+
+    def clear_blocked_lobbies(self):
+        pass
+
+    def get_queue_size(self) -> int:
+        return 0
+
+
+class EmptyMapper:
+    """Champion mapper without names; drafts keep their raw IDs"""
+
+    def get_name_map(self) -> Dict[int, str]:
+        return {}
+
+
+def create_monitor(lcu: Optional[SimulatedLCU] = None, transmitter: Any = None, champion_mapper: Any = None,
+                   checkpoint: Optional[DraftCheckpoint] = None,
+                   workspace_id: Optional[str] = WORKSPACE_ID) -> LCUMonitor:
+    """
+    A monitor with recording/no-op dependencies unless others are given,
+    attached to lcu when one is passed. workspace_id is set directly because
+    tests don't configure one (connecting re-reads it from the config).
+    """
+    monitor = LCUMonitor()
+    monitor.data_transmitter = transmitter if transmitter is not None else RecordingTransmitter()
+    monitor.champion_mapper = champion_mapper if champion_mapper is not None else EmptyMapper()
+    monitor.checkpoint = checkpoint if checkpoint is not None else DraftCheckpoint(None)
+    if workspace_id:
+        monitor.workspace_id = workspace_id
+    if lcu is not None:
+        lcu.attach(monitor)
+    return monitor
@@ -0,0 +1,235 @@
+"""
+Span tracing for the draft pipeline.
+Each champ select update starts a trace whose ID follows the draft from the
+WebSocket handler through extraction, the transmission queue and the HTTP
+request. Spans are kept in a bounded ring buffer and exported as Chrome trace
+JSON, which chrome://tracing and ui.perfetto.dev open directly.
+"""
+
+import os
+import json
+import time
+import uuid
+import random
+import inspect
+import logging
+import functools
+import threading
+import contextvars
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+
+try:
+    from .config_manager import get_config_manager
+except ImportError:
+    from config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+
+def _now_us() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+@dataclass
+class TraceContext:
+    """Identity of one sampled champ select update, carried on the draft across the queue"""
+    trace_id: str
+    started_at: int  # perf_counter microseconds
+    queued_at: Optional[int] = None
+    handed_off: bool = False  # Set once the draft is queued; the transmitter then ends the trace
+
+
+_current_trace: "contextvars.ContextVar[Optional[TraceContext]]" = contextvars.ContextVar("current_trace", default=None)
+
+
+class _NullSpan:
+    """Returned while tracing is off or the current update isn't sampled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "trace", "args", "start", "activate", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace: TraceContext, args: Dict[str, Any], activate: bool):
+        self.tracer = tracer
+        self.name = name
+        self.trace = trace
+        self.args = args
+        self.start = 0
+        self.activate = activate
+        self._token = None
+
+    def __enter__(self):
+        # Spans opened for an explicit trace make it current for nested spans
+        if self.activate:
+            self._token = _current_trace.set(self.trace)
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _now_us()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._record_span(self.name, self.trace, self.start, end - self.start, self.args)
+        if self._token is not None:
+            _current_trace.reset(self._token)
+        return False
+
+
+class _TraceRoot(_Span):
+    """Root span of a champ select update; ends the trace unless the draft was queued"""
+
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        if not self.trace.handed_off:
+            self.tracer.finish(self.trace, outcome="not_queued")
+        return False
+
+
+class Tracer:
+    """Records sampled spans into a bounded buffer of Chrome trace events"""
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 1.0, max_events: int = 50000):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()  # Export may run on another thread than the pipeline
+        self._pid = os.getpid()
+
+    def trace(self, name: str, **args):
+        """Start a new (possibly sampled out) trace and make it current"""
+        if not self.enabled or random.random() >= self.sample_rate:
+            return _NULL_SPAN
+        trace = TraceContext(trace_id=uuid.uuid4().hex[:16], started_at=_now_us())
+        self._record_async("b", trace, trace.started_at, args)
+        return _TraceRoot(self, name, trace, args, activate=True)
+
+    def span(self, name: str, trace: Optional[TraceContext] = None, **args):
+        """Time a block as part of the given or current trace (no-op when there is none)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        if trace is None:
+            trace = _current_trace.get()
+            if trace is None:
+                return _NULL_SPAN
+            return _Span(self, name, trace, args, activate=False)
+        return _Span(self, name, trace, args, activate=True)
+
+    def current(self) -> Optional[TraceContext]:
+        """The trace of the update being processed, to attach to the draft it produces"""
+        return _current_trace.get() if self.enabled else None
+
+    def mark_queued(self, trace: Optional[TraceContext]) -> None:
+        """The draft entered the transmission queue; the transmitter now owns the trace"""
+        if trace is not None:
+            trace.handed_off = True
+            trace.queued_at = _now_us()
+
+    def record_queue_wait(self, trace: Optional[TraceContext]) -> None:
+        """Record the time a draft spent queued and batching, ending now"""
+        if trace is not None and trace.queued_at is not None:
+            now = _now_us()
+            self._record_span("queued", trace, trace.queued_at, now - trace.queued_at, {})
+
+    def finish(self, trace: Optional[TraceContext], **args) -> None:
+        """End a trace; its duration is the update's end-to-end latency"""
+        if trace is not None:
+            self._record_async("e", trace, _now_us(), args)
+
+    def _thread_id(self) -> int:
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def _record_span(self, name: str, trace: TraceContext, start: int, duration: int, args: Dict[str, Any]) -> None:
+        event = {
+            "name": name, "cat": "lcu", "ph": "X", "ts": start, "dur": duration,
+            "pid": self._pid, "tid": self._thread_id(), "args": dict(args, trace_id=trace.trace_id),
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def _record_async(self, phase: str, trace: TraceContext, ts: int, args: Dict[str, Any]) -> None:
+        # Async begin/end pairs share the trace ID, so each update gets its own track
+        event = {
+            "name": "draft_update", "cat": "draft", "ph": phase, "id": trace.trace_id, "ts": ts,
+            "pid": self._pid, "tid": self._thread_id(), "args": dict(args, trace_id=trace.trace_id),
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def get_events(self) -> list:
+        """Buffered events plus thread name metadata, in Chrome trace event format"""
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        return metadata + events
+
+    def export_chrome_trace(self, output_dir: Optional[Path] = None) -> Path:
+        """Write buffered events to a timestamped Chrome trace JSON file and return its path"""
+        if output_dir is None:
+            config_manager = get_config_manager()
+            output_dir = Path(config_manager.get_settings().get("tracing", {}).get("output_dir", "traces"))
+            if not output_dir.is_absolute():
+                output_dir = config_manager.config_dir.parent / output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        events = self.get_events()
+        path = output_dir / f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logger.info(f"Exported {len(events)} trace event(s) to {path}")
+        return path
+
+
+def traced(name: str):
+    """Decorator timing a sync or async function as a span of the current trace"""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with get_tracer().span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Global tracer, created on first use
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (configured by the tracing settings)"""
+    global _tracer
+    if _tracer is None:
+        settings = get_config_manager().get_settings().get("tracing", {})
+        _tracer = Tracer(
+            enabled=settings.get("enabled", False),
+            sample_rate=float(settings.get("sample_rate", 1.0)),
+            max_events=int(settings.get("max_events", 50000)),
+        )
+    return _tracer
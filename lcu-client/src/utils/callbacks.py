@@ -0,0 +1,35 @@
+"""
+Qt-free callback signals.
+CallbackSignal mirrors the connect/disconnect/emit API of a Qt Signal so core
+services can publish status without importing PySide6; the Qt GUI is just one
+subscriber.
+"""
+
+import logging
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackSignal:
+    """Synchronous signal: emit() calls every connected callback in order"""
+
+    def __init__(self):
+        self._callbacks: List[Callable[..., None]] = []
+
+    def connect(self, callback: Callable[..., None]) -> None:
+        """Connect a callback"""
+        self._callbacks.append(callback)
+
+    def disconnect(self, callback: Callable[..., None]) -> None:
+        """Disconnect a callback"""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def emit(self, *args) -> None:
+        """Call all connected callbacks; a failing callback does not affect the others"""
+        for callback in list(self._callbacks):
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Signal callback failed: {e}", exc_info=True)
@@ -0,0 +1,34 @@
+"""
+JSON encoding to (and decoding from) UTF-8 bytes with an optional fast backend.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes or str"""
+        return orjson.loads(data)
+else:
+    BACKEND = "json"
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes or str"""
+        return json.loads(data)
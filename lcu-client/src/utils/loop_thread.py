@@ -0,0 +1,92 @@
+"""
+Dedicated asyncio event loop in a worker thread.
+Lets the LCU pipeline (WebSocket handling, extraction, transmission) run
+independently of the Qt GUI thread; other threads hand work over with
+call() / submit().
+"""
+
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from typing import Any, Awaitable, Callable, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """Owns an asyncio loop running forever in a daemon thread"""
+
+    def __init__(self, name: str = "event-loop"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the worker thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> None:
+        """Start the thread and wait until its loop is running (no-op if already running)"""
+        if self.is_running:
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        logger.debug(f"Event loop thread '{self.name}' started")
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        loop.call_soon(self._ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            # Give tasks still pending (watchers, connector) a chance to unwind
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def call(self, callback: Callable[..., Any], *args) -> None:
+        """Schedule callback(*args) on the worker loop (fire and forget)"""
+        if self.in_loop_thread():
+            callback(*args)
+            return
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Run a coroutine on the worker loop; the returned future can be waited on from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, shutdown: Optional[Callable[[], Awaitable[Any]]] = None, timeout: float = 5.0) -> None:
+        """
+        Await an optional shutdown coroutine on the worker loop, then stop the
+        loop and join the thread (each step bounded by timeout).
+        """
+        if not self.is_running:
+            return
+
+        if shutdown is not None:
+            try:
+                self.submit(shutdown()).result(timeout)
+            except Exception as e:
+                logger.warning(f"Shutdown on '{self.name}' did not finish cleanly: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"Event loop thread '{self.name}' did not stop within {timeout}s")
+        else:
+            logger.debug(f"Event loop thread '{self.name}' stopped")
+        self._thread = None
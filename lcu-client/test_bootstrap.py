@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the initial-state bootstrap when the monitor connects to a client.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, CHAMP_SELECT_URI, GAMEFLOW_URI, LOBBY_URI
+from simulation.driver import SimulatedLCU, SimulatedConnection
+from simulation.monitor import RecordingTransmitter, create_monitor
+from lcu_monitor import MonitorState
+
+REQUEST_DELAY = 0.05
+
+
+class _WarmingTransmitter(RecordingTransmitter):
+    """Warming up takes a request"""
+
+    def __init__(self):
+        super().__init__()
+        self.warmed = False
+
+    async def warm_up(self):
+        await asyncio.sleep(REQUEST_DELAY)
+        self.warmed = True
+
+
+class _SlowMapper:
+    """Loads its names on whichever thread asks first"""
+
+    def __init__(self):
+        self.loaded_on = None
+
+    def get_name_map(self):
+        if self.loaded_on is None:
+            time.sleep(REQUEST_DELAY)
+            self.loaded_on = threading.get_ident()
+        return {}
+
+
+class _SlowConnection(SimulatedConnection):
+    """Every request takes REQUEST_DELAY, like a busy client"""
+
+    def __init__(self, lcu):
+        super().__init__(lcu)
+        self.requests = []
+
+    async def request(self, method, endpoint, **kwargs):
+        self.requests.append(endpoint)
+        await asyncio.sleep(REQUEST_DELAY)
+        return await super().request(method, endpoint, **kwargs)
+
+
+def _mid_draft(seed: int, locked_updates: int):
+    """A client that was already in champ select, and the events that follow"""
+    events = ChampSelectGenerator(seed=seed).draft(DraftScenario(hovers=(0, 0)))
+    updates = [i for i, e in enumerate(events) if e.uri == CHAMP_SELECT_URI]
+    cut = updates[locked_updates] + 1
+    lcu = SimulatedLCU()
+    for event in events[:cut]:
+        lcu.apply(event)
+    lcu.connection = _SlowConnection(lcu)
+    return lcu, events[cut:]
+
+
+def _monitor(lcu):
+    monitor = create_monitor(transmitter=_WarmingTransmitter(), champion_mapper=_SlowMapper(), workspace_id=None)
+    monitor.rest_poller.enabled = False
+    lcu.attach(monitor)
+    return monitor
+
+
+def _configured():
+    return mock.patch("config_manager.ConfigManager.get_workspace_id", return_value="simulated-workspace")
+
+
+def test_mid_draft_start_sends_existing_picks():
+    """Started mid-draft, the picks already made are queued during connect"""
+    lcu, _ = _mid_draft(seed=8, locked_updates=24)
+    session = lcu.state[CHAMP_SELECT_URI]
+    locked = sum(1 for group in session["actions"] for a in group if a["type"] == "pick" and a["completed"])
+    assert locked
+
+    async def run():
+        monitor = _monitor(lcu)
+        start = time.perf_counter()
+        with _configured():
+            await lcu.connect()
+        return monitor, time.perf_counter() - start
+
+    monitor, elapsed = asyncio.run(run())
+    assert monitor.state == MonitorState.MONITORING_CHAMP_SELECT
+    assert monitor.current_lobby_id == str(session["gameId"])
+    draft = monitor.data_transmitter.drafts[0]
+    assert len(draft.blue_side.picks) + len(draft.red_side.picks) == locked
+
+    # Three endpoints, fetched once each and together; warm-ups ran alongside
+    assert sorted(lcu.connection.requests) == sorted([GAMEFLOW_URI, LOBBY_URI, CHAMP_SELECT_URI])
+    assert elapsed < 2.5 * REQUEST_DELAY
+    assert monitor.data_transmitter.warmed
+    assert monitor.champion_mapper.loaded_on != threading.get_ident()
+    print("✅ Bootstrap fetches initial state concurrently and queues existing picks")
+
+
+def test_websocket_event_during_bootstrap_wins():
+    """A gameflow event that lands while the bootstrap is fetching is newer than its result"""
+    lcu, rest = _mid_draft(seed=12, locked_updates=4)
+    game_start = next(e for e in rest if e.uri == GAMEFLOW_URI and e.data == "GameStart")
+
+    async def run():
+        monitor = _monitor(lcu)
+        with _configured():
+            connecting = asyncio.ensure_future(lcu.connect())
+            await asyncio.sleep(REQUEST_DELAY / 2)
+            await monitor._process_gameflow_phase("ChampSelect")
+            await lcu.dispatch(game_start)
+            await connecting
+        return monitor
+
+    monitor = asyncio.run(run())
+    assert monitor.current_phase == "GameStart"
+    assert monitor.state == MonitorState.GAME_STARTED
+    monitor.low_footprint.exit()
+    print("✅ Newer WebSocket state is not overwritten by the bootstrap")
+
+
+def test_idle_client():
+    """Outside champ select the bootstrap only records the phase and lobby"""
+    lcu = SimulatedLCU({GAMEFLOW_URI: "Lobby", LOBBY_URI: {"gameId": 42}})
+    lcu.connection = _SlowConnection(lcu)
+
+    async def run():
+        monitor = _monitor(lcu)
+        with _configured():
+            await lcu.connect()
+        return monitor
+
+    monitor = asyncio.run(run())
+    assert monitor.state == MonitorState.IDLE
+    assert monitor.current_phase == "Lobby"
+    assert monitor.current_lobby_id == "42"
+    assert not monitor.data_transmitter.drafts
+    print("✅ Bootstrap of an idle client sets phase and lobby only")
+
+
+if __name__ == "__main__":
+    test_mid_draft_start_sends_existing_picks()
+    test_websocket_event_during_bootstrap_wins()
+    test_idle_client()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic champ select generator and the simulated client driver.
+"""
+
+import sys
+import asyncio
+import itertools
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import (
+    ChampSelectGenerator, DraftScenario, CHAMP_SELECT_URI, GAMEFLOW_URI, BLUE_TEAM, RED_TEAM
+)
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from lcu_monitor import MonitorState
+
+
+def _monitor():
+    lcu = SimulatedLCU()
+    return create_monitor(lcu), lcu
+
+
+def _final_session(events):
+    return [e for e in events if e.uri == CHAMP_SELECT_URI and e.type != "Delete"][-1].data
+
+
+def test_same_seed_same_events():
+    """A seed fully determines the generated traffic"""
+    first = list(itertools.islice(ChampSelectGenerator(seed=42).stream(), 2000))
+    second = list(itertools.islice(ChampSelectGenerator(seed=42).stream(), 2000))
+    other = list(itertools.islice(ChampSelectGenerator(seed=43).stream(), 2000))
+    assert first == second
+    assert first != other
+    assert all(a.at <= b.at for a, b in zip(first, first[1:]))
+    print("✅ Same seed produces the same events")
+
+
+def test_tournament_draft_order():
+    """A full draft locks 10 unique bans and picks in tournament order"""
+    events = ChampSelectGenerator(seed=7).draft(DraftScenario(local_team=BLUE_TEAM))
+    session = _final_session(events)
+    actions = [action for group in session["actions"] for action in group]
+
+    assert [(a["type"], a["actorCellId"] < 5) for a in actions[:7]] == [
+        ("ban", True), ("ban", False), ("ban", True), ("ban", False), ("ban", True), ("ban", False), ("pick", True)
+    ]
+    assert all(a["completed"] for a in actions) and len(actions) == 20
+    assert len({a["championId"] for a in actions}) == 20
+    assert session["timer"]["phase"] == "FINALIZATION"
+    phases = [e.data for e in events if e.uri == GAMEFLOW_URI]
+    assert phases[:4] == ["Lobby", "Matchmaking", "ReadyCheck", "ChampSelect"]
+    assert "InProgress" in phases and phases[-1] == "None"
+    print("✅ Tournament draft order is followed")
+
+
+def test_high_rate_timer_updates():
+    """Timer-only updates raise the event rate without changing actions"""
+    quiet = ChampSelectGenerator(seed=3).draft(DraftScenario())
+    busy = ChampSelectGenerator(seed=3).draft(DraftScenario(timer_updates_per_second=20))
+    assert len(busy) > 10 * len(quiet)
+    assert _final_session(busy)["actions"] == _final_session(quiet)["actions"]
+    print(f"✅ Timer updates raise the event count ({len(quiet)} -> {len(busy)})")
+
+
+def test_monitor_tracks_generated_draft_with_swaps():
+    """Driven through its real handlers, the monitor ends up with the drafted (pre-swap) picks"""
+    events = ChampSelectGenerator(seed=11).draft(DraftScenario(swaps=3, local_team=RED_TEAM))
+    monitor, lcu = _monitor()
+
+    async def scenario():
+        game_start = next(i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "GameStart")
+        await lcu.play(events[:game_start])
+        assert monitor.state == MonitorState.MONITORING_CHAMP_SELECT
+        await lcu.play(events[game_start:])
+
+    asyncio.run(scenario())
+
+    transmitter = monitor.data_transmitter
+    assert transmitter.drafts and not transmitter.deletions
+    draft = transmitter.drafts[-1]
+    session = _final_session(events)
+    locked = [a for group in session["actions"] for a in group]
+    cell_team = {m["cellId"]: m["team"] for m in session["myTeam"] + session["theirTeam"]}
+    assert draft.blue_side.bans == [a["championId"] for a in locked if a["type"] == "ban" and cell_team[a["actorCellId"]] == 1]
+    assert draft.lobby_id == str(session["gameId"])
+    assert len(draft.blue_side.picks) == len(draft.red_side.picks) == 5
+
+    # Swaps change the pick actions afterwards, but the drafted champions stick
+    drafted = next(e.data for e in events if e.uri == CHAMP_SELECT_URI and e.data
+                   and e.data["timer"]["phase"] == "FINALIZATION")
+    assert drafted["actions"] != session["actions"]
+    drafted_picks = [a["championId"] for group in drafted["actions"] for a in group
+                     if a["type"] == "pick" and cell_team[a["actorCellId"]] == 2]
+    assert draft.red_side.picks == drafted_picks
+    assert monitor.state == MonitorState.IDLE
+    print(f"✅ Monitor tracked the generated draft ({len(transmitter.drafts)} drafts queued)")
+
+
+def test_dodge_deletes_draft():
+    """A dodge after some locks deletes the draft that was sent"""
+    events = ChampSelectGenerator(seed=5).draft(DraftScenario(dodge_after=8))
+    monitor, lcu = _monitor()
+    asyncio.run(lcu.play(events))
+
+    transmitter = monitor.data_transmitter
+    assert transmitter.drafts
+    assert transmitter.deletions == [transmitter.drafts[-1].lobby_id]
+    assert monitor.state == MonitorState.IDLE
+    print("✅ Dodge deletes the queued draft")
+
+
+def test_bot_game_preselected_champions():
+    """Bot picks are locked in the first champ select payload"""
+    events = ChampSelectGenerator(seed=9).draft(DraftScenario(bots=True, local_team=BLUE_TEAM))
+    create = next(e for e in events if e.uri == CHAMP_SELECT_URI and e.type == "Create")
+    bot_actions = [a for a in create.data["actions"][0] if not a["isAllyAction"]]
+    assert len(bot_actions) == 5 and all(a["completed"] and a["championId"] for a in bot_actions)
+    assert create.data["bans"]["numBans"] == 0
+
+    monitor, lcu = _monitor()
+    asyncio.run(lcu.play(events))
+    assert monitor.data_transmitter.drafts[0].red_side.picks == [a["championId"] for a in bot_actions]
+    print("✅ Bot games start with pre-selected champions")
+
+
+def test_replay_speed():
+    """With a speed, replay follows the event timestamps"""
+    events = ChampSelectGenerator(seed=1).draft(DraftScenario(hovers=(0, 0), action_seconds=(1, 1)))
+    events = [e for e in events if e.uri == CHAMP_SELECT_URI][:4]
+    span = events[-1].at - events[0].at
+    lcu = SimulatedLCU()
+
+    async def timed():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await lcu.play(events, speed=span / 0.2)
+        return loop.time() - start
+
+    elapsed = asyncio.run(timed())
+    assert 0.15 < elapsed < 1.0
+    assert lcu.events_dispatched == 4
+    print("✅ Replay follows event timestamps at the requested speed")
+
+
+if __name__ == "__main__":
+    test_same_seed_same_events()
+    test_tournament_draft_order()
+    test_high_rate_timer_updates()
+    test_monitor_tracks_generated_draft_with_swaps()
+    test_dodge_deletes_draft()
+    test_bot_game_preselected_champions()
+    test_replay_speed()
+    print("🎉 All champ select generator tests passed!")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the champion mapper's ID -> name map refresh.
+"""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from champion_mapper import ChampionMapper
+
+
+class _Response:
+    def __init__(self, champions):
+        self._data = {"data": {name: {"key": str(champion_id), "id": name} for champion_id, name in champions.items()}}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+def test_refresh_replaces_the_name_map():
+    """A refresh swaps in a new map; a map handed out earlier stays complete"""
+    mapper = ChampionMapper()
+    with mock.patch("requests.get", return_value=_Response({157: "Yasuo", 64: "LeeSin"})):
+        assert mapper._load_champion_data("15.5.1")
+    names = mapper.get_name_map()
+
+    with mock.patch("requests.get", return_value=_Response({157: "Yasuo", 64: "LeeSin", 950: "Naafiri"})):
+        assert mapper._load_champion_data("15.6.1")
+
+    assert names == {157: "Yasuo", 64: "LeeSin"}
+    assert mapper.get_name_map() == {157: "Yasuo", 64: "LeeSin", 950: "Naafiri"}
+    assert mapper.get_champion_id("Naafiri") == 950
+    print("✅ Champion map refreshes don't touch maps already handed out")
+
+
+if __name__ == "__main__":
+    test_refresh_replaces_the_name_map()
+    print("🎉 All champion mapper tests passed!")
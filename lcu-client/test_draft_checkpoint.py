@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for draft checkpoints: a client restarted mid-draft resumes the same
+game instead of starting a new one.
+"""
+
+import sys
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, CHAMP_SELECT_URI
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from lcu_monitor import MonitorState
+from draft_checkpoint import DraftCheckpoint
+
+
+def _configured():
+    return mock.patch("config_manager.ConfigManager.get_workspace_id", return_value="simulated-workspace")
+
+
+def _monitor(lcu, path):
+    monitor = create_monitor(checkpoint=DraftCheckpoint(path), workspace_id=None)
+    monitor.rest_poller.enabled = False
+    lcu.attach(monitor)
+    return monitor
+
+
+def _split(seed: int, locked_updates: int):
+    """A generated draft, cut after the given champ select update"""
+    events = ChampSelectGenerator(seed=seed).draft(DraftScenario(hovers=(0, 0)))
+    updates = [i for i, e in enumerate(events) if e.uri == CHAMP_SELECT_URI]
+    cut = updates[locked_updates] + 1
+    return events[:cut], events[cut:]
+
+
+def _pick_times(draft):
+    return [e.timestamp for side in (draft.blue_side, draft.red_side) for e in side.pick_events]
+
+
+def test_restart_mid_draft_resumes():
+    """After a restart the draft continues as the same game, with its earlier pick times"""
+    before, after = _split(seed=8, locked_updates=24)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "draft_checkpoint.json"
+
+        async def first_run():
+            lcu = SimulatedLCU()
+            monitor = _monitor(lcu, path)
+            with _configured():
+                await lcu.connect()
+                await lcu.play(before)
+            monitor.checkpoint.flush()
+            return lcu, monitor
+
+        lcu, first = asyncio.run(first_run())
+        assert first.data_transmitter.drafts[0].is_new_game
+        sent_before = first.data_transmitter.drafts[-1]
+        assert _pick_times(sent_before)
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved["lobby_id"] == first.current_lobby_id
+
+        async def second_run():
+            # Same client state, new process
+            restarted = SimulatedLCU(dict(lcu.state))
+            monitor = _monitor(restarted, path)
+            with _configured():
+                await restarted.connect()
+                resumed = list(monitor.data_transmitter.drafts)
+                await restarted.play(after)
+            return monitor, resumed
+
+        second, resumed = asyncio.run(second_run())
+
+    # The resumed draft is sent once, as an update of the existing document
+    assert len(resumed) == 1
+    assert resumed[0].lobby_id == sent_before.lobby_id
+    assert not resumed[0].is_new_game
+    assert not any(draft.is_new_game for draft in second.data_transmitter.drafts)
+    assert _pick_times(resumed[0])[:len(_pick_times(sent_before))] == _pick_times(sent_before)
+    assert second.state == MonitorState.IDLE
+    assert not path.exists()  # Cleared when the game ended
+    print("✅ Restart mid-draft resumes the same game with its pick times")
+
+
+def test_other_game_is_not_resumed():
+    """A checkpoint from another lobby is discarded and the draft starts as a new game"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "draft_checkpoint.json"
+        DraftCheckpoint(path).save({"lobby_id": "1", "workspace_id": "simulated-workspace",
+                                    "action_timestamps": {}, "initial_picks": {}, "draft": None})
+        before, _ = _split(seed=3, locked_updates=10)
+        lcu = SimulatedLCU()
+        for event in before:
+            lcu.apply(event)
+
+        async def run():
+            monitor = _monitor(lcu, path)
+            with _configured():
+                await lcu.connect()
+            monitor.checkpoint.flush()
+            return monitor
+
+        monitor = asyncio.run(run())
+        assert monitor.data_transmitter.drafts[0].is_new_game
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved["lobby_id"] == monitor.current_lobby_id != "1"
+    print("✅ A checkpoint for another game is not resumed")
+
+
+def test_saves_coalesce_and_expire():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "draft_checkpoint.json"
+        checkpoint = DraftCheckpoint(path, max_age_seconds=60)
+
+        async def burst():
+            for i in range(50):
+                checkpoint.save({"lobby_id": "42", "updates": i})
+            checkpoint.flush()
+
+        writes = []
+        original = checkpoint._write_pending
+
+        def counting():
+            writes.append(checkpoint._pending)
+            original()
+
+        checkpoint._write_pending = counting
+        asyncio.run(burst())
+        assert checkpoint.load()["updates"] == 49
+        assert sum(1 for item in writes if item is not None) < 50
+
+        checkpoint.clear()
+        assert checkpoint.load() is None
+
+        checkpoint.save({"lobby_id": "42"})
+        with mock.patch("draft_checkpoint.time.time", return_value=time.time() + 120):
+            assert checkpoint.load() is None
+        path.write_text("{not json", encoding="utf-8")
+        assert checkpoint.load() is None
+
+    disabled = DraftCheckpoint(None)
+    disabled.save({"lobby_id": "42"})
+    assert not disabled.enabled and disabled.load() is None
+    print("✅ Saves coalesce, and cleared, stale or corrupt checkpoints are ignored")
+
+
+if __name__ == "__main__":
+    test_restart_mid_draft_resumes()
+    test_other_game_is_not_resumed()
+    test_saves_coalesce_and_expire()
+    print("🎉 All draft checkpoint tests passed!")
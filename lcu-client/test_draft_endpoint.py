@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the lcuDraft stand-in and the transmission load tool.
+"""
+
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import aiohttp
+from simulation.draft_endpoint import DraftEndpointStandIn
+
+import bench_transmission_load
+
+DRAFT = {
+    "lobbyId": "6100000001",
+    "workspaceId": "ws",
+    "phase": "BAN_PICK",
+    "blue_side": {"picks": [], "bans": [1]},
+    "red_side": {"picks": [], "bans": []},
+    "isNewGame": True,
+}
+
+
+async def _post(session, endpoint, body):
+    async with session.post(endpoint.url, json=body) as response:
+        return response.status, await response.json()
+
+
+def test_function_semantics():
+    """Validation, create/update, delete and resurrection follow the function"""
+    async def scenario():
+        endpoint = DraftEndpointStandIn(firestore_latency=0)
+        await endpoint.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(endpoint.url, params={"action": "validate", "workspaceId": "ws",
+                                                             "passwordHash": "x"}) as response:
+                    assert response.status == 200
+                assert (await _post(session, endpoint, {**DRAFT, "lobbyId": "UNKNOWN"}))[0] == 400
+                ghost = {**DRAFT, "blue_side": {"picks": [], "bans": []}}
+                assert (await _post(session, endpoint, ghost))[0] == 400
+
+                assert (await _post(session, endpoint, DRAFT))[1]["message"] == "Draft created"
+                assert (await _post(session, endpoint, {**DRAFT, "isNewGame": False}))[1]["message"] == "Draft updated"
+                assert endpoint.redundant_writes == 1
+                assert list(endpoint.documents["ws"]) == ["6100000001_1"]
+
+                delete = {"action": "delete", "lobbyId": DRAFT["lobbyId"], "workspaceId": "ws"}
+                assert (await _post(session, endpoint, delete))[0] == 200
+                assert (await _post(session, endpoint, delete))[0] == 404
+                await _post(session, endpoint, DRAFT)
+                assert endpoint.resurrected_documents == 1
+        finally:
+            await endpoint.stop()
+
+        stats = endpoint.get_stats()
+        assert stats["firestore_deletes"] == 1 and stats["documents"] == 1
+        assert stats["responses"]["draft 200"] == 3
+    asyncio.run(scenario())
+    print("✅ Stand-in follows the lcuDraft function")
+
+
+def test_concurrent_first_writes_duplicate():
+    """Racing first writes across lobbies leave some lobbies with more than one document"""
+    async def scenario():
+        endpoint = DraftEndpointStandIn(firestore_latency=0.01, seed=1)
+        await endpoint.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                drafts = [{**DRAFT, "lobbyId": str(6100000000 + lobby)} for lobby in range(10) for _ in range(3)]
+                results = await asyncio.gather(*(_post(session, endpoint, draft) for draft in drafts))
+        finally:
+            await endpoint.stop()
+        assert all(status == 200 for status, _ in results)
+        per_lobby = {}
+        for doc in endpoint.documents["ws"].values():
+            per_lobby[doc["lobbyId"]] = per_lobby.get(doc["lobbyId"], 0) + 1
+        assert endpoint.duplicate_documents == sum(count - 1 for count in per_lobby.values()) > 0
+    asyncio.run(scenario())
+    print("✅ Concurrent first writes are counted as duplicates")
+
+
+def test_load_run():
+    """A small load run drives real monitors and transmitters against the stand-in"""
+    args = argparse.Namespace(lobbies=2, players=2, analysts=1, speed=2000.0, skew_ms=5.0, dodge_rate=0.0,
+                              firestore_ms=1.0, failure_rate=0.0, retries=0, retry_delay=0.0, seed=3)
+    assert asyncio.run(bench_transmission_load.run(args)) == 0
+    print("✅ Load tool runs end to end")
+
+
+if __name__ == "__main__":
+    test_function_semantics()
+    test_concurrent_first_writes_duplicate()
+    test_load_run()
+    print("🎉 All draft endpoint tests passed!")
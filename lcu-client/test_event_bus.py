@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the notification event bus: asynchronous delivery, overflow
+policies and topic filtering.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, GAMEFLOW_URI
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from event_bus import EventBus, OverflowPolicy
+from notifications import MonitorNotifier, Notification, NotificationType
+
+
+def _notification(kind: NotificationType = NotificationType.DRAFT_SAVED, lobby_id: str = "1", **data):
+    return Notification(type=kind, message=kind.value, timestamp=datetime.now(), data={"lobby_id": lobby_id, **data})
+
+
+def test_slow_subscriber_does_not_block_publisher():
+    """A blocking callback runs off the loop; publishing returns immediately"""
+    bus = EventBus()
+    received = []
+
+    def slow(notification):
+        time.sleep(0.1)
+        received.append((notification, threading.get_ident()))
+
+    bus.subscribe(slow)
+
+    async def run():
+        start = time.perf_counter()
+        for i in range(3):
+            bus.publish(_notification(picks=i))
+        published = time.perf_counter() - start
+        assert await bus.drain(timeout=2)
+        return published
+
+    published = asyncio.run(run())
+    assert published < 0.05
+    assert [n.data["picks"] for n, _ in received] == [0, 1, 2]
+    assert all(thread != threading.get_ident() for _, thread in received)
+    print(f"✅ Publishing to a slow subscriber took {published * 1000:.2f} ms")
+
+
+def test_overflow_policies():
+    """Full queues drop the oldest, drop the newest, or coalesce per type and lobby"""
+    async def run(policy):
+        bus = EventBus(max_queue=3, policy=policy)
+        gate = asyncio.Event()
+        received = []
+
+        async def blocked(notification):
+            await gate.wait()
+            received.append(notification.data["picks"])
+
+        subscription = bus.subscribe(blocked)
+        bus.publish(_notification(picks=0))
+        await asyncio.sleep(0)  # The worker takes the first one and waits on the gate
+        for i in range(1, 7):
+            bus.publish(_notification(picks=i))
+        bus.publish(_notification(NotificationType.GAME_STARTED, picks="start"))
+        gate.set()
+        await bus.drain(timeout=1)
+        return received, subscription.stats
+
+    received, stats = asyncio.run(run(OverflowPolicy.DROP_OLDEST))
+    assert received == [0, 5, 6, "start"] and stats["dropped"] == 4
+    received, stats = asyncio.run(run(OverflowPolicy.DROP_NEWEST))
+    assert received == [0, 1, 2, 3] and stats["dropped"] == 4
+    received, stats = asyncio.run(run(OverflowPolicy.COALESCE))
+    assert received == [0, 6, "start"] and stats["coalesced"] == 5 and stats["dropped"] == 0
+    print("✅ Overflow policies drop or coalesce as configured")
+
+
+def test_topic_filter_and_failures():
+    """Subscribers only see their types; a failing subscriber doesn't affect others"""
+    notifier = MonitorNotifier()
+    games, everything = [], []
+
+    def broken(notification):
+        raise RuntimeError("webhook down")
+
+    notifier.subscribe(games.append, topics=[NotificationType.GAME_STARTED, NotificationType.GAME_ENDED])
+    notifier.subscribe(broken, name="broken")
+    notifier.subscribe(everything.append)
+
+    async def run():
+        notifier.on_champ_select_started("1")
+        notifier.on_draft_saved("1", 2, 4)
+        notifier.on_game_started("1")
+        await notifier.bus.drain(timeout=1)
+
+    asyncio.run(run())
+    assert [n.type for n in games] == [NotificationType.GAME_STARTED]
+    assert len(everything) == 3
+    assert notifier.bus.get_stats()["broken"]["failed"] == 3
+
+    notifier.unsubscribe(everything.append)
+    notifier.on_game_ended("1")  # No loop: delivered inline
+    assert len(everything) == 3 and [n.type for n in games][-1] == NotificationType.GAME_ENDED
+    print("✅ Topic filtering and subscriber isolation")
+
+
+def test_monitor_latency_with_slow_integration():
+    """A slow DRAFT_SAVED subscriber doesn't slow down draft processing"""
+    events = ChampSelectGenerator(seed=2).draft(DraftScenario(hovers=(0, 0)))
+    game_start = next(i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "GameStart")
+
+    received = []
+
+    async def overlay(notification):
+        await asyncio.sleep(0.05)
+        received.append(notification)
+
+    async def run():
+        lcu = SimulatedLCU()
+        monitor = create_monitor(lcu)
+        monitor.notifier = MonitorNotifier()
+        monitor.notifier.subscribe(overlay, topics=[NotificationType.DRAFT_SAVED], policy=OverflowPolicy.COALESCE)
+        start = time.perf_counter()
+        await lcu.play(events[:game_start])
+        elapsed = time.perf_counter() - start
+        await monitor.notifier.bus.drain(timeout=2)
+        return monitor, elapsed
+
+    monitor, elapsed = asyncio.run(run())
+    drafts = len(monitor.data_transmitter.drafts)
+    assert drafts > 10
+    assert elapsed < drafts * 0.05 / 2
+    # Coalesced: the overlay ends on the final draft without seeing every intermediate one
+    assert len(received) < drafts
+    assert received[-1].data["picks"] == 10
+    print(f"✅ {drafts} drafts processed in {elapsed * 1000:.0f} ms next to a 50 ms subscriber")
+
+
+if __name__ == "__main__":
+    test_slow_subscriber_does_not_block_publisher()
+    test_overflow_policies()
+    test_topic_filter_and_failures()
+    test_monitor_latency_with_slow_integration()
+    print("🎉 All event bus tests passed!")
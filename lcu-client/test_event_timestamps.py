@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for pick and ban timestamps: the monitor stamps actions with the LCU
+session time, not with when an update happened to be processed.
+"""
+
+import sys
+import asyncio
+import itertools
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, CHAMP_SELECT_URI, GAMEFLOW_URI
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+
+
+def test_event_times_follow_lcu_clock():
+    """Pick and ban times come from the session timer, not from when the update was processed"""
+    events = ChampSelectGenerator(seed=4).draft(DraftScenario(hovers=(0, 0)))
+    lcu = SimulatedLCU()
+    monitor = create_monitor(lcu)
+    game_start = next(i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "GameStart")
+    asyncio.run(lcu.play(events[:game_start]))  # A whole draft replayed in a few milliseconds
+
+    # Each action is stamped with the LCU time of the update that first showed it completed
+    locked_at = {}
+    for event in events[:game_start]:
+        if event.uri == CHAMP_SELECT_URI and event.data:
+            for action in itertools.chain.from_iterable(event.data["actions"]):
+                if action["completed"]:
+                    locked_at.setdefault(action["championId"], event.data["timer"]["internalNowInEpochMs"])
+
+    draft = monitor.data_transmitter.drafts[-1]
+    events_by_champion = {e.champion_id: e.timestamp for side in (draft.blue_side, draft.red_side)
+                          for e in side.pick_events + side.ban_events}
+    assert len(events_by_champion) == 20
+    assert all(isinstance(timestamp, int) for timestamp in events_by_champion.values())
+    assert events_by_champion == {champion: locked_at[champion] for champion in events_by_champion}
+    assert max(events_by_champion.values()) - min(events_by_champion.values()) > 60_000
+    print("✅ Event times follow the LCU timer")
+
+
+def test_repeated_timer_stamp_uses_local_clock():
+    """Updates that keep the previous timer stamp are timed from it on the local clock"""
+    monitor = create_monitor()
+
+    def session(stamp, time_left):
+        return {"timer": {"phase": "BAN_PICK", "adjustedTimeLeftInPhase": time_left,
+                          "totalTimeInPhase": 30_000, "internalNowInEpochMs": stamp}}
+
+    local_ms = iter([5_000, 7_500, 9_000, 9_250])
+    with mock.patch("lcu_monitor.time.monotonic_ns", side_effect=lambda: next(local_ms) * 1_000_000):
+        assert monitor._session_now_ms(session(1_700_000_000_000, 30_000)) == 1_700_000_000_000
+        # A hover 2.5 s later leaves the timer alone
+        assert monitor._session_now_ms(session(1_700_000_000_000, 30_000)) == 1_700_000_002_500
+        # A lock starts the next turn: a new stamp, used even though it arrives late
+        assert monitor._session_now_ms(session(1_700_000_003_600, 30_000)) == 1_700_000_003_600
+        assert monitor._session_now_ms({"timer": {}}) == 1_700_000_003_850
+    print("✅ Repeated timer stamps advance on the local clock")
+
+
+if __name__ == "__main__":
+    test_event_times_follow_lcu_clock()
+    test_repeated_timer_stamp_uses_local_clock()
+    print("🎉 All event timestamp tests passed!")
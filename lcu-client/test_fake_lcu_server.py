@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Full-stack tests: LCUMonitor with the real lcu_driver connector against the fake LCU server.
+"""
+
+import sys
+import ssl
+import base64
+import asyncio
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import aiohttp
+from simulation.lcu_server import FakeLCUServer
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, GAMEFLOW_URI
+from simulation.monitor import create_monitor
+from lcu_monitor import MonitorState
+
+
+async def _wait_until(condition, timeout: float = 10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+def test_rest_requires_client_credentials():
+    """REST answers with the pushed state, 404 for missing data and 401 without the lockfile password"""
+    async def scenario():
+        server = FakeLCUServer()
+        await server.start()
+        try:
+            lockfile = Path(server.lockfile_path).read_text(encoding="utf-8").split(":")
+            assert lockfile[1:] == [str(server.session.pid), str(server.port), server.password, "https"]
+
+            no_verify = ssl.create_default_context()
+            no_verify.check_hostname = False
+            no_verify.verify_mode = ssl.CERT_NONE
+            auth = {"Authorization": "Basic " + base64.b64encode(f"riot:{server.password}".encode()).decode()}
+            base = f"https://127.0.0.1:{server.port}"
+            async with aiohttp.ClientSession() as session:
+                async with session.get(base + GAMEFLOW_URI, ssl=no_verify) as response:
+                    assert response.status == 401
+                async with session.get(base + GAMEFLOW_URI, headers=auth, ssl=no_verify) as response:
+                    assert response.status == 200 and await response.json() == "None"
+                async with session.get(base + "/lol-champ-select/v1/session", headers=auth, ssl=no_verify) as response:
+                    assert response.status == 404
+        finally:
+            await server.stop()
+        assert not Path(server.lockfile_path).exists()
+
+    asyncio.run(scenario())
+    print("✅ Fake LCU REST serves state behind basic auth")
+
+
+def test_monitor_runs_draft_over_real_connector():
+    """The monitor finds the fake client by lockfile, tracks a draft and reconnects after a restart"""
+    async def scenario():
+        server = FakeLCUServer()
+        await server.start()
+        # Find the fake client by its lockfile, with a workspace configured regardless of local settings
+        with mock.patch("session_watcher.get_known_install_dirs", return_value=[server.install_dir]), \
+                mock.patch("config_manager.ConfigManager.get_workspace_id", return_value="simulated-workspace"), \
+                mock.patch("config_manager.ConfigManager.is_configured", return_value=True):
+            monitor = create_monitor()
+            try:
+                assert monitor.start()
+                await server.wait_for_subscriber()
+                await _wait_until(lambda: monitor.is_connected)
+
+                events = ChampSelectGenerator(seed=21).draft(DraftScenario(swaps=1))
+                await server.play(events, rate=2000)
+                await _wait_until(lambda: monitor.current_phase == "None" and monitor.state == MonitorState.IDLE)
+
+                drafts = monitor.data_transmitter.drafts
+                assert drafts and len(drafts[-1].blue_side.picks) == len(drafts[-1].red_side.picks) == 5
+                # Fetched by the connect bootstrap, then on entering champ select
+                assert server.requests["GET /lol-champ-select/v1/session"] == 2
+
+                # A client restart comes back on a new port and password
+                old_port = server.port
+                await server.restart()
+                assert server.port != old_port
+                await server.wait_for_subscriber()
+                assert server.connections == 2
+            finally:
+                await monitor.stop()
+                await server.stop()
+
+    asyncio.run(scenario())
+    print("✅ Monitor tracks a draft through lcu_driver and reconnects after a client restart")
+
+
+if __name__ == "__main__":
+    test_rest_requires_client_credentials()
+    test_monitor_runs_draft_over_real_connector()
+    print("🎉 All fake LCU server tests passed!")
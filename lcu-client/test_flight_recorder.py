@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the flight recorder ring buffer and its error-triggered dumps.
+"""
+
+import sys
+import gzip
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import flight_recorder
+from flight_recorder import FlightRecorder
+
+
+def _read_dump(path: Path) -> list:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_ring_keeps_most_recent_records():
+    """Old records are overwritten in place once the ring is full"""
+    recorder = FlightRecorder(capacity=100)
+    for i in range(250):
+        recorder.record("event", "UPDATE %s #%d", "/lol-champ-select/v1/session", i)
+
+    records = recorder.snapshot()
+    assert len(recorder) == 100 and len(records) == 100
+    assert records[0][3][1] == 150 and records[-1][3][1] == 249
+    assert len(recorder._kinds) == 100
+    print("✅ Ring keeps the most recent records")
+
+
+def test_window_excludes_old_records():
+    """Records older than the time window are left out of snapshots"""
+    recorder = FlightRecorder(capacity=10, window_seconds=60)
+    with mock.patch("flight_recorder.time.monotonic", return_value=1000.0):
+        recorder.record("state", "idle -> monitoring_champ_select")
+    with mock.patch("flight_recorder.time.monotonic", return_value=1100.0):
+        recorder.record("guard", "no workspace_id configured")
+        records = recorder.snapshot()
+    assert [kind for _, kind, _, _ in records] == ["guard"]
+    print("✅ Time window excludes old records")
+
+
+def test_dump_formats_lazily():
+    """Templates are only formatted when dumped"""
+    recorder = FlightRecorder(capacity=10)
+    recorder.record("change", "lobby %s: blue picks %s", "123", [266, 103])
+    recorder.record("broken", "%d picks", "not a number")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = _read_dump(recorder.dump(Path(tmp), reason="test"))
+
+    assert lines[0] == {"reason": "test", "records": 2}
+    assert lines[1]["kind"] == "change" and lines[1]["msg"] == "lobby 123: blue picks [266, 103]"
+    assert lines[2]["msg"].startswith("%d picks")
+    print("✅ Dump formats records lazily")
+
+
+def test_error_log_triggers_rate_limited_dump():
+    """Logging an error dumps the ring in the background, at most once per interval"""
+    recorder = FlightRecorder(capacity=100)
+    test_logger = logging.getLogger("test_flight_recorder.pipeline")
+    test_logger.propagate = False
+    recorder.dump_on_error(test_logger, min_interval=60)
+    recorder.dump_on_error(test_logger, min_interval=60)
+    assert len(test_logger.handlers) == 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with mock.patch("flight_recorder._output_dir", return_value=Path(tmp)):
+            recorder.record("queue", "lobby %s queued", "123")
+            test_logger.warning("not an error")
+            test_logger.error("[QUEUE_FAIL] Invalid lobby_id 'UNKNOWN'")
+            test_logger.error("second error within the interval")
+
+            deadline = time.monotonic() + 5
+            while not list(Path(tmp).glob("flight-*.jsonl.gz")) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            dumps = list(Path(tmp).glob("flight-*.jsonl.gz"))
+            assert len(dumps) == 1
+            lines = _read_dump(dumps[0])
+
+    assert lines[0]["reason"] == "error logged by test_flight_recorder.pipeline"
+    assert [line["kind"] for line in lines[1:]] == ["queue", "error"]
+    assert "Invalid lobby_id" in lines[-1]["msg"]
+    assert len(recorder) == 3  # The rate-limited error is still recorded
+    print("✅ Errors trigger a rate-limited background dump")
+
+
+def test_disabled_recorder_records_nothing():
+    """With flight_recorder.enabled off, recording is a no-op"""
+    settings = {"flight_recorder": {"enabled": False}}
+    with mock.patch("flight_recorder.get_config_manager") as get_config_manager:
+        get_config_manager.return_value.get_settings.return_value = settings
+        flight_recorder._flight_recorder = None
+        try:
+            recorder = flight_recorder.get_flight_recorder()
+            recorder.record("event", "UPDATE %s", "/lol-gameflow/v1/gameflow-phase")
+            assert len(recorder) == 0
+        finally:
+            flight_recorder._flight_recorder = None
+    print("✅ Disabled recorder records nothing")
+
+
+if __name__ == "__main__":
+    test_ring_keeps_most_recent_records()
+    test_window_excludes_old_records()
+    test_dump_formats_lazily()
+    test_error_log_triggers_rate_limited_dump()
+    test_disabled_recorder_records_nothing()
+    print("🎉 All flight recorder tests passed!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for lockfile-based LCU session detection.
+Uses lockfile fixtures so they run without a League client installed.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import psutil
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import lcu_process_scanner
+from lcu_process_scanner import LCUSession, parse_lockfile, read_lockfile, get_lockfile_sessions, merge_sessions
+
+FIXTURES = Path(__file__).parent / "fixtures" / "lockfiles"
+
+
+def test_parse_lockfile_fixtures():
+    """Lockfile format: name:pid:port:password:protocol"""
+    live = read_lockfile(str(FIXTURES / "live"))
+    assert live is not None
+    assert live.name == "LeagueClient"
+    assert live.pid == 18244
+    assert live.port == 53127
+    assert live.password == "vK3xQ9pZrT2mW8nB_fLc4A"
+    assert live.protocol == "https"
+
+    assert read_lockfile(str(FIXTURES / "pbe")).port == 61544
+    assert read_lockfile(str(FIXTURES / "malformed")) is None
+    assert read_lockfile(str(FIXTURES / "missing")) is None
+    assert parse_lockfile("") is None
+    print("✅ Lockfile parsing works")
+
+
+def test_stale_lockfiles_are_ignored():
+    """Fixture PIDs are not running here, so their lockfiles count as stale"""
+    sessions = get_lockfile_sessions([str(FIXTURES / name) for name in ("live", "pbe", "malformed")])
+    assert sessions == []
+    print("✅ Stale lockfiles are ignored")
+
+
+def test_live_lockfile_session():
+    """A lockfile whose PID and name match a running process yields a session"""
+    process_name = psutil.Process(os.getpid()).name()
+    with tempfile.TemporaryDirectory() as install_dir:
+        with open(os.path.join(install_dir, "lockfile"), "w", encoding="utf-8") as f:
+            f.write(f"{process_name}:{os.getpid()}:50000:secret:https")
+
+        sessions = get_lockfile_sessions([install_dir, install_dir])
+        assert len(sessions) == 1
+        session = sessions[0]
+        assert session.pid == os.getpid()
+        assert session.port == 50000
+        assert session.auth_token == "secret"
+        assert session.connection_string == f"{os.getpid()}:{os.getpid()}:50000:secret"
+
+        # The process scan still finds clients outside known directories; the lockfile wins per PID
+        elsewhere = LCUSession(port=61000, auth_token="pbe", install_dir=r"D:\Games\PBE", pid=os.getpid() + 1)
+        scanned = [LCUSession(port=50000, auth_token="from-cmdline", install_dir=install_dir, pid=os.getpid()),
+                   elsewhere]
+        assert merge_sessions(sessions, scanned) == [session, elsewhere]
+    print("✅ Live lockfile sessions are merged with the process scan")
+
+
+def test_install_dirs_remembered_in_state_file():
+    """Discovered install directories go to their own state file, not settings.json, and load on the next run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        state = Path(tmp) / "state" / "install_dirs.json"
+        with mock.patch.object(lcu_process_scanner, "_install_dirs_path", return_value=state), \
+                mock.patch.object(lcu_process_scanner, "_seen_install_dirs", set()), \
+                mock.patch.object(lcu_process_scanner, "_seen_loaded", False), \
+                mock.patch("config_manager.ConfigManager.set_settings") as set_settings:
+            lcu_process_scanner.remember_install_dir(r"D:\Games\League of Legends")
+            lcu_process_scanner.remember_install_dir(lcu_process_scanner.DEFAULT_INSTALL_DIRS[0])
+            assert json.loads(state.read_text(encoding="utf-8")) == [r"D:\Games\League of Legends"]
+            assert not list(state.parent.glob("*.tmp"))
+            assert not set_settings.called
+
+        # The next run starts with an empty set and reads the file
+        with mock.patch.object(lcu_process_scanner, "_install_dirs_path", return_value=state), \
+                mock.patch.object(lcu_process_scanner, "_seen_install_dirs", set()), \
+                mock.patch.object(lcu_process_scanner, "_seen_loaded", False):
+            assert lcu_process_scanner.get_known_install_dirs()[-1] == r"D:\Games\League of Legends"
+    print("✅ Discovered install directories persist in their own state file")
+
+
+if __name__ == "__main__":
+    test_parse_lockfile_fixtures()
+    test_stale_lockfiles_are_ignored()
+    test_live_lockfile_session()
+    test_install_dirs_remembered_in_state_file()
+    print("🎉 All process scanner tests passed!")
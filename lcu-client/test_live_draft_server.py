@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the LAN live draft server: snapshot on connect, SSE and WebSocket
+broadcasts in the to_dict() shape, and many viewers at once.
+"""
+
+import sys
+import json
+import time
+import asyncio
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import aiohttp
+from simulation.champ_select import ChampSelectGenerator, ChampionPoolMapper, DraftScenario
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from live_draft_server import LiveDraftServer
+from lcu_monitor import MonitorState
+from models import DraftData, TeamData, ChampionEvent
+
+
+def _draft(picks):
+    draft = DraftData(lobby_id="6100000001", workspace_id="ws", phase="BAN_PICK",
+                      champion_names={157: "Yasuo", 64: "LeeSin"})
+    draft.blue_side = TeamData(picks=picks, pick_events=[ChampionEvent(c, i + 1) for i, c in enumerate(picks)])
+    return draft
+
+
+async def _started_server(**options):
+    server = LiveDraftServer(host="127.0.0.1", port=0, **options)
+    await server.start()
+    return server, f"http://127.0.0.1:{server.port}"
+
+
+async def _next_sse(response):
+    """Payload of the next SSE draft event"""
+    while True:
+        line = await response.content.readline()
+        if line.startswith(b"data: "):
+            return json.loads(line[len(b"data: "):])
+
+
+def test_sse_snapshot_and_updates():
+    """A viewer gets the current draft on connect, then every change"""
+    async def scenario():
+        server, base = await _started_server()
+        try:
+            first = _draft([157])
+            server.publish(first)
+            async with aiohttp.ClientSession() as session:
+                async with session.get(base + "/draft") as response:
+                    assert response.headers["Access-Control-Allow-Origin"] == "*"
+                    assert await response.json() == first.to_dict()
+                async with session.get(base + "/events") as response:
+                    assert response.headers["Content-Type"] == "text/event-stream"
+                    assert await _next_sse(response) == first.to_dict()
+
+                    second = _draft([157, 64])
+                    start = time.perf_counter()
+                    server.publish(second)
+                    assert await _next_sse(response) == second.to_dict()
+                    latency = time.perf_counter() - start
+
+                    server.publish(None)
+                    assert await _next_sse(response) is None
+            return latency
+        finally:
+            await server.stop()
+
+    latency = asyncio.run(scenario())
+    assert latency < 0.05
+    print(f"✅ SSE viewer got the snapshot and an update in {latency * 1000:.1f} ms")
+
+
+def test_many_websocket_viewers():
+    """Every WebSocket viewer gets the snapshot and each change; extra viewers are turned away"""
+    viewers = 50
+
+    async def scenario():
+        server, base = await _started_server(max_viewers=viewers)
+        server.publish(_draft([157]))
+        try:
+            async with aiohttp.ClientSession() as session:
+                sockets = [await session.ws_connect(base + "/ws") for _ in range(viewers)]
+                snapshots = [json.loads(await ws.receive_str()) for ws in sockets]
+                assert all(s["blue_side"]["picks"] == ["Yasuo"] for s in snapshots)
+                assert server.viewer_count == viewers
+                async with session.get(base + "/events") as response:
+                    assert response.status == 503
+
+                start = time.perf_counter()
+                server.publish(_draft([157, 64]))
+                updates = await asyncio.gather(*(ws.receive_str() for ws in sockets))
+                latency = time.perf_counter() - start
+                assert all(json.loads(u)["blue_side"]["picks"] == ["Yasuo", "LeeSin"] for u in updates)
+
+                await sockets[0].close()
+                await asyncio.sleep(0.05)
+                assert server.viewer_count == viewers - 1
+                # Stopping with viewers connected closes them instead of waiting on them
+                stop_start = time.perf_counter()
+                await server.stop()
+                assert time.perf_counter() - stop_start < 2
+            return latency
+        finally:
+            await server.stop()
+
+    latency = asyncio.run(scenario())
+    assert latency < 0.05
+    print(f"✅ {viewers} WebSocket viewers updated in {latency * 1000:.1f} ms")
+
+
+def test_monitor_broadcasts_draft():
+    """Wired to the monitor, viewers follow the draft as it is queued and see it end"""
+    events = ChampSelectGenerator(seed=14).draft(DraftScenario(hovers=(0, 0)))
+
+    async def scenario():
+        server, base = await _started_server()
+        lcu = SimulatedLCU()
+        monitor = create_monitor(lcu, champion_mapper=ChampionPoolMapper())
+        monitor.draft_changed.connect(server.publish)
+        received = []
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(base + "/ws") as ws:
+                    assert json.loads(await ws.receive_str()) is None
+
+                    async def watch():
+                        while True:
+                            received.append(json.loads(await ws.receive_str()))
+                            if received[-1] is None:
+                                return
+
+                    watcher = asyncio.ensure_future(watch())
+                    for event in events:
+                        await lcu.dispatch(event)
+                        await asyncio.sleep(0)  # Give the viewer a turn, like real event pacing
+                    await asyncio.wait_for(watcher, timeout=5)
+        finally:
+            await server.stop()
+        return monitor, received
+
+    monitor, received = asyncio.run(scenario())
+    drafts = monitor.data_transmitter.drafts
+    assert monitor.state == MonitorState.IDLE
+    assert received[-1] is None
+    assert received[-2] == json.loads(json.dumps(drafts[-1].to_dict()))
+    assert len(received) - 1 <= len(drafts)
+    print(f"✅ Monitor broadcast {len(received) - 1} of {len(drafts)} draft changes live")
+
+
+if __name__ == "__main__":
+    test_sse_snapshot_and_updates()
+    test_many_websocket_viewers()
+    test_monitor_broadcasts_draft()
+    print("🎉 All live draft server tests passed!")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the queue-based logging pipeline and rotating file output.
+"""
+
+import sys
+import gzip
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from log_pipeline import JsonLinesFormatter, create_file_handler, start_log_pipeline, stop_log_pipeline
+
+
+def test_pipeline_writes_rotated_compressed_json_lines():
+    """Records flow through the listener into a size-rotated, gzip-compressed JSON-lines file"""
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = {"log_file": "logs/client.log", "max_bytes": 2000, "backup_count": 2}
+        file_handler = create_file_handler(settings, Path(tmp))
+        file_handler.setFormatter(JsonLinesFormatter())
+
+        listener = start_log_pipeline(logging.DEBUG, [file_handler])
+        try:
+            log = logging.getLogger("test_log_pipeline")
+            for i in range(100):
+                log.debug("event %d", i)
+        finally:
+            stop_log_pipeline(listener)
+            root.handlers, root.level = saved_handlers, saved_level
+
+        log_dir = Path(tmp) / "logs"
+        current = (log_dir / "client.log").read_text(encoding="utf-8").splitlines()
+        entry = json.loads(current[-1])
+        assert entry["msg"] == "event 99"
+        assert entry["level"] == "DEBUG"
+        assert entry["logger"] == "test_log_pipeline"
+
+        rotated = sorted(p.name for p in log_dir.glob("client.log.*"))
+        assert rotated == ["client.log.1.gz", "client.log.2.gz"]
+        with gzip.open(log_dir / "client.log.1.gz", "rt", encoding="utf-8") as f:
+            assert all(json.loads(line)["msg"].startswith("event ") for line in f)
+    print("✅ Logging pipeline writes rotated, compressed JSON lines")
+
+
+if __name__ == "__main__":
+    test_pipeline_writes_rotated_compressed_json_lines()
+    print("🎉 All logging pipeline tests passed!")
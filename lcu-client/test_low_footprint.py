@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-game low-footprint mode.
+"""
+
+import gc
+import sys
+import asyncio
+from collections import namedtuple
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import psutil
+import low_footprint
+from low_footprint import LowFootprintMode
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, GAMEFLOW_URI
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from lcu_monitor import MonitorState
+
+pionice = namedtuple("pionice", "ioclass value")  # Same fields as psutil's
+
+
+class _FakeProcess:
+    """
+    Records priority changes instead of applying them to the test process.
+    Like an unprivileged process on Linux/macOS, it may raise its nice value but not lower it.
+    """
+    nice_value = 0
+    ionice_value = pionice(0, 0)
+    calls = []
+
+    def nice(self, value=None):
+        if value is None:
+            return _FakeProcess.nice_value
+        _FakeProcess.calls.append(("nice", value))
+        if not low_footprint.WINDOWS and value < _FakeProcess.nice_value:
+            raise psutil.AccessDenied(pid=0, msg="lowering the nice value needs CAP_SYS_NICE")
+        _FakeProcess.nice_value = value
+
+    def ionice(self, ioclass=None, value=None):
+        if ioclass is None:
+            return _FakeProcess.ionice_value
+        _FakeProcess.calls.append(("ionice", ioclass, value))
+        _FakeProcess.ionice_value = pionice(ioclass, value or 0)
+
+
+def _reset_fake_process():
+    _FakeProcess.nice_value = 0
+    _FakeProcess.ionice_value = pionice(0, 0)
+    _FakeProcess.calls = []
+
+
+def test_enter_and_exit():
+    """Entering lowers priority, runs pause hooks and freezes the heap; exiting undoes all of it"""
+    _reset_fake_process()
+    hooks = []
+    mode = LowFootprintMode()
+    mode.register("worker", lambda: hooks.append("pause"), lambda: hooks.append("resume"))
+    changes = []
+    mode.changed.connect(changes.append)
+
+    with patch.object(low_footprint.psutil, "Process", _FakeProcess):
+        mode.enter()
+        assert mode.active
+        assert gc.get_freeze_count() > 0
+        if low_footprint.WINDOWS:
+            assert _FakeProcess.nice_value == psutil.BELOW_NORMAL_PRIORITY_CLASS
+        if hasattr(psutil.Process, "ionice"):
+            assert _FakeProcess.ionice_value.ioclass == psutil.IOPRIO_CLASS_IDLE
+
+        mode.enter()  # Already active: nothing happens twice
+        assert hooks == ["pause"]
+
+        mode.exit()
+        assert not mode.active
+        assert gc.get_freeze_count() == 0
+        assert _FakeProcess.nice_value == 0
+        assert _FakeProcess.ionice_value.ioclass == 0
+
+    assert hooks == ["pause", "resume"]
+    assert changes == [True, False]
+    print("✅ Low-footprint mode lowers and restores priority, GC and paused work")
+
+
+def test_cpu_priority_kept_on_posix():
+    """Without privileges a renice can't be undone, so Linux/macOS games leave the CPU priority alone"""
+    _reset_fake_process()
+    mode = LowFootprintMode()
+    with patch.object(low_footprint, "WINDOWS", False), \
+            patch.object(low_footprint.psutil, "Process", _FakeProcess), \
+            patch.object(low_footprint.logger, "warning") as warning:
+        for _ in range(2):  # Two games in a row
+            mode.enter()
+            mode.exit()
+        assert not [call for call in _FakeProcess.calls if call[0] == "nice"]
+        assert _FakeProcess.nice_value == 0
+        if hasattr(psutil.Process, "ionice"):
+            assert [call[1] for call in _FakeProcess.calls if call[0] == "ionice"] == [
+                psutil.IOPRIO_CLASS_IDLE, 0, psutil.IOPRIO_CLASS_IDLE, 0]
+        assert not warning.called
+
+        # The fake refuses a priority increase, as the OS would
+        _FakeProcess.nice_value = 10
+        try:
+            _FakeProcess().nice(0)
+        except psutil.AccessDenied:
+            pass
+        else:
+            raise AssertionError("lowering the nice value should be denied")
+    print("✅ CPU priority is never lowered where it can't be restored")
+
+
+def test_disabled():
+    """With the mode disabled nothing changes when a game starts"""
+    _reset_fake_process()
+    mode = LowFootprintMode.from_settings({"enabled": False})
+    with patch.object(low_footprint.psutil, "Process", _FakeProcess):
+        mode.enter()
+    assert not mode.active
+    assert not _FakeProcess.calls
+    assert gc.get_freeze_count() == 0
+    print("✅ Disabled low-footprint mode is a no-op")
+
+
+def test_monitor_enters_for_the_game():
+    """The monitor enters on GAME_STARTED and leaves when gameflow moves past InProgress"""
+    _reset_fake_process()
+    events = ChampSelectGenerator(seed=3).draft(DraftScenario(hovers=(0, 0)))
+    in_progress = next(i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "InProgress")
+
+    async def run():
+        lcu = SimulatedLCU()
+        monitor = create_monitor(lcu)
+        monitor.loop_watchdog.start()
+
+        await lcu.play(events[:in_progress + 1])
+        assert monitor.state == MonitorState.GAME_STARTED
+        assert monitor.low_footprint.active
+        assert not monitor.loop_watchdog.is_running
+        assert not monitor._action_events and monitor._last_raw_draft_data is None
+        assert gc.get_freeze_count() > 0
+
+        await lcu.play(events[in_progress + 1:in_progress + 2])  # WaitingForStats
+        assert not monitor.low_footprint.active
+        assert monitor.loop_watchdog.is_running
+        assert not monitor.session_watcher.is_running  # Was not running before the game
+        monitor.loop_watchdog.stop()
+
+    with patch.object(low_footprint.psutil, "Process", _FakeProcess):
+        asyncio.run(run())
+    assert gc.get_freeze_count() == 0
+    assert _FakeProcess.nice_value == 0
+    print("✅ Monitor uses the low footprint for exactly the duration of the game")
+
+
+def test_disconnect_restores():
+    """Losing the client mid-game restores the normal footprint"""
+    _reset_fake_process()
+    events = ChampSelectGenerator(seed=5).draft(DraftScenario(hovers=(0, 0)))
+    game_start = next(i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "GameStart")
+
+    async def run():
+        lcu = SimulatedLCU()
+        monitor = create_monitor(lcu, workspace_id=None)
+        await lcu.play(events[:game_start + 1])
+        assert monitor.low_footprint.active
+        await lcu.disconnect()
+        assert not monitor.low_footprint.active
+
+    with patch.object(low_footprint.psutil, "Process", _FakeProcess):
+        asyncio.run(run())
+    assert gc.get_freeze_count() == 0
+    print("✅ Disconnecting mid-game leaves low-footprint mode")
+
+
+if __name__ == "__main__":
+    test_enter_and_exit()
+    test_cpu_priority_kept_on_posix()
+    test_disabled()
+    test_monitor_enters_for_the_game()
+    test_disconnect_restores()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Memory checks: generated champ selects through the monitor, transmitter and Qt log viewer.
+The quick checks run with the suite; the soak takes most of a minute and only
+runs with LCU_SOAK=1 (bench_memory_soak.py runs the full-length one).
+"""
+
+import os
+import sys
+import asyncio
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import pytest
+import bench_memory_soak
+from simulation.champ_select import ChampSelectGenerator, DraftScenario
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+
+SOAK = os.environ.get("LCU_SOAK") == "1"
+
+
+def test_per_draft_state_is_released():
+    """A few games, reconnects included, leave no per-draft state behind and nothing growing"""
+    result = asyncio.run(bench_memory_soak.run_soak(
+        games=10, warmup=2, sample_every=1, reconnect_every=2, seed=4,
+        gui_log=True, log_max_lines=50, recorder_capacity=50))
+
+    assert len(result.samples) >= 4
+    last = result.samples[-1].sizes
+    assert not any(last[name] for name in bench_memory_soak.PER_DRAFT_STRUCTURES), last
+    assert not result.growing_structures(), result.growing_structures()
+    assert all(sample.sizes["log_lines"] <= 50 for sample in result.samples)
+    print(f"✅ No per-draft state left and nothing growing after {result.samples[-1].games} games")
+
+
+def test_reconnects_leave_no_tasks():
+    """A client lost right after a game ends (a state change in the same tick) leaves no tasks behind"""
+    events = ChampSelectGenerator(seed=6).draft(DraftScenario(hovers=(0, 0)))
+
+    async def run():
+        lcu = SimulatedLCU()
+        create_monitor(lcu)
+        counts = []
+        for _ in range(5):
+            await lcu.connect()
+            await asyncio.sleep(0.01)  # Background work settles into waiting
+            await lcu.play(events)
+            await lcu.disconnect()
+            await asyncio.sleep(0.01)
+            counts.append(len(asyncio.all_tasks()))
+        return counts
+
+    counts = asyncio.run(run())
+    assert counts == [counts[0]] * len(counts), counts
+    print(f"✅ {len(counts)} reconnects after a game kept {counts[0]} asyncio task(s)")
+
+
+@pytest.mark.skipif(not SOAK, reason="set LCU_SOAK=1 to run the memory soak")
+def test_soak_memory_is_bounded():
+    """Per-draft structures empty out between games and memory stops growing once buffers are full"""
+    result = asyncio.run(bench_memory_soak.run_soak(
+        games=160, warmup=30, sample_every=20, reconnect_every=15, seed=4,
+        gui_log=True, log_max_lines=200, recorder_capacity=500))
+
+    assert len(result.samples) >= 5
+    assert not result.growing_structures(), result.growing_structures()
+    assert all(sample.sizes["log_lines"] <= 200 for sample in result.samples)
+    growth = result.growth_per_game("traced_bytes")
+    assert growth < 1024, f"{growth:.0f} B per lobby: {result.top_growth}"
+    print(f"✅ Memory is bounded over {result.samples[-1].games} games ({growth:.0f} B traced per lobby)")
+
+
+if __name__ == "__main__":
+    test_per_draft_state_is_released()
+    test_reconnects_leave_no_tasks()
+    if SOAK:
+        test_soak_memory_is_bounded()
+    print("🎉 All memory soak tests passed!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the metrics registry and the /metrics endpoint.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import aiohttp
+from metrics import MetricsRegistry, NULL_METRIC
+from metrics_server import MetricsServer
+
+
+def test_disabled_registry_hands_out_no_ops():
+    """A disabled registry records nothing"""
+    registry = MetricsRegistry(enabled=False)
+    counter = registry.counter("lcu_client_test_total", "test")
+    assert counter is NULL_METRIC
+    counter.inc()
+    registry.histogram("lcu_client_test_seconds", "test").observe(0.1)
+    assert registry.snapshot() == {}
+    print("✅ Disabled metrics are no-ops")
+
+
+def test_counters_and_histograms():
+    """Counters and histograms aggregate per label and render as Prometheus text"""
+    registry = MetricsRegistry(enabled=True)
+    events = registry.counter("lcu_client_events_total", "events", "uri")
+    latency = registry.histogram("lcu_client_handler_seconds", "latency", buckets=(0.01, 0.1))
+    registry.gauge("lcu_client_queue_depth", "depth", read=lambda: 3)
+
+    events.inc(label="/lol-champ-select/v1/session")
+    events.inc(2, label="/lol-champ-select/v1/session")
+    events.inc(label="/lol-gameflow/v1/gameflow-phase")
+    for value in (0.005, 0.05, 0.5):
+        latency.observe(value)
+
+    # Asking again for the same name returns the existing instrument
+    assert registry.counter("lcu_client_events_total", "events", "uri") is events
+
+    snapshot = registry.snapshot()
+    assert snapshot["lcu_client_events_total"] == {
+        "/lol-champ-select/v1/session": 3, "/lol-gameflow/v1/gameflow-phase": 1
+    }
+    assert snapshot["lcu_client_handler_seconds"]["count"] == 3
+    assert snapshot["lcu_client_handler_seconds"]["p50_ms"] == 50.0
+    assert snapshot["lcu_client_queue_depth"] == 3
+    assert set(registry.snapshot("lcu_client_events")) == {"lcu_client_events_total"}
+
+    text = registry.render_prometheus()
+    assert "# TYPE lcu_client_events_total counter" in text
+    assert 'lcu_client_events_total{uri="/lol-champ-select/v1/session"} 3' in text
+    assert 'lcu_client_handler_seconds_bucket{le="0.01"} 1' in text
+    assert 'lcu_client_handler_seconds_bucket{le="0.1"} 2' in text
+    assert 'lcu_client_handler_seconds_bucket{le="+Inf"} 3' in text
+    assert "lcu_client_handler_seconds_count 3" in text
+    assert "lcu_client_queue_depth 3" in text
+    print("✅ Counters, histograms and gauges aggregate and render")
+
+
+def test_metrics_endpoint():
+    """GET /metrics serves the registry; other paths are 404"""
+    registry = MetricsRegistry(enabled=True)
+    registry.counter("lcu_client_drafts_queued_total", "queued").inc(5)
+
+    async def scenario():
+        server = MetricsServer(registry, host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"http://127.0.0.1:{server.port}/metrics") as response:
+                    metrics = response.status, response.headers["Content-Type"], await response.text()
+                async with session.get(f"http://127.0.0.1:{server.port}/") as response:
+                    other = response.status
+            return metrics, other
+        finally:
+            await server.stop()
+
+    (status, content_type, body), other_status = asyncio.run(scenario())
+    assert status == 200
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "lcu_client_drafts_queued_total 5" in body
+    assert other_status == 404
+    print("✅ /metrics endpoint serves Prometheus text")
+
+
+if __name__ == "__main__":
+    test_disabled_registry_hands_out_no_ops()
+    test_counters_and_histograms()
+    test_metrics_endpoint()
+    print("🎉 All metrics tests passed!")
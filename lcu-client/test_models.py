@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact draft data models.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models import DraftData, TeamData, ChampionEvent, NO_CHAMPION, epoch_ms
+
+CHAMPION_NAMES = {157: "Yasuo", 64: "LeeSin", 222: "Jinx"}
+
+
+def _make_draft() -> DraftData:
+    now = epoch_ms()
+    draft = DraftData(lobby_id="123", workspace_id="ws", phase="BAN_PICK", champion_names=CHAMPION_NAMES)
+    draft.blue_side = TeamData(
+        picks=[157, 999],
+        bans=[64, NO_CHAMPION, 999],
+        pick_events=[ChampionEvent(157, 1, now), ChampionEvent(999, 2, now)],
+        ban_events=[ChampionEvent(64, 1, now), ChampionEvent(NO_CHAMPION, 2, now)],
+    )
+    draft.red_side = TeamData(picks=[222], pick_events=[ChampionEvent(222, 1, now)])
+    return draft
+
+
+def test_events_are_immutable_and_slotted():
+    """Events are frozen and carry no per-instance __dict__"""
+    event = ChampionEvent(champion_id=157, order=1)
+    assert not hasattr(event, "__dict__")
+    try:
+        event.champion_id = 64
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("ChampionEvent should be frozen")
+    print("✅ ChampionEvent is frozen and slotted")
+
+
+def test_to_dict_resolves_names():
+    """Names and ISO timestamps are only produced when serializing"""
+    draft = _make_draft()
+    payload = draft.to_dict()
+
+    assert payload["blue_side"]["picks"] == ["Yasuo"]
+    assert payload["blue_side"]["bans"] == ["LeeSin", "None"]
+    assert payload["red_side"]["picks"] == ["Jinx"]
+    assert [e["championId"] for e in payload["blue_side"]["pick_events"]] == ["Yasuo", "999"]
+    assert [e["championId"] for e in payload["blue_side"]["ban_events"]] == ["LeeSin", "None"]
+    assert "T" in payload["blue_side"]["pick_events"][0]["timestamp"]
+
+    # The draft itself still holds IDs
+    assert draft.blue_side.picks == [157, 999]
+    print("✅ to_dict resolves champion names without mutating the draft")
+
+
+def test_hash_ignores_name_mapping():
+    """Change detection works on IDs regardless of the name mapping"""
+    draft = _make_draft()
+    other = _make_draft()
+    other.champion_names = {}
+    assert draft.calculate_hash() == other.calculate_hash()
+    assert not draft.has_changes(other)
+
+    other.red_side.bans.append(64)
+    assert draft.has_changes(other)
+    print("✅ Draft hashing uses champion IDs")
+
+
+def test_json_bytes_matches_to_dict():
+    """Precomputed wire encoding produces the same payload as to_dict()"""
+    draft = _make_draft()
+    draft.update_hash()
+    metadata = {"_client_version": "1.0.0"}
+
+    expected = draft.to_dict()
+    expected.update(metadata)
+    assert json.loads(draft.to_json_bytes(metadata)) == expected
+
+    # Event fragments are cached and refreshed if the name mapping changes
+    event = draft.blue_side.pick_events[0]
+    assert event.to_json_bytes(CHAMPION_NAMES) is event.to_json_bytes(CHAMPION_NAMES)
+    assert json.loads(event.to_json_bytes({157: "Yone"}))["championId"] == "Yone"
+    print("✅ to_json_bytes matches to_dict")
+
+
+if __name__ == "__main__":
+    test_events_are_immutable_and_slotted()
+    test_to_dict_resolves_names()
+    test_hash_ignores_name_mapping()
+    test_json_bytes_matches_to_dict()
+    print("🎉 All model tests passed!")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for running the LCU pipeline on a worker event loop with Qt signal bridging.
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PySide6.QtCore import QCoreApplication, QTimer
+from utils.callbacks import CallbackSignal
+from utils.loop_thread import EventLoopThread
+from gui.signal_bridge import MonitorSignalBridge
+from low_footprint import LowFootprintMode
+
+
+class _FakeMonitor:
+    def __init__(self):
+        self.status_changed = CallbackSignal()
+        self.workspace_updated = CallbackSignal()
+        self.low_footprint = LowFootprintMode()
+
+
+class _FakeWatcher:
+    def __init__(self):
+        self.session_added = CallbackSignal()
+        self.session_removed = CallbackSignal()
+        self.session_changed = CallbackSignal()
+
+
+def test_loop_thread_runs_work_off_caller_thread():
+    """call()/submit() run on the worker loop and stop() awaits the shutdown coroutine"""
+    worker = EventLoopThread("test-loop")
+    worker.start()
+    try:
+        async def whoami():
+            return threading.current_thread().name
+
+        assert worker.submit(whoami()).result(2) == "test-loop"
+
+        called = threading.Event()
+        worker.call(called.set)
+        assert called.wait(2)
+
+        shutdown_ran = []
+
+        async def shutdown():
+            await asyncio.sleep(0)
+            shutdown_ran.append(threading.current_thread().name)
+    finally:
+        worker.stop(shutdown)
+
+    assert shutdown_ran == ["test-loop"]
+    assert not worker.is_running
+    print("✅ Event loop thread runs and stops cleanly")
+
+
+def test_bridge_delivers_on_gui_thread():
+    """Signals emitted from the worker reach GUI slots on the GUI thread"""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    monitor, watcher = _FakeMonitor(), _FakeWatcher()
+    bridge = MonitorSignalBridge(monitor, watcher)
+
+    received = []
+    bridge.status_changed.connect(lambda system, status: received.append((system, status, threading.current_thread())))
+    bridge.session_added.connect(lambda session: received.append((session, threading.current_thread())))
+
+    worker = EventLoopThread("test-bridge")
+    worker.start()
+    try:
+        worker.call(monitor.status_changed.emit, "LCU", "Connected")
+        worker.call(watcher.session_added.emit, "session")
+        QTimer.singleShot(200, app.quit)
+        app.exec()
+    finally:
+        worker.stop()
+
+    main_thread = threading.main_thread()
+    assert received == [("LCU", "Connected", main_thread), ("session", main_thread)]
+    print("✅ Worker signals are delivered on the GUI thread")
+
+
+if __name__ == "__main__":
+    test_loop_thread_runs_work_off_caller_thread()
+    test_bridge_delivers_on_gui_thread()
+    print("🎉 All monitor thread tests passed!")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the built-in sampling profiler and allocation tracker.
+"""
+
+import sys
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from profiler import SamplingProfiler, AllocationTracker, register_loop
+
+
+def _busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampling_profiler_attributes_stacks_to_tasks():
+    """Samples taken while a task runs are labelled with the task name"""
+    profiler = SamplingProfiler(interval=0.002)
+
+    async def draft_processing():
+        _busy_wait(0.3)
+
+    async def scenario():
+        register_loop()
+        await asyncio.get_running_loop().create_task(draft_processing(), name="champ_select_update")
+
+    profiler.start()
+    try:
+        asyncio.run(scenario())
+    finally:
+        profiler.stop()
+
+    assert profiler.samples > 10
+    with tempfile.TemporaryDirectory() as tmp:
+        path = profiler.write(Path(tmp))
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+    assert path.name.startswith("profile-") and path.suffix == ".folded"
+    task_lines = [line for line in lines if "[task: champ_select_update]" in line and "_busy_wait" in line]
+    assert task_lines, "busy task was never sampled"
+    stack, count = task_lines[0].rsplit(" ", 1)
+    assert stack.startswith("MainThread;[task: champ_select_update];") and int(count) > 0
+    print(f"✅ Profiler took {profiler.samples} samples and attributed them to the running task")
+
+
+def test_allocation_tracker_reports_growth_per_transition():
+    """Allocations made between two transitions show up under that transition"""
+    tracker = AllocationTracker(frames=5)
+    tracker.start()
+    try:
+        retained = [bytearray(1024) for _ in range(2000)]  # ~2 MiB
+        tracker.snapshot("idle->monitoring_champ_select")
+        with tempfile.TemporaryDirectory() as tmp:
+            report = tracker.write(Path(tmp)).read_text(encoding="utf-8")
+    finally:
+        import tracemalloc
+        tracemalloc.stop()
+
+    assert "=== start -> idle->monitoring_champ_select" in report
+    assert "test_profiler.py" in report.split("\n", 2)[1]
+    assert len(retained) == 2000
+    print("✅ Allocation growth is reported per state transition")
+
+
+if __name__ == "__main__":
+    test_sampling_profiler_attributes_stacks_to_tasks()
+    test_allocation_tracker_reports_growth_per_transition()
+    print("🎉 All profiler tests passed!")
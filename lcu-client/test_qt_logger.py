@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched, bounded GUI log sink.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from gui.qt_logger import QtLogHandler
+
+
+def _logger(handler: QtLogHandler) -> logging.Logger:
+    log = logging.getLogger("test_qt_logger")
+    log.handlers = [handler]
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    return log
+
+
+def test_flush_emits_one_batch():
+    """Records are buffered and sent to the GUI as a single batch"""
+    handler = QtLogHandler(capacity=100)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    batches = []
+    handler.signals.log_message.connect(batches.append)
+
+    log = _logger(handler)
+    for i in range(3):
+        log.info(f"line {i}")
+    assert batches == []
+
+    handler.flush()
+    assert batches == ["line 0\nline 1\nline 2"]
+
+    handler.flush()
+    assert len(batches) == 1
+    print("✅ Log records are flushed in batches")
+
+
+def test_overflow_drops_oldest_and_reports():
+    """A full buffer drops the oldest records and reports how many were lost"""
+    handler = QtLogHandler(capacity=5, batch_size=3)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log = _logger(handler)
+    for i in range(8):
+        log.info(f"line {i}")
+
+    first = handler.drain()
+    assert first[0].startswith("[LOG] 3 message(s) dropped")
+    assert first[1:] == ["line 3", "line 4", "line 5"]
+    assert handler.drain() == ["line 6", "line 7"]
+    print("✅ Log buffer is bounded and aggregates drops")
+
+
+if __name__ == "__main__":
+    test_flush_emits_one_batch()
+    test_overflow_drops_oldest_and_reports()
+    print("🎉 All log sink tests passed!")
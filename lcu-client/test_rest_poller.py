@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Tests for the REST polling fallback: missed WebSocket frames are reconciled,
+unchanged polls are skipped by fingerprint, and the poll rate follows the
+monitor state and WebSocket health.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from simulation.champ_select import ChampSelectGenerator, DraftScenario, CHAMP_SELECT_URI, GAMEFLOW_URI
+from simulation.driver import SimulatedLCU
+from simulation.monitor import create_monitor
+from lcu_monitor import MonitorState
+from rest_poller import RestPoller
+
+
+def _monitor(**poller_settings):
+    monitor = create_monitor(workspace_id=None)
+    monitor.rest_poller = RestPoller(monitor, **poller_settings)
+    lcu = SimulatedLCU()
+    lcu.attach(monitor)
+    return monitor, lcu
+
+
+def _draft_events(seed: int):
+    """A generated draft with the indexes of its first champ select update and of GameStart"""
+    events = ChampSelectGenerator(seed=seed).draft(DraftScenario(hovers=(0, 0)))
+    game_start = next(i for i, e in enumerate(events) if e.uri == GAMEFLOW_URI and e.data == "GameStart")
+    first_update = next(i for i, e in enumerate(events) if e.uri == CHAMP_SELECT_URI)
+    return events, first_update, game_start
+
+
+async def _connect(monitor, lcu):
+    await lcu.connect()
+    monitor.workspace_id = "simulated-workspace"  # Not configured in tests
+    monitor.rest_poller._task.cancel()  # Polls are driven by hand
+
+
+def test_reconciles_missed_frames():
+    """Frames the WebSocket dropped are picked up by the next poll; unchanged polls do nothing"""
+    events, first_update, game_start = _draft_events(seed=2)
+
+    async def run():
+        monitor, lcu = _monitor()
+        await _connect(monitor, lcu)
+        poller = monitor.rest_poller
+        await lcu.play(events[:first_update + 3])
+        queued = len(monitor.data_transmitter.drafts)
+
+        # The socket drops the rest of the draft: the client state moves on, no handler runs
+        for event in events[first_update + 3:game_start]:
+            lcu.apply(event)
+
+        await poller.poll()
+        final = [e for e in events[:game_start] if e.uri == CHAMP_SELECT_URI][-1].data
+        last = monitor.data_transmitter.drafts[-1]
+        assert len(monitor.data_transmitter.drafts) == queued + 1
+        assert len(last.blue_side.picks) + len(last.red_side.picks) == sum(
+            1 for group in final["actions"] for a in group if a["type"] == "pick" and a["completed"])
+        assert poller.stats["missed"] == 1
+        assert poller.degraded and poller.interval() == poller.champ_select_interval
+
+        # Nothing changed since: both bodies match their fingerprints and nothing is decoded
+        unchanged = poller.stats["unchanged"]
+        await poller.poll()
+        assert poller.stats["unchanged"] == unchanged + 2
+        assert len(monitor.data_transmitter.drafts) == queued + 1
+        assert not poller.degraded and poller.interval() == poller.reconcile_interval
+
+        # A missed gameflow change moves the state machine
+        lcu.apply(events[game_start])
+        await poller.poll()
+        assert monitor.state == MonitorState.GAME_STARTED
+        assert poller.interval() == poller.active_game_interval
+
+    asyncio.run(run())
+    print("✅ Polling reconciles missed frames and skips unchanged responses")
+
+
+def test_websocket_update_during_poll_wins():
+    """A session fetched before a newer WebSocket update is dropped instead of rolling the draft back"""
+    events, first_update, game_start = _draft_events(seed=2)
+
+    class _SlowSession:
+        """Answers from the state at request time, but delivers champ select sessions late"""
+
+        def __init__(self, lcu):
+            self.lcu = lcu
+
+        async def request(self, method, endpoint, **kwargs):
+            response = await self.lcu.connection.request(method, endpoint, **kwargs)
+            if endpoint == CHAMP_SELECT_URI:
+                await asyncio.sleep(0.05)
+            return response
+
+    async def run():
+        monitor, lcu = _monitor()
+        await _connect(monitor, lcu)
+        poller = monitor.rest_poller
+        poller._connection = _SlowSession(lcu)
+        await lcu.play(events[:first_update + 3])
+
+        polling = asyncio.ensure_future(poller.poll())
+        await asyncio.sleep(0.01)  # The session GET is in flight
+        drafts = monitor.data_transmitter.drafts
+        queued = len(drafts)
+        rest = iter(events[first_update + 3:game_start])
+        while len(drafts) == queued:
+            await lcu.dispatch(next(rest))
+        newest = drafts[-1]
+        await polling
+
+        assert drafts[-1] is newest and len(drafts) == queued + 1
+        assert poller.stats["overtaken"] == 1 and poller.stats["missed"] == 0
+        assert not poller.degraded
+
+        # The next poll compares against the current session again
+        await poller.poll()
+        assert drafts[-1] is newest and poller.stats["missed"] == 0
+
+    asyncio.run(run())
+    print("✅ A poll overtaken by the WebSocket is dropped")
+
+
+def test_polls_in_background():
+    """Started on connect, the poller alone carries a draft when no WebSocket event arrives"""
+    events, first_update, game_start = _draft_events(seed=6)
+
+    async def run():
+        monitor, lcu = _monitor(champ_select_interval=0.01, lobby_interval=0.01, reconcile_interval=0.02)
+        await lcu.connect()
+        monitor.workspace_id = "simulated-workspace"
+        assert monitor.rest_poller.is_running
+
+        async def wait_for(condition):
+            for _ in range(200):
+                if condition():
+                    return
+                await asyncio.sleep(0.01)
+            raise AssertionError("poller did not catch up")
+
+        for event in events[:game_start]:
+            lcu.apply(event)
+        await wait_for(lambda: monitor.data_transmitter.drafts)
+        lcu.apply(events[game_start])
+        await wait_for(lambda: monitor.state == MonitorState.GAME_STARTED)
+
+        await lcu.disconnect()
+        assert not monitor.rest_poller.is_running
+        return monitor
+
+    monitor = asyncio.run(run())
+    assert monitor.data_transmitter.drafts
+    assert monitor.rest_poller.stats["missed"] >= 2
+    print("✅ Background polling follows a draft without the WebSocket")
+
+
+def test_websocket_down_polls_at_state_rate():
+    """A connection whose socket is gone keeps the poller at the per-state interval"""
+
+    class _NoSocket:
+        _ws = None
+
+        def __init__(self, lcu):
+            self.lcu = lcu
+
+        async def request(self, method, endpoint, **kwargs):
+            return await self.lcu.connection.request(method, endpoint, **kwargs)
+
+    async def run():
+        monitor, lcu = _monitor()
+        poller = monitor.rest_poller
+        poller._connection = _NoSocket(lcu)
+        await poller.poll()
+        assert poller.degraded
+        assert poller.interval() == poller.lobby_interval
+
+    asyncio.run(run())
+    print("✅ A closed WebSocket switches the poller to the full rate")
+
+
+def _live_poller_runs():
+    return [t for t in asyncio.all_tasks() if not t.done() and t.get_coro().__qualname__ == "RestPoller._run"]
+
+
+def test_reconnects_leave_one_poller_running():
+    """A state change right before a disconnect doesn't keep the old poller alive"""
+    async def run():
+        monitor, lcu = _monitor()
+        await lcu.connect()
+        for _ in range(5):
+            await asyncio.sleep(0.01)  # The run waits for its next poll
+            monitor.rest_poller.reschedule()  # Wakes it in the same tick it is cancelled
+            await lcu.disconnect()
+            await lcu.connect()
+        await asyncio.sleep(0.01)
+        runs = len(_live_poller_runs())
+        await lcu.disconnect()
+        await asyncio.sleep(0.01)
+        return runs, len(_live_poller_runs())
+
+    connected, disconnected = asyncio.run(run())
+    assert connected == 1
+    assert disconnected == 0
+    print("✅ Reconnects leave exactly one poller running")
+
+
+def test_disabled():
+    monitor, lcu = _monitor(enabled=False)
+
+    async def run():
+        await lcu.connect()
+        assert not monitor.rest_poller.is_running
+
+    asyncio.run(run())
+    print("✅ rest_polling: false leaves the WebSocket on its own")
+
+
+if __name__ == "__main__":
+    test_reconciles_missed_frames()
+    test_websocket_update_during_poll_wins()
+    test_polls_in_background()
+    test_websocket_down_polls_at_state_rate()
+    test_reconnects_leave_one_poller_running()
+    test_disabled()
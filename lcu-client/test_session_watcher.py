@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the LCU session watcher's diffing and signals.
+"""
+
+import os
+import sys
+import asyncio
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import session_watcher
+from lcu_process_scanner import LCUSession
+from session_watcher import LCUSessionWatcher
+
+
+def _session(pid: int, port: int = 50000) -> LCUSession:
+    return LCUSession(port=port, auth_token="token", install_dir=r"C:\Riot Games\League of Legends", pid=pid)
+
+
+def test_diff_emits_added_removed_changed():
+    """Each scan result is diffed against known sessions"""
+    watcher = LCUSessionWatcher()
+    events = []
+    watcher.session_added.connect(lambda s: events.append(("added", s.pid)))
+    watcher.session_removed.connect(lambda s: events.append(("removed", s.pid)))
+    watcher.session_changed.connect(lambda s: events.append(("changed", s.pid)))
+
+    watcher._apply([_session(1), _session(2)])
+    assert events == [("added", 1), ("added", 2)]
+
+    events.clear()
+    watcher._apply([_session(1), _session(2)])
+    assert events == []
+
+    watcher._apply([_session(1, port=50001), _session(3)])
+    assert events == [("removed", 2), ("changed", 1), ("added", 3)]
+    assert sorted(s.pid for s in watcher.get_sessions()) == [1, 3]
+    print("✅ Session diffing emits added/removed/changed")
+
+
+def test_watch_loop_polls_in_background():
+    """The watch loop publishes sessions found by the scan"""
+    async def run():
+        watcher = LCUSessionWatcher()
+        watcher._scan = lambda: [_session(7)]
+        found = asyncio.Event()
+        watcher.session_added.connect(lambda s: found.set())
+        watcher.start()
+        try:
+            await asyncio.wait_for(found.wait(), timeout=2)
+        finally:
+            watcher.stop()
+        return watcher.get_sessions()
+
+    sessions = asyncio.run(run())
+    assert [s.pid for s in sessions] == [7]
+    print("✅ Watch loop publishes scanned sessions")
+
+
+def test_process_scan_keeps_running_next_to_lockfiles():
+    """A live lockfile doesn't hide a second client that only the process scan sees"""
+    live = _session(os.getpid())
+    elsewhere = _session(os.getpid() + 100000, port=61000)
+    process_scans = []
+
+    def process_sessions():
+        process_scans.append(1)
+        return [elsewhere]
+
+    watcher = LCUSessionWatcher()
+    with mock.patch.object(session_watcher, "get_lockfile_sessions", return_value=[live]), \
+            mock.patch.object(session_watcher, "get_process_sessions", process_sessions):
+        assert watcher._scan() == [live, elsewhere]
+        # Within process_scan_interval only lockfiles are read; exited clients drop out
+        with mock.patch.object(session_watcher.psutil, "pid_exists", return_value=True):
+            assert watcher._scan() == [live, elsewhere]
+        with mock.patch.object(session_watcher.psutil, "pid_exists", return_value=False):
+            assert watcher._scan() == [live]
+        assert len(process_scans) == 1
+
+        watcher.refresh()
+        assert watcher._scan() == [live, elsewhere]
+        assert len(process_scans) == 2
+    print("✅ Process scans continue at their interval and merge with lockfile hits")
+
+
+if __name__ == "__main__":
+    test_diff_emits_added_removed_changed()
+    test_watch_loop_polls_in_background()
+    test_process_scan_keeps_running_next_to_lockfiles()
+    print("🎉 All session watcher tests passed!")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Startup budget tests.
+Each measurement runs in a fresh interpreter so module caches don't hide import cost.
+"""
+
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent / "src"
+
+# Generous enough for slow CI machines; a regression that pulls the HTTP/LCU
+# stack back into import time blows well past these
+IMPORT_BUDGET_SECONDS = {
+    "main": 0.75,
+    "lcu_monitor": 0.75,
+}
+FIRST_WINDOW_BUDGET_SECONDS = 3.0
+
+# Loaded on first use (HTTP request, monitor start, GUI) - never at import time
+DEFERRED_MODULES = ["requests", "urllib3", "lcu_driver", "aiohttp", "PySide6"]
+
+_IMPORT_PROBE = """
+import sys, time, json
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+_FIRST_WINDOW_PROBE = """
+import sys, time, json, asyncio
+start = time.perf_counter()
+sys.path.insert(0, {src!r})
+import qasync
+from gui.app import LCUClientApp
+
+app = LCUClientApp()
+loop = qasync.QEventLoop(app.app)
+asyncio.set_event_loop(loop)
+
+def first_window():
+    app.setup_ui()
+    print(json.dumps({{"elapsed": time.perf_counter() - start, "visible": app.main_window.isVisible()}}), flush=True)
+    loop.stop()
+
+loop.call_soon(first_window)
+loop.run_forever()
+"""
+
+
+def _run_probe(source: str) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", source],
+        cwd=str(SRC_DIR.parent), env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    # The probe's report is the last line; logging may print before it
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_budgets():
+    """Core modules import within budget and leave heavy dependencies unloaded"""
+    for module, budget in IMPORT_BUDGET_SECONDS.items():
+        report = _run_probe(_IMPORT_PROBE.format(src=str(SRC_DIR), module=module))
+        loaded = [name for name in DEFERRED_MODULES if name in report["modules"]]
+        assert not loaded, f"importing {module} loaded {loaded}"
+        assert report["elapsed"] < budget, f"importing {module} took {report['elapsed']:.3f}s (budget {budget}s)"
+        print(f"✅ import {module}: {report['elapsed'] * 1000:.0f} ms")
+
+
+def test_time_to_first_window():
+    """The main window is visible within budget of interpreter start"""
+    report = _run_probe(_FIRST_WINDOW_PROBE.format(src=str(SRC_DIR)))
+    assert report["visible"]
+    assert report["elapsed"] < FIRST_WINDOW_BUDGET_SECONDS, \
+        f"first window took {report['elapsed']:.3f}s (budget {FIRST_WINDOW_BUDGET_SECONDS}s)"
+    print(f"✅ time to first window: {report['elapsed'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    test_import_budgets()
+    test_time_to_first_window()
+    print("🎉 All startup tests passed!")
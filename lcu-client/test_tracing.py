@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for span tracing and Chrome trace export.
+"""
+
+import sys
+import json
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import tracing
+from tracing import Tracer, traced
+from models import DraftData
+from data_transmitter import DataTransmitter
+
+
+@traced("extract")
+def _extract(lobby_id: str) -> DraftData:
+    return DraftData(lobby_id=lobby_id, workspace_id="ws")
+
+
+def test_trace_follows_draft_across_queue():
+    """Spans from the handler and the transmission worker share one trace ID"""
+    tracer = Tracer(enabled=True, sample_rate=1.0)
+    tracing._tracer = tracer
+
+    async def scenario():
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def transmit_worker():
+            draft = await queue.get()
+            tracer.record_queue_wait(draft.trace)
+            with tracer.span("transmit_single_draft", trace=draft.trace):
+                with tracer.span("http_post"):
+                    await asyncio.sleep(0.01)
+            tracer.finish(draft.trace, outcome="sent")
+
+        worker = asyncio.ensure_future(transmit_worker())
+        with tracer.trace("champ_select_update", lobby="123"):
+            draft = _extract("123")
+            draft.trace = tracer.current()
+            await queue.put(draft)
+            tracer.mark_queued(draft.trace)
+        await worker
+
+    try:
+        asyncio.run(scenario())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tracer.export_chrome_trace(Path(tmp))
+            exported = json.loads(path.read_text(encoding="utf-8"))
+    finally:
+        tracing._tracer = None
+
+    events = [e for e in exported["traceEvents"] if e["ph"] != "M"]
+    assert {e["args"]["trace_id"] for e in events} == {events[0]["args"]["trace_id"]}
+    spans = {e["name"] for e in events if e["ph"] == "X"}
+    assert spans == {"champ_select_update", "extract", "queued", "transmit_single_draft", "http_post"}
+    assert [e["ph"] for e in events if e["cat"] == "draft"] == ["b", "e"]
+    assert events[-1]["args"]["outcome"] == "sent"
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in exported["traceEvents"])
+    print("✅ Trace ID follows the draft from handler to transmission")
+
+
+def test_unqueued_update_ends_its_trace():
+    """An update that never queues a draft still closes its trace"""
+    tracer = Tracer(enabled=True)
+    with tracer.trace("champ_select_update"):
+        with tracer.span("detect_draft_changes"):
+            pass
+    phases = [e["ph"] for e in tracer.get_events() if e.get("cat") == "draft"]
+    assert phases == ["b", "e"]
+    print("✅ Unqueued updates end their trace")
+
+
+def test_cleared_drafts_end_their_trace():
+    """Drafts dropped from the queue for a cancelled lobby close their traces as cancelled"""
+    tracer = Tracer(enabled=True)
+    transmitter = DataTransmitter()
+    transmitter.tracer = tracer
+
+    async def scenario():
+        transmitter.transmission_queue = asyncio.Queue()
+        for lobby_id in ("1", "2", "1"):
+            with tracer.trace("champ_select_update", lobby=lobby_id):
+                draft = DraftData(lobby_id=lobby_id, workspace_id="ws")
+                draft.trace = tracer.current()
+                await transmitter.transmission_queue.put(draft)
+                tracer.mark_queued(draft.trace)
+        return await transmitter.clear_pending_for_lobby("1")
+
+    assert asyncio.run(scenario()) == 2
+    ended = [e["args"].get("outcome") for e in tracer.get_events() if e.get("cat") == "draft" and e["ph"] == "e"]
+    assert ended == ["cancelled", "cancelled"]
+    assert transmitter.get_queue_size() == 1
+    print("✅ Cleared drafts end their trace as cancelled")
+
+
+def test_sampling_and_disabled():
+    """Unsampled or disabled traces record nothing"""
+    for tracer in (Tracer(enabled=True, sample_rate=0.0), Tracer(enabled=False)):
+        with tracer.trace("champ_select_update"):
+            assert tracer.current() is None
+            with tracer.span("extract"):
+                pass
+        assert [e for e in tracer.get_events() if e["ph"] != "M"] == []
+    print("✅ Sampling and disabled tracing record nothing")
+
+
+if __name__ == "__main__":
+    test_trace_follows_draft_across_queue()
+    test_unqueued_update_ends_its_trace()
+    test_cleared_drafts_end_their_trace()
+    test_sampling_and_disabled()
+    print("🎉 All tracing tests passed!")